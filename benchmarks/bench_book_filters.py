@@ -0,0 +1,135 @@
+"""Latency of filtered and sorted books list pages with and without the filter indexes.
+
+Seeds a scratch database with a large catalog, then times the first page of each filter
+scenario (and the facet counts) twice: with the composite indexes of the books table and
+after dropping the ones added for list filters and sort orders.
+
+Usage:
+    python -m benchmarks.bench_book_filters --database-url postgresql+asyncpg://.../bench
+
+The target database is written to (tables are created and truncated, indexes dropped and
+recreated), never point it at a database with data you care about.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.models import Book
+from src.infrastructure.repositories.books_repository import BookRepository
+from src.presentation.web.schemas.books import BookFilterModel
+
+SEED_SQL = """
+TRUNCATE book_tags, reviews, tags, books, users CASCADE;
+INSERT INTO books (uid, title, author, publisher, published_date, page_count, language,
+                   created_at, updated_at)
+SELECT gen_random_uuid(), 'Title ' || md5(g::text), 'Author ' || (g % 5000),
+       'Publisher ' || (g % 300), date '1950-01-01' + (g % 27000), 50 + g % 1200,
+       (ARRAY['en', 'en', 'en', 'fr', 'de', 'es', 'it', 'pt', 'ru', 'nl'])[1 + g % 10],
+       now() - g * interval '1 second', now()
+FROM generate_series(1, :books) AS g
+"""
+
+# indexes added for list filters and sort orders, the baseline keeps pk and (created_at, uid)
+FILTER_INDEXES = (
+    "ix_books_title_uid",
+    "ix_books_published_date_uid",
+    "ix_books_language_created_at_uid",
+    "ix_books_publisher_created_at_uid",
+    "ix_books_author_created_at_uid",
+)
+
+SCENARIOS = {
+    "language": BookFilterModel(language="nl"),
+    "publisher": BookFilterModel(publisher="Publisher 7"),
+    "author": BookFilterModel(author="Author 42"),
+    "date range": BookFilterModel(
+        published_from=date(1990, 1, 1), published_to=date(1990, 12, 31), sort="published_date"
+    ),
+    "title sort": BookFilterModel(sort="title", order="asc"),
+    "lang+pages": BookFilterModel(language="de", min_pages=1000, max_pages=1100),
+}
+
+
+async def time_call(call, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+async def run_scenarios(session_factory, args: argparse.Namespace) -> dict:
+    results = {}
+    async with session_factory() as session:
+        repository = BookRepository(session)
+        for name, filters in SCENARIOS.items():
+
+            async def first_page(filters=filters):
+                await repository.get_all_books(limit=args.page_size, filters=filters)
+
+            results[name] = await time_call(first_page, args.rounds)
+
+        async def facets():
+            await repository.get_book_facets(BookFilterModel(language="fr"))
+
+        results["facets"] = await time_call(facets, args.rounds)
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    filter_indexes = [index for index in Book.__table__.indexes if index.name in FILTER_INDEXES]
+
+    async def create_filter_indexes():
+        # create_all skips the indexes of a table that already exists
+        async with engine.begin() as connection:
+            for index in filter_indexes:
+                await connection.run_sync(index.create, checkfirst=True)
+        # steady state kept by autovacuum: statistics and a visibility map for index-only scans
+        async with engine.connect() as connection:
+            autocommit = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.execute(text("VACUUM ANALYZE books"))
+
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        for statement in filter(str.strip, SEED_SQL.split(";")):
+            await connection.execute(text(statement), {"books": args.books})
+
+    await create_filter_indexes()
+    indexed = await run_scenarios(session_factory, args)
+
+    async with engine.begin() as connection:
+        for index in filter_indexes:
+            await connection.run_sync(index.drop)
+    unindexed = await run_scenarios(session_factory, args)
+
+    await create_filter_indexes()
+
+    print(f"{args.books} books, first page of {args.page_size}, median of {args.rounds} runs")
+    print(f"{'scenario':<12} {'indexed':>10} {'no index':>10} {'speedup':>8}")
+    for name, elapsed in indexed.items():
+        baseline = unindexed[name]
+        print(f"{name:<12} {elapsed:>8.2f}ms {baseline:>8.2f}ms {baseline / elapsed:>7.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--books", type=int, default=500_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
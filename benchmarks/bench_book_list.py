@@ -0,0 +1,121 @@
+"""Rows/sec of the books list read path: ORM entities vs column projection.
+
+Seeds a scratch database with books that carry reviews and tags, then pages through
+the whole catalog with both statements and reports throughput.
+
+Usage:
+    python -m benchmarks.bench_book_list --database-url postgresql+asyncpg://.../bench
+
+The target database is written to (tables are created and truncated),
+never point it at a database with data you care about.
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text, tuple_
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, desc, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.models import Book
+from src.infrastructure.repositories.books_repository import BookRepository
+
+SEED_SQL = """
+TRUNCATE book_tags, reviews, tags, books, users CASCADE;
+INSERT INTO users (uid, username, email, role, is_verified, password_hash, created_at, updated_at)
+VALUES ('00000000-0000-0000-0000-000000000001', 'bench', 'bench@example.com', 'user', true, '',
+        now(), now());
+INSERT INTO books (uid, title, author, publisher, published_date, page_count, language,
+                   created_at, updated_at)
+SELECT gen_random_uuid(), 'Title ' || g, 'Author ' || (g % 1000), 'Publisher ' || (g % 100),
+       date '2000-01-01' + (g % 9000), 100 + g % 900, (ARRAY['en', 'fr', 'de'])[1 + g % 3],
+       now() - g * interval '1 second', now()
+FROM generate_series(1, :books) AS g;
+INSERT INTO reviews (uid, rating, review_text, user_uid, book_uid, created_at, updated_at)
+SELECT gen_random_uuid(), 1 + (r % 5), repeat('Lorem ipsum dolor sit amet. ', 10),
+       '00000000-0000-0000-0000-000000000001', b.uid, now(), now()
+FROM books AS b CROSS JOIN generate_series(1, :reviews) AS r;
+INSERT INTO tags (uid, name, created_at)
+SELECT gen_random_uuid(), 'tag ' || g, now() FROM generate_series(1, 50) AS g;
+INSERT INTO book_tags (book_uid, tag_uid)
+SELECT b.uid, t.uid FROM books AS b CROSS JOIN LATERAL (
+    SELECT uid FROM tags ORDER BY md5(b.uid::text || tags.uid::text) LIMIT :tags
+) AS t;
+ANALYZE;
+"""
+
+
+async def orm_page(session: AsyncSession, limit: int, after: tuple | None) -> list:
+    """The read path before the projection: entities plus selectin reviews and tags."""
+    statement = select(Book).order_by(desc(Book.created_at), desc(Book.uid)).limit(limit)
+    if after is not None:
+        statement = statement.where(tuple_(Book.created_at, Book.uid) < tuple_(*after))
+    result = await session.exec(statement)
+    books = result.all()
+    session.expunge_all()  # a request-scoped session never accumulates across pages either
+    return books
+
+
+async def measure(label: str, fetch_page, total: int) -> None:
+    started = time.perf_counter()
+    fetched = await fetch_page()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {fetched:>8} rows in {elapsed:7.3f}s  {fetched / elapsed:>10,.0f} rows/s")
+    assert fetched == total, f"{label} returned {fetched} rows, expected {total}"
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        for statement in filter(str.strip, SEED_SQL.split(";")):
+            await connection.execute(
+                text(statement),
+                {"books": args.books, "reviews": args.reviews_per_book, "tags": args.tags_per_book},
+            )
+
+    async def orm_path() -> int:
+        fetched, after = 0, None
+        async with session_factory() as session:
+            while True:
+                books = await orm_page(session, args.page_size, after)
+                fetched += len(books)
+                if len(books) < args.page_size:
+                    return fetched
+                after = (books[-1].created_at, books[-1].uid)
+
+    async def projection_path() -> int:
+        fetched, cursor = 0, None
+        async with session_factory() as session:
+            repository = BookRepository(session)
+            while True:
+                books, cursor = await repository.get_all_books(limit=args.page_size, cursor=cursor)
+                fetched += len(books)
+                if cursor is None:
+                    return fetched
+
+    print(
+        f"{args.books} books, {args.reviews_per_book} reviews and {args.tags_per_book} tags each, "
+        f"pages of {args.page_size}"
+    )
+    for _ in range(args.rounds):
+        await measure("orm", orm_path, args.books)
+        await measure("projection", projection_path, args.books)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--books", type=int, default=20_000)
+    parser.add_argument("--reviews-per-book", type=int, default=5)
+    parser.add_argument("--tags-per-book", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2)
+    asyncio.run(main(parser.parse_args()))
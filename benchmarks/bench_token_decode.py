@@ -0,0 +1,64 @@
+"""Per-request CPU of access token verification: full JWT decode vs verified-claims cache.
+
+Replays requests of a pool of users, each presenting its own token, through
+TokenService.decode_token. A request used to verify its token twice (role checker plus
+the route's own bearer), it now verifies it once per request through a shared bearer and
+once per token lifetime through the claims cache. Revocation checks are I/O, not part of
+this measurement.
+
+Usage:
+    python -m benchmarks.bench_token_decode --users 1000 --requests 200000
+"""
+
+import argparse
+import itertools
+import time
+import uuid
+
+from src.infrastructure.service.auth.claims_cache import VerifiedClaimsCache
+from src.infrastructure.service.auth.token_management import TokenService
+
+SECRET = "bench-secret-of-at-least-32-bytes"
+
+
+def measure(label: str, decode, tokens: list, requests: int, decodes_per_request: int) -> float:
+    pool = itertools.cycle(tokens)
+    started = time.perf_counter()
+    for token in itertools.islice(pool, requests):
+        for _ in range(decodes_per_request):
+            claims = decode(token)
+    elapsed = time.perf_counter() - started
+    assert claims.get("jti"), f"{label} returned no claims"
+    per_request = elapsed / requests * 1e6
+    print(f"{label:<34} {per_request:8.2f} us/request  {requests / elapsed:>12,.0f} requests/s")
+    return per_request
+
+
+def main(args: argparse.Namespace) -> None:
+    issuer = TokenService(secret=SECRET, algorithm="HS256")
+    tokens = [
+        issuer.create_access_token({"email": f"user{n}@example.com", "user_uid": str(uuid.uuid4())})
+        for n in range(args.users)
+    ]
+    uncached = TokenService(secret=SECRET, algorithm="HS256")
+    cached = TokenService(
+        secret=SECRET,
+        algorithm="HS256",
+        claims_cache=VerifiedClaimsCache(max_size=args.cache_size),
+    )
+
+    print(f"{args.users} users, {args.requests} requests, claims cache of {args.cache_size}")
+    for _ in range(args.rounds):
+        before = measure("before: 2 full decodes", uncached.decode_token, tokens, args.requests, 2)
+        measure("1 full decode", uncached.decode_token, tokens, args.requests, 1)
+        after = measure("after: 1 cached decode", cached.decode_token, tokens, args.requests, 1)
+        print(f"{'speedup':<34} {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--cache-size", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=2)
+    main(parser.parse_args())
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,6 +11,11 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str
     JTI_EXPIRY: int
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5
+    REDIS_SOCKET_TIMEOUT: float = 5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
     ENVIRONMENT: str
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
@@ -22,6 +28,35 @@ class Settings(BaseSettings):
     USE_CREDENTIALS: bool = True
     VALIDATE_CERTS: bool = False
     DOMAIN: str
+    BOOKS_PAGE_SIZE: int = 50
+    BOOKS_MAX_PAGE_SIZE: int = 100
+    BOOK_IMPORT_BATCH_SIZE: int = 1000
+    BOOK_IMPORT_MAX_ERRORS: int = 100
+    BOOK_EXPORT_BATCH_SIZE: int = 1000
+    BOOK_CACHE_TTL: int = 300
+    BOOK_FACET_LIMIT: int = 20
+    BOOKS_BATCH_GET_MAX: int = 100
+    REVIEWS_PAGE_SIZE: int = 100
+    REVIEWS_MAX_PAGE_SIZE: int = 100
+    BOOK_RANKINGS_REFRESH_INTERVAL: int = 600
+    BOOK_RANKINGS_SIZE: int = 1000
+    BOOK_RANKINGS_PRIOR_WEIGHT: int = 10
+    BOOK_RANKINGS_MIN_REVIEWS: int = 1
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CLAIMS_CACHE_SIZE: int = 10000
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    # per route and identity kind: "<requests>/<seconds>", JSON in the environment
+    RATE_LIMITS: Dict[str, Dict[str, str]] = {
+        "login": {"ip": "20/60", "email": "5/60"},
+        "signup": {"ip": "5/600", "email": "3/3600"},
+        "password_reset": {"ip": "5/600", "email": "3/3600"},
+    }
+    PASSWORD_RESET_EMAIL_WINDOW: int = 300
+    # reverse proxies in front of the app whose X-Forwarded-For entries are trusted; the rate
+    # limits are per client address, behind a proxy 0 would put every client in one bucket
+    TRUSTED_PROXY_HOPS: int = 0
     model_config = SettingsConfigDict(
         env_file=Path(__file__).resolve().parents[1] / ".env",
         extra="ignore",  # ignore extra .env variables from being read
@@ -1,14 +1,25 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from config.settings import Config
 from src.application.errors import register_all_errors
+from src.application.services.book_rankings import refresh_book_rankings_periodically
 from src.infrastructure.dependencies.database import init_db
+from src.infrastructure.dependencies.repositories import book_repository_scope
+from src.infrastructure.dependencies.services import (
+    blocklist_token_service,
+    book_cache_service,
+    password_service,
+)
 from src.infrastructure.middleware import register_middleware
+from src.infrastructure.redis_client import close_redis, init_redis
 from src.presentation.web.routes.auth import auth_router
 from src.presentation.web.routes.book_tags import tags_router
 from src.presentation.web.routes.books import app as books_router
 from src.presentation.web.routes.email import email_router
+from src.presentation.web.routes.metrics import metrics_router
 from src.presentation.web.routes.reviews import reviews_router
 from src.presentation.web.routes.users import app as users_router
 
@@ -26,7 +37,22 @@ async def lifespan(app: FastAPI):
     """
     print("Server is starting...")
     await init_db()
+    await init_redis()
+    blocklist_token_service.start_listener()
+    rankings_refresh = None
+    if Config.BOOK_RANKINGS_REFRESH_INTERVAL > 0:
+        rankings_refresh = asyncio.create_task(
+            refresh_book_rankings_periodically(book_repository_scope)
+        )
     yield
+    if rankings_refresh is not None:
+        rankings_refresh.cancel()
+        with suppress(asyncio.CancelledError):
+            await rankings_refresh
+    await book_cache_service.disconnect()
+    await blocklist_token_service.disconnect()
+    await close_redis()
+    password_service.shutdown()
     print("Server is stopping")
 
 
@@ -46,3 +72,4 @@ app.include_router(auth_router, prefix=f"/api/{version}/auth", tags=["auth"])
 app.include_router(reviews_router, prefix=f"/api/{version}/reviews", tags=["reviews"])
 app.include_router(tags_router, prefix=f"/api/{version}/tags", tags=["tags"])
 app.include_router(email_router, prefix=f"/api/{version}/email", tags=["email"])
+app.include_router(metrics_router, prefix=f"/api/{version}/metrics", tags=["metrics"])
@@ -0,0 +1,72 @@
+"""add books rating aggregates and backfill them from reviews
+
+Revision ID: 1986a58d8d3c
+Revises: 854621ef815a
+Create Date: 2026-10-18 12:48:30.617205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1986a58d8d3c'
+down_revision: Union[str, None] = '854621ef815a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = (
+    'review_count',
+    'rating_sum',
+    'rating_1_count',
+    'rating_2_count',
+    'rating_3_count',
+    'rating_4_count',
+    'rating_5_count',
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {column['name'] for column in inspector.get_columns('books')}
+
+    for name in COUNTERS:
+        if name not in existing:
+            op.add_column(
+                'books', sa.Column(name, sa.Integer(), nullable=False, server_default='0')
+            )
+
+    # recomputed from scratch, so the backfill is also safe on a database built by create_all
+    op.execute(
+        """
+        UPDATE books SET
+            review_count = stats.review_count,
+            rating_sum = stats.rating_sum,
+            rating_1_count = stats.rating_1_count,
+            rating_2_count = stats.rating_2_count,
+            rating_3_count = stats.rating_3_count,
+            rating_4_count = stats.rating_4_count,
+            rating_5_count = stats.rating_5_count
+        FROM (
+            SELECT book_uid,
+                   count(*) AS review_count,
+                   coalesce(sum(rating), 0) AS rating_sum,
+                   count(*) FILTER (WHERE rating = 1) AS rating_1_count,
+                   count(*) FILTER (WHERE rating = 2) AS rating_2_count,
+                   count(*) FILTER (WHERE rating = 3) AS rating_3_count,
+                   count(*) FILTER (WHERE rating = 4) AS rating_4_count,
+                   count(*) FILTER (WHERE rating = 5) AS rating_5_count
+            FROM reviews
+            WHERE book_uid IS NOT NULL
+            GROUP BY book_uid
+        ) AS stats
+        WHERE books.uid = stats.book_uid
+        """
+    )
+
+
+def downgrade() -> None:
+    for name in reversed(COUNTERS):
+        op.drop_column('books', name)
@@ -0,0 +1,40 @@
+"""add books composite indexes for list filters and sort orders
+
+Revision ID: 2ccac944e115
+Revises: 96e004d905ea
+Create Date: 2026-10-18 11:24:09.861452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ccac944e115'
+down_revision: Union[str, None] = '96e004d905ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'ix_books_title_uid': ['title', 'uid'],
+    'ix_books_published_date_uid': ['published_date', 'uid'],
+    'ix_books_language_created_at_uid': ['language', 'created_at', 'uid'],
+    'ix_books_publisher_created_at_uid': ['publisher', 'created_at', 'uid'],
+    'ix_books_author_created_at_uid': ['author', 'created_at', 'uid'],
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {index['name'] for index in inspector.get_indexes('books')}
+
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'books', columns)
+
+
+def downgrade() -> None:
+    for name in reversed(list(INDEXES)):
+        op.drop_index(name, table_name='books')
@@ -0,0 +1,41 @@
+"""add book_rankings leaderboard snapshot table
+
+Revision ID: 6dd9defd1cea
+Revises: a622a083f1ef
+Create Date: 2026-10-18 14:41:36.208519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6dd9defd1cea'
+down_revision: Union[str, None] = 'a622a083f1ef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # filled by the periodic rankings refresh of the application
+    if not inspector.has_table('book_rankings'):
+        op.create_table(
+            'book_rankings',
+            sa.Column('scope', postgresql.VARCHAR(), nullable=False),
+            sa.Column('rank', postgresql.INTEGER(), nullable=False),
+            sa.Column('book_uid', postgresql.UUID(), nullable=False),
+            sa.Column('score', postgresql.DOUBLE_PRECISION(), nullable=False),
+            sa.Column('review_count', postgresql.INTEGER(), nullable=False),
+            sa.Column('average_rating', postgresql.DOUBLE_PRECISION(), nullable=False),
+            sa.Column('computed_at', postgresql.TIMESTAMP(), nullable=False),
+            sa.PrimaryKeyConstraint('scope', 'rank'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('book_rankings')
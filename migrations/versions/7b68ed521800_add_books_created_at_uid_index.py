@@ -0,0 +1,31 @@
+"""add books (created_at, uid) index for keyset pagination
+
+Revision ID: 7b68ed521800
+Revises: e2c8bbdb2a89
+Create Date: 2026-10-18 09:12:41.318206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b68ed521800'
+down_revision: Union[str, None] = 'e2c8bbdb2a89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # rows without created_at would never be reached by a (created_at, uid) cursor
+    op.execute("UPDATE books SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL")
+
+    inspector = sa.inspect(op.get_bind())
+    if 'ix_books_created_at_uid' not in {index['name'] for index in inspector.get_indexes('books')}:
+        op.create_index('ix_books_created_at_uid', 'books', ['created_at', 'uid'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_created_at_uid', table_name='books')
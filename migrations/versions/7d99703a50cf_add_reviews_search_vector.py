@@ -0,0 +1,48 @@
+"""add reviews search_vector generated column and GIN index
+
+Revision ID: 7d99703a50cf
+Revises: 6dd9defd1cea
+Create Date: 2026-10-18 15:12:48.930217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d99703a50cf'
+down_revision: Union[str, None] = '6dd9defd1cea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# snapshot of the expression of src.domain.models.reviews at the time of the migration
+SEARCH_VECTOR = "to_tsvector('english'::regconfig, coalesce(review_text, ''))"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if 'search_vector' not in {column['name'] for column in inspector.get_columns('reviews')}:
+        op.add_column(
+            'reviews',
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(SEARCH_VECTOR, persisted=True),
+            ),
+        )
+
+    if 'ix_reviews_search_vector' not in {
+        index['name'] for index in inspector.get_indexes('reviews')
+    }:
+        op.create_index(
+            'ix_reviews_search_vector', 'reviews', ['search_vector'], postgresql_using='gin'
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_search_vector', table_name='reviews')
+    op.drop_column('reviews', 'search_vector')
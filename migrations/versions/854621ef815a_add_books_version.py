@@ -0,0 +1,33 @@
+"""add books version column for optimistic concurrency
+
+Revision ID: 854621ef815a
+Revises: 2ccac944e115
+Create Date: 2026-10-18 12:06:51.220874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '854621ef815a'
+down_revision: Union[str, None] = '2ccac944e115'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if 'version' not in {column['name'] for column in inspector.get_columns('books')}:
+        # a constant default fills existing rows without rewriting the table
+        op.add_column(
+            'books',
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('books', 'version')
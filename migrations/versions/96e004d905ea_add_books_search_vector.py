@@ -0,0 +1,62 @@
+"""add books search_vector generated column and GIN index
+
+Revision ID: 96e004d905ea
+Revises: 7b68ed521800
+Create Date: 2026-10-18 10:02:17.504930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96e004d905ea'
+down_revision: Union[str, None] = '7b68ed521800'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# snapshot of src.domain.models.books._search_vector_expression() at the time of the migration
+SEARCH_CONFIG = (
+    "CASE lower(language) "
+    "WHEN 'en' THEN 'english'::regconfig WHEN 'english' THEN 'english'::regconfig "
+    "WHEN 'fr' THEN 'french'::regconfig WHEN 'french' THEN 'french'::regconfig "
+    "WHEN 'de' THEN 'german'::regconfig WHEN 'german' THEN 'german'::regconfig "
+    "WHEN 'es' THEN 'spanish'::regconfig WHEN 'spanish' THEN 'spanish'::regconfig "
+    "WHEN 'it' THEN 'italian'::regconfig WHEN 'italian' THEN 'italian'::regconfig "
+    "WHEN 'pt' THEN 'portuguese'::regconfig WHEN 'portuguese' THEN 'portuguese'::regconfig "
+    "WHEN 'ru' THEN 'russian'::regconfig WHEN 'russian' THEN 'russian'::regconfig "
+    "WHEN 'nl' THEN 'dutch'::regconfig WHEN 'dutch' THEN 'dutch'::regconfig "
+    "ELSE 'simple'::regconfig END"
+)
+SEARCH_VECTOR = (
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(author, '')), 'B') || "
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(publisher, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if 'search_vector' not in {column['name'] for column in inspector.get_columns('books')}:
+        op.add_column(
+            'books',
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(SEARCH_VECTOR, persisted=True),
+            ),
+        )
+
+    if 'ix_books_search_vector' not in {index['name'] for index in inspector.get_indexes('books')}:
+        op.create_index(
+            'ix_books_search_vector', 'books', ['search_vector'], postgresql_using='gin'
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_search_vector', table_name='books')
+    op.drop_column('books', 'search_vector')
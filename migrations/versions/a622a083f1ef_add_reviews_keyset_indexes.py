@@ -0,0 +1,44 @@
+"""add reviews (book_uid|user_uid, created_at, uid) indexes for keyset pagination
+
+Revision ID: a622a083f1ef
+Revises: a6afe230e875
+Create Date: 2026-10-18 13:58:12.447301
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a622a083f1ef'
+down_revision: Union[str, None] = 'a6afe230e875'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEWEST_FIRST = [sa.text('created_at DESC'), sa.text('uid DESC')]
+INDEXES = {
+    'ix_reviews_book_uid_created_at_uid': ['book_uid', *NEWEST_FIRST],
+    'ix_reviews_user_uid_created_at_uid': ['user_uid', *NEWEST_FIRST],
+    'ix_reviews_created_at_uid': NEWEST_FIRST,
+}
+
+
+def upgrade() -> None:
+    # rows without created_at would never be reached by a (created_at, uid) cursor
+    op.execute(
+        "UPDATE reviews SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL"
+    )
+
+    inspector = sa.inspect(op.get_bind())
+    existing = {index['name'] for index in inspector.get_indexes('reviews')}
+
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'reviews', columns)
+
+
+def downgrade() -> None:
+    for name in reversed(list(INDEXES)):
+        op.drop_index(name, table_name='reviews')
@@ -0,0 +1,78 @@
+"""add unique (user_uid, book_uid) constraint on reviews
+
+Revision ID: a6afe230e875
+Revises: 1986a58d8d3c
+Create Date: 2026-10-18 13:21:44.093518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6afe230e875'
+down_revision: Union[str, None] = '1986a58d8d3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if 'uq_reviews_user_uid_book_uid' in {
+        constraint['name'] for constraint in inspector.get_unique_constraints('reviews')
+    }:
+        return
+
+    # duplicates slipped in through concurrent submits: keep each user's latest review of a book
+    op.execute(
+        """
+        DELETE FROM reviews
+        WHERE uid IN (
+            SELECT uid FROM (
+                SELECT uid, row_number() OVER (
+                    PARTITION BY user_uid, book_uid ORDER BY updated_at DESC, uid DESC
+                ) AS position
+                FROM reviews
+                WHERE user_uid IS NOT NULL AND book_uid IS NOT NULL
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+    # and recount the aggregates of the books that lost reviews
+    op.execute(
+        """
+        UPDATE books SET
+            review_count = coalesce(stats.review_count, 0),
+            rating_sum = coalesce(stats.rating_sum, 0),
+            rating_1_count = coalesce(stats.rating_1_count, 0),
+            rating_2_count = coalesce(stats.rating_2_count, 0),
+            rating_3_count = coalesce(stats.rating_3_count, 0),
+            rating_4_count = coalesce(stats.rating_4_count, 0),
+            rating_5_count = coalesce(stats.rating_5_count, 0)
+        FROM books AS target
+        LEFT JOIN (
+            SELECT book_uid,
+                   count(*) AS review_count,
+                   sum(rating) AS rating_sum,
+                   count(*) FILTER (WHERE rating = 1) AS rating_1_count,
+                   count(*) FILTER (WHERE rating = 2) AS rating_2_count,
+                   count(*) FILTER (WHERE rating = 3) AS rating_3_count,
+                   count(*) FILTER (WHERE rating = 4) AS rating_4_count,
+                   count(*) FILTER (WHERE rating = 5) AS rating_5_count
+            FROM reviews
+            GROUP BY book_uid
+        ) AS stats ON stats.book_uid = target.uid
+        WHERE books.uid = target.uid AND books.review_count <> coalesce(stats.review_count, 0)
+        """
+    )
+
+    op.create_unique_constraint(
+        'uq_reviews_user_uid_book_uid', 'reviews', ['user_uid', 'book_uid']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_reviews_user_uid_book_uid', 'reviews', type_='unique')
@@ -79,6 +79,38 @@ class PasswordsDoNotMatch(BooklyException):
     """Password data is invalid"""
 
 
+class InvalidCursor(BooklyException):
+    """User has provided a malformed or tampered pagination cursor"""
+
+
+class InvalidBookImport(BooklyException):
+    """Bulk import payload has an unsupported format or cannot be parsed"""
+
+
+class BookVersionConflict(BooklyException):
+    """Book was changed since the version named in If-Match"""
+
+
+class BookImportBatchRejected(BooklyException):
+    """Database refused a batch of imported rows, none of them was written"""
+
+
+class BookCacheUnavailable(BooklyException):
+    """Book cache counters cannot be read while Redis is unreachable"""
+
+
+class PasswordHashingUnavailable(BooklyException):
+    """Every password hashing worker is busy and their queue is full"""
+
+
+class RateLimitExceeded(BooklyException):
+    """Client has used up its request budget for the endpoint"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
 # decorator factory
 def create_exception_handler(
     status_code: int, initial_detail: Any
@@ -282,6 +314,80 @@ def register_all_errors(app: FastAPI):
         ),
     )
 
+    app.add_exception_handler(
+        InvalidCursor,
+        create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={
+                "message": "Invalid pagination cursor",
+                "error_code": "invalid_cursor",
+                "resolution": "Use the next_cursor value returned by the previous page",
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        InvalidBookImport,
+        create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={
+                "message": "Import payload is malformed or has an unsupported format",
+                "error_code": "invalid_book_import",
+                "resolution": (
+                    "Send NDJSON (application/x-ndjson) or CSV with a header row (text/csv)"
+                ),
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        BookVersionConflict,
+        create_exception_handler(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            initial_detail={
+                "message": "Book was modified by another request",
+                "error_code": "book_version_conflict",
+                "resolution": "Get the book again and retry with its current ETag or version",
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        BookCacheUnavailable,
+        create_exception_handler(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            initial_detail={
+                "message": "Book cache is unavailable",
+                "error_code": "book_cache_unavailable",
+                "resolution": "Check the Redis connection, books are served uncached meanwhile",
+            },
+        ),
+    )
+
+    app.add_exception_handler(
+        PasswordHashingUnavailable,
+        create_exception_handler(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            initial_detail={
+                "message": "Too many sign-ins in progress",
+                "error_code": "password_hashing_unavailable",
+                "resolution": "Please try again in a moment",
+            },
+        ),
+    )
+
+    @app.exception_handler(RateLimitExceeded)
+    async def rate_limit_exceeded(request, exc: RateLimitExceeded):
+        return JSONResponse(
+            content={
+                "message": "Too many requests",
+                "error_code": "rate_limit_exceeded",
+                "resolution": f"Please try again in {exc.retry_after} seconds",
+            },
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.exception_handler(500)
     async def internal_server_error(request, exc):
         return JSONResponse(
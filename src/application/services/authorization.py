@@ -1,6 +1,6 @@
 from src.application.errors import AccountNotVerified
 from src.application.errors import InsufficientPermission
-from src.domain.models.users import User
+from src.domain.models.principal import Principal
 from src.domain.services.authorization_interface import IRolePolicy
 
 
@@ -13,9 +13,9 @@ class AuthorizationService:
     def __init__(self, policy: IRolePolicy):
         self.policy = policy
 
-    def authorize(self, user: User) -> None:
-        if not user.is_verified:
+    def authorize(self, principal: Principal) -> None:
+        if not principal.is_verified:
             raise AccountNotVerified()
 
-        if not self.policy.is_allowed(user):
+        if not self.policy.is_allowed(principal):
             raise InsufficientPermission()
@@ -0,0 +1,205 @@
+import codecs
+import csv
+import json
+import logging
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from config.settings import Config
+from src.application.errors import BookImportBatchRejected, InvalidBookImport
+from src.domain.repositories.book_repository_interface import IBookRepository
+from src.presentation.web.schemas.books import (
+    BookCreateModel,
+    BookImportErrorModel,
+    BookImportResultModel,
+)
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# a payload without line breaks must not be buffered whole
+MAX_LINE_LENGTH = 64 * 1024
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering more than one line"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            if len(pending) > MAX_LINE_LENGTH:
+                raise InvalidBookImport()
+            for line in lines:
+                yield line.rstrip("\r")
+
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as error:
+        raise InvalidBookImport() from error
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as error:
+            yield line_number, error
+
+
+def _parse_csv_record(record: List[str]) -> Optional[List[str]]:
+    """Parse the lines of one CSV record, None while a quoted field is still open"""
+    # the empty line after the record is only read if a quoted field goes on past it
+    reader = csv.reader([*record, ""])
+    values = next(reader)
+    return values if reader.line_num == len(record) else None
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    header = None
+    record: List[str] = []
+    record_line = line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not record:
+            record_line = line_number
+        record.append(line + "\n")
+        try:
+            values = _parse_csv_record(record)
+        except csv.Error as error:
+            record = []
+            yield record_line, ValueError(f"invalid CSV: {error}")
+            continue
+        if values is None:
+            # a quoted field may span lines, but not without bound
+            if sum(len(part) for part in record) > MAX_LINE_LENGTH:
+                raise InvalidBookImport()
+            continue
+
+        blank = not "".join(record).strip()
+        record = []
+        if blank:
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield record_line, ValueError(f"expected {len(header)} columns, got {len(values)}")
+            continue
+        yield record_line, dict(zip(header, values))
+
+    if record:
+        yield record_line, ValueError("quoted field is not closed before the end of the payload")
+
+
+def _describe(error: Exception) -> List[str]:
+    if isinstance(error, ValidationError):
+        return [
+            f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+            for item in error.errors()
+        ]
+    return [str(error)]
+
+
+class BookImportService:
+    """Streams a bulk book import into the catalog in batches"""
+
+    def __init__(
+        self,
+        book_repository: IBookRepository,
+        batch_size: int = Config.BOOK_IMPORT_BATCH_SIZE,
+        max_errors: int = Config.BOOK_IMPORT_MAX_ERRORS,
+    ):
+        self.book_repository = book_repository
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    async def import_books(
+        self, chunks: AsyncIterator[bytes], import_format: str, user_uid: str
+    ) -> BookImportResultModel:
+        """
+        Import books from an NDJSON or CSV byte stream
+
+        Rows are parsed and validated one at a time and written with one COPY and one commit
+        per batch, so memory use depends on the batch size and not on the payload size.
+        Invalid rows are skipped and reported, batches written before a failure stay committed.
+        A batch the database rejects is rolled back and reported as a whole.
+
+        Args:
+            chunks: raw request body
+            import_format: "ndjson" (one JSON object per line) or "csv" (with a header row)
+            user_uid: UID of the user the books are linked to
+
+        Returns:
+            BookImportResultModel: number of imported and rejected rows with per-row errors
+
+        Raises:
+            InvalidBookImport: If the format is unsupported or the payload cannot be split into rows
+        """
+        if import_format not in IMPORT_FORMATS:
+            raise InvalidBookImport()
+
+        lines = _iter_lines(chunks)
+        records = _ndjson_records(lines) if import_format == "ndjson" else _csv_records(lines)
+        owner_uid = UUID(user_uid)
+
+        result = BookImportResultModel(imported=0, failed=0, errors=[])
+        batch: List[BookCreateModel] = []
+        batch_line = 0
+        async for line_number, record in records:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                if not batch:
+                    batch_line = line_number
+                batch.append(BookCreateModel.model_validate(record))
+            except ValueError as error:  # pydantic's ValidationError is a ValueError too
+                self._reject(result, 1, line_number, _describe(error))
+                continue
+
+            if len(batch) >= self.batch_size:
+                await self._write_batch(result, batch, batch_line, owner_uid)
+                batch = []
+
+        if batch:
+            await self._write_batch(result, batch, batch_line, owner_uid)
+
+        logger.info(
+            f"User {user_uid} imported {result.imported} books, rejected {result.failed} rows"
+        )
+        return result
+
+    async def _write_batch(
+        self,
+        result: BookImportResultModel,
+        batch: List[BookCreateModel],
+        first_line: int,
+        owner_uid: UUID,
+    ) -> None:
+        try:
+            result.imported += await self.book_repository.bulk_create_books(batch, owner_uid)
+        except BookImportBatchRejected as error:
+            self._reject(
+                result,
+                len(batch),
+                first_line,
+                [f"batch of {len(batch)} rows rejected by the database: {error}"],
+            )
+
+    def _reject(
+        self, result: BookImportResultModel, rows: int, line_number: int, errors: List[str]
+    ) -> None:
+        result.failed += rows
+        if len(result.errors) < self.max_errors:
+            result.errors.append(BookImportErrorModel(line=line_number, errors=errors))
+        else:
+            result.errors_truncated = True
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import AsyncContextManager, Callable
+
+from config.settings import Config
+from src.domain.repositories.book_repository_interface import IBookRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_book_rankings_periodically(
+    repository_scope: Callable[[], AsyncContextManager[IBookRepository]],
+    interval: int = Config.BOOK_RANKINGS_REFRESH_INTERVAL,
+) -> None:
+    """
+    Keep the leaderboards snapshot fresh for the lifetime of the application
+
+    Runs until cancelled. Every worker runs the loop; a worker skips its turn while another
+    one refreshes or the snapshot is younger than half the interval, so the leaderboards
+    are rebuilt about once per interval however many workers there are.
+
+    Args:
+        repository_scope: factory of book repositories owning their own session
+        interval: seconds between two refresh attempts
+    """
+    while True:
+        try:
+            async with repository_scope() as repository:
+                written = await repository.refresh_rankings(
+                    size=Config.BOOK_RANKINGS_SIZE,
+                    prior_weight=Config.BOOK_RANKINGS_PRIOR_WEIGHT,
+                    min_reviews=Config.BOOK_RANKINGS_MIN_REVIEWS,
+                    min_interval=timedelta(seconds=interval / 2),
+                )
+            if written is not None:
+                logger.info(f"Book rankings refreshed: {written} entries")
+        except Exception:
+            # a failed refresh keeps the previous snapshot, the next turn tries again
+            logger.exception("Book rankings refresh failed")
+        await asyncio.sleep(interval)
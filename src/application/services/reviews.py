@@ -1,22 +1,23 @@
 import logging
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from src.application.errors import (
     BookNotFound,
-    UserNotFound,
     ReviewNotFound,
     ReviewAlreadyExists,
     UnauthorizedReviewAccess,
 )
 from src.domain.repositories.book_repository_interface import IBookRepository
 from src.domain.repositories.reviews_repository_interface import IReviewRepository
-from src.domain.repositories.user_repository_interface import IUserRepository
+from src.domain.services.book_cache_interface import IBookCacheService
 from src.presentation.web.schemas.reviews import (
     ReviewCreateModel,
     ReviewUpdateModel,
     ReviewModel,
+    ReviewPageModel,
     BookRatingStatsModel,
+    BookRatingStatsBatchModel,
 )
 
 logger = logging.getLogger(__name__)
@@ -28,24 +29,28 @@ class ReviewService:
     def __init__(
         self,
         review_repository: IReviewRepository,
-        user_repository: IUserRepository,
         book_repository: IBookRepository,
+        book_cache: IBookCacheService,
     ):
         self.review_repository = review_repository
-        self.user_repository = user_repository
         self.book_repository = book_repository
+        self.book_cache = book_cache
 
     async def add_review_to_book(
         self,
-        user_email: str,
+        user_uid: UUID,
         book_uid: str,
         review_data: ReviewCreateModel,
     ) -> ReviewModel:
         """
         Add a review to a book
 
+        The review is written with one INSERT ... ON CONFLICT DO NOTHING; the foreign key
+        and the unique (user_uid, book_uid) constraint do the checks, so concurrent
+        submissions cannot create duplicates.
+
         Args:
-            user_email: Email of the user creating the review
+            user_uid: UID of the user creating the review
             book_uid: UID of the book being reviewed
             review_data: Review data (rating and text)
 
@@ -57,29 +62,14 @@ class ReviewService:
             UserNotFound: If user does not exist
             ReviewAlreadyExists: If user has already reviewed this book
         """
-        # Validate book exists
-        book = await self.book_repository.get_book(UUID(book_uid))
-        if not book:
-            raise BookNotFound()
-
-        # Validate user exists
-        user = await self.user_repository.get_user_by_email(user_email)
-        if not user:
-            raise UserNotFound()
-
-        # Check if user already reviewed this book
-        has_reviewed = await self.review_repository.user_has_reviewed_book(
-            user_uid=user.uid, book_uid=UUID(book_uid)
-        )
-        if has_reviewed:
-            raise ReviewAlreadyExists()
-
-        # Create the review
         new_review = await self.review_repository.create_review(
-            review_data=review_data, user_uid=user.uid, book_uid=UUID(book_uid)
+            review_data=review_data, user_uid=user_uid, book_uid=UUID(book_uid)
         )
+        if new_review is None:
+            raise ReviewAlreadyExists()
+        await self.book_cache.invalidate_books(UUID(book_uid))
 
-        logger.info(f"User {user_email} created review {new_review.uid} for book {book_uid}")
+        logger.info(f"User {user_uid} created review {new_review.uid} for book {book_uid}")
         return ReviewModel.model_validate(new_review)
 
     async def get_review(self, review_uid: str) -> ReviewModel:
@@ -102,80 +92,134 @@ class ReviewService:
 
         return ReviewModel.model_validate(review)
 
-    async def get_all_reviews(self, limit: int = 100, offset: int = 0) -> List[ReviewModel]:
+    async def get_all_reviews(
+        self, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> ReviewPageModel:
         """
-        Get all reviews with pagination
+        Get a page of all reviews, newest first
 
         Args:
             limit: Maximum number of reviews to return
-            offset: Number of reviews to skip
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Also return the (estimated) number of reviews
 
         Returns:
-            List[ReviewModel]: List of reviews
+            ReviewPageModel: Reviews and the cursor of the next page
         """
-        reviews = await self.review_repository.get_all_reviews(limit=limit, offset=offset)
-        return [ReviewModel.model_validate(review) for review in reviews]
+        reviews, next_cursor, total = await self.review_repository.get_all_reviews(
+            limit=limit, cursor=cursor, include_total=include_total
+        )
+        return ReviewPageModel(
+            items=[ReviewModel.model_validate(review) for review in reviews],
+            next_cursor=next_cursor,
+            total=total.count if total is not None else None,
+            total_estimated=total is not None and total.estimated,
+        )
 
     async def get_book_reviews(
-        self, book_uid: str, limit: int = 100, offset: int = 0
-    ) -> List[ReviewModel]:
+        self, book_uid: str, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> ReviewPageModel:
         """
-        Get all reviews for a specific book
+        Get a page of the reviews for a specific book, newest first
 
         Args:
             book_uid: UID of the book
             limit: Maximum number of reviews to return
-            offset: Number of reviews to skip
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Also return the number of reviews of the book
 
         Returns:
-            List[ReviewModel]: List of reviews for the book
+            ReviewPageModel: Reviews for the book and the cursor of the next page
 
         Raises:
             BookNotFound: If book does not exist
         """
-        # Validate book exists
-        book = await self.book_repository.get_book(UUID(book_uid))
-        if not book:
+        reviews, next_cursor, total = await self.review_repository.get_reviews_by_book(
+            book_uid=UUID(book_uid), limit=limit, cursor=cursor, include_total=include_total
+        )
+
+        # a non-empty page proves the book exists, only an empty one pays for the lookup
+        if not reviews and not await self.book_repository.get_books_by_uids([UUID(book_uid)]):
             raise BookNotFound()
 
-        reviews = await self.review_repository.get_reviews_by_book(
-            book_uid=UUID(book_uid), limit=limit, offset=offset
+        return ReviewPageModel(
+            items=[ReviewModel.model_validate(review) for review in reviews],
+            next_cursor=next_cursor,
+            total=total.count if total is not None else None,
         )
 
-        return [ReviewModel.model_validate(review) for review in reviews]
-
-    async def get_user_reviews(
-        self, user_email: str, limit: int = 100, offset: int = 0
-    ) -> List[ReviewModel]:
+    async def search_book_reviews(
+        self,
+        book_uid: str,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        min_rating: Optional[int] = None,
+        max_rating: Optional[int] = None,
+    ) -> ReviewPageModel:
         """
-        Get all reviews by a specific user
+        Full-text search in the reviews of a book, best match first
 
         Args:
-            user_email: Email of the user
+            book_uid: UID of the book
+            query: Search terms (web search syntax)
             limit: Maximum number of reviews to return
-            offset: Number of reviews to skip
+            cursor: next_cursor of the previous page, None for the first page
+            min_rating: Only reviews rated at least this
+            max_rating: Only reviews rated at most this
 
         Returns:
-            List[ReviewModel]: List of reviews by the user
+            ReviewPageModel: Matching reviews and the cursor of the next page
 
         Raises:
-            UserNotFound: If user does not exist
+            BookNotFound: If book does not exist
         """
-        # Validate user exists
-        user = await self.user_repository.get_user_by_email(user_email)
-        if not user:
-            raise UserNotFound()
+        reviews, next_cursor = await self.review_repository.search_book_reviews(
+            book_uid=UUID(book_uid),
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            min_rating=min_rating,
+            max_rating=max_rating,
+        )
+
+        if not reviews and not await self.book_repository.get_books_by_uids([UUID(book_uid)]):
+            raise BookNotFound()
 
-        reviews = await self.review_repository.get_reviews_by_user(
-            user_uid=user.uid, limit=limit, offset=offset
+        return ReviewPageModel(
+            items=[ReviewModel.model_validate(review) for review in reviews],
+            next_cursor=next_cursor,
         )
 
-        return [ReviewModel.model_validate(review) for review in reviews]
+    async def get_user_reviews(
+        self, user_uid: UUID, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> ReviewPageModel:
+        """
+        Get a page of the reviews by a specific user, newest first
+
+        Args:
+            user_uid: UID of the (authenticated) user
+            limit: Maximum number of reviews to return
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Also return the number of reviews by the user
+
+        Returns:
+            ReviewPageModel: Reviews by the user and the cursor of the next page
+        """
+        reviews, next_cursor, total = await self.review_repository.get_reviews_by_user(
+            user_uid=user_uid, limit=limit, cursor=cursor, include_total=include_total
+        )
+
+        return ReviewPageModel(
+            items=[ReviewModel.model_validate(review) for review in reviews],
+            next_cursor=next_cursor,
+            total=total.count if total is not None else None,
+        )
 
     async def update_review(
         self,
         review_uid: str,
-        user_email: str,
+        user_uid: UUID,
         review_data: ReviewUpdateModel,
     ) -> ReviewModel:
         """
@@ -183,7 +227,7 @@ class ReviewService:
 
         Args:
             review_uid: UID of the review to update
-            user_email: Email of the user updating the review
+            user_uid: UID of the (authenticated) user updating the review
             review_data: Updated review data
 
         Returns:
@@ -191,7 +235,6 @@ class ReviewService:
 
         Raises:
             ReviewNotFound: If review does not exist
-            UserNotFound: If user does not exist
             UnauthorizedReviewAccess: If user does not own the review
         """
         # Get the review
@@ -200,39 +243,35 @@ class ReviewService:
             raise ReviewNotFound()
 
         # Validate user owns the review
-        user = await self.user_repository.get_user_by_email(user_email)
-        if not user:
-            raise UserNotFound()
-
-        if review.user_uid != user.uid:
+        if review.user_uid != user_uid:
             raise UnauthorizedReviewAccess()
 
         # Update the review
         updated_review = await self.review_repository.update_review(
             review_uid=UUID(review_uid), review_data=review_data
         )
+        await self.book_cache.invalidate_books(review.book_uid)
 
-        logger.info(f"User {user_email} updated review {review_uid}")
+        logger.info(f"User {user_uid} updated review {review_uid}")
         return ReviewModel.model_validate(updated_review)
 
     async def delete_review(
         self,
         review_uid: str,
-        user_email: str,
+        user_uid: UUID,
     ) -> bool:
         """
         Delete a review
 
         Args:
             review_uid: UID of the review to delete
-            user_email: Email of the user deleting the review
+            user_uid: UID of the (authenticated) user deleting the review
 
         Returns:
             bool: True if deleted successfully
 
         Raises:
             ReviewNotFound: If review does not exist
-            UserNotFound: If user does not exist
             UnauthorizedReviewAccess: If user does not own the review
         """
         # Get the review
@@ -241,17 +280,14 @@ class ReviewService:
             raise ReviewNotFound()
 
         # Validate user owns the review
-        user = await self.user_repository.get_user_by_email(user_email)
-        if not user:
-            raise UserNotFound()
-
-        if review.user_uid != user.uid:
+        if review.user_uid != user_uid:
             raise UnauthorizedReviewAccess()
 
         # Delete the review
         deleted = await self.review_repository.delete_review(UUID(review_uid))
+        await self.book_cache.invalidate_books(review.book_uid)
 
-        logger.info(f"User {user_email} deleted review {review_uid}")
+        logger.info(f"User {user_uid} deleted review {review_uid}")
         return deleted
 
     async def get_book_rating_stats(
@@ -265,24 +301,35 @@ class ReviewService:
             book_uid: UID of the book
 
         Returns:
-            BookRatingStatsModel: Statistics including total reviews and average rating
+            BookRatingStatsModel: Total reviews, average rating and reviews per rating
 
         Raises:
             BookNotFound: If book does not exist
         """
-        # Validate book exists
-        book = await self.book_repository.get_book(UUID(book_uid))
-        if not book:
+        # the aggregates live on the book row: a missing row is a missing book
+        stats = await self.review_repository.get_book_rating_stats(book_uid=UUID(book_uid))
+        if not stats:
             raise BookNotFound()
 
-        total_reviews = await self.review_repository.count_reviews_by_book(book_uid=UUID(book_uid))
+        return stats
 
-        average_rating = await self.review_repository.get_average_rating_by_book(
-            book_uid=UUID(book_uid)
-        )
+    async def get_books_rating_stats(self, book_uids: List[UUID]) -> BookRatingStatsBatchModel:
+        """
+        Get rating statistics for many books with one query
 
-        return BookRatingStatsModel(
-            book_uid=UUID(book_uid),
-            total_reviews=total_reviews,
-            average_rating=average_rating or 0.0,
+        Args:
+            book_uids: UIDs of the books, duplicates are returned once
+
+        Returns:
+            BookRatingStatsBatchModel: Statistics in request order and the UIDs of missing books
+        """
+        requested = list(dict.fromkeys(book_uids))
+        found = {
+            stats.book_uid: stats
+            for stats in await self.review_repository.get_books_rating_stats(requested)
+        }
+
+        return BookRatingStatsBatchModel(
+            items=[found[uid] for uid in requested if uid in found],
+            missing=[uid for uid in requested if uid not in found],
         )
@@ -1,6 +1,7 @@
+from src.domain.models.book_rankings import BookRanking
 from src.domain.models.book_tags import BookTag, Tag
 from src.domain.models.books import Book
 from src.domain.models.reviews import Review
 from src.domain.models.users import User
 
-__all__ = ["User", "Book", "Review", "BookTag", "Tag"]
+__all__ = ["User", "Book", "Review", "BookTag", "Tag", "BookRanking"]
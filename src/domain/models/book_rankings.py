@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+import sqlalchemy.dialects.postgresql as pg
+from sqlmodel import Column, Field, SQLModel
+
+from src.domain.models.books import language_key
+
+# scope of the overall leaderboard, the others are "language:<language key>" and "tag:<tag uid>"
+OVERALL_SCOPE = "all"
+LANGUAGE_SCOPE_PREFIX = "language:"
+TAG_SCOPE_PREFIX = "tag:"
+
+
+class BookRanking(SQLModel, table=True):
+    """Snapshot row of a books leaderboard, rebuilt as a whole by the rankings refresh.
+
+    The (scope, rank) primary key makes a leaderboard page an index range scan. book_uid has
+    no foreign key: a deleted book drops out of the join at read time and out of the
+    snapshot at the next refresh, without the delete having to touch this table.
+    """
+
+    __tablename__ = "book_rankings"
+    scope: str = Field(sa_column=Column(pg.VARCHAR, nullable=False, primary_key=True))
+    rank: int = Field(sa_column=Column(pg.INTEGER, nullable=False, primary_key=True))
+    book_uid: uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False))
+    score: float = Field(sa_column=Column(pg.DOUBLE_PRECISION, nullable=False))
+    review_count: int = Field(sa_column=Column(pg.INTEGER, nullable=False))
+    average_rating: float = Field(sa_column=Column(pg.DOUBLE_PRECISION, nullable=False))
+    computed_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, nullable=False))
+
+    def __repr__(self) -> str:
+        return f"<BookRanking {self.scope} #{self.rank}>"
+
+
+def ranking_scope(language: Optional[str] = None, tag_uid: Optional[uuid.UUID] = None) -> str:
+    """Scope of the leaderboard of a language or a tag, the overall one without either"""
+    if tag_uid is not None:
+        return f"{TAG_SCOPE_PREFIX}{tag_uid}"
+    if language is not None:
+        return f"{LANGUAGE_SCOPE_PREFIX}{language_key(language)}"
+    return OVERALL_SCOPE
@@ -3,15 +3,32 @@ from datetime import date, datetime
 from typing import Optional, List
 
 import sqlalchemy.dialects.postgresql as pg
-from sqlmodel import Column, Field, SQLModel, Relationship
+from sqlalchemy import Computed
+from sqlmodel import Column, Field, Index, SQLModel, Relationship
 
 from src.domain.models.book_tags import BookTag, Tag
 
 
+def _counter():
+    return Field(
+        default=0, sa_column=Column(pg.INTEGER, nullable=False, default=0, server_default="0")
+    )
+
+
 class Book(SQLModel, table=True):
     """Schema definition for books based on SQLModel ORM."""
 
     __tablename__ = "books"
+    # keyset pagination walks (sort column, uid) in either direction, a b-tree is scanned both
+    # ways; equality filters lead the index so a filtered page stays an ordered range scan
+    __table_args__ = (
+        Index("ix_books_created_at_uid", "created_at", "uid"),
+        Index("ix_books_title_uid", "title", "uid"),
+        Index("ix_books_published_date_uid", "published_date", "uid"),
+        Index("ix_books_language_created_at_uid", "language", "created_at", "uid"),
+        Index("ix_books_publisher_created_at_uid", "publisher", "created_at", "uid"),
+        Index("ix_books_author_created_at_uid", "author", "created_at", "uid"),
+    )
     # sa_column lets you directly use a SQLAlchemy Column object to define advanced database-specific behaviors.
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
@@ -25,6 +42,18 @@ class Book(SQLModel, table=True):
     language: str
     created_at: Optional[datetime] = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     updated_at: Optional[datetime] = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
+    # bumped by every update, compared against If-Match for optimistic concurrency
+    version: int = Field(
+        default=1, sa_column=Column(pg.INTEGER, nullable=False, default=1, server_default="1")
+    )
+    # rating aggregates, maintained by the review repository in the transaction of each write
+    review_count: int = _counter()
+    rating_sum: int = _counter()
+    rating_1_count: int = _counter()
+    rating_2_count: int = _counter()
+    rating_3_count: int = _counter()
+    rating_4_count: int = _counter()
+    rating_5_count: int = _counter()
     user: Optional["User"] = Relationship(back_populates="books")
     reviews: List["Review"] = Relationship(
         back_populates="book", sa_relationship_kwargs={"lazy": "selectin"}
@@ -37,3 +66,70 @@ class Book(SQLModel, table=True):
 
     def __repr__(self) -> str:
         return f"<Book {self.title}>"
+
+
+# Book.language -> Postgres text search configuration, other languages are indexed with "simple"
+SEARCH_CONFIGS = {
+    "en": "english",
+    "fr": "french",
+    "de": "german",
+    "es": "spanish",
+    "it": "italian",
+    "pt": "portuguese",
+    "ru": "russian",
+    "nl": "dutch",
+}
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def search_config_for(language: str) -> str:
+    """Text search configuration for a language given as ISO code or configuration name"""
+    language = language.lower()
+    if language in SEARCH_CONFIGS.values():
+        return language
+    return SEARCH_CONFIGS.get(language, DEFAULT_SEARCH_CONFIG)
+
+
+def language_aliases(language: str) -> List[str]:
+    """Lowercase spellings of the same language: ISO code and configuration name when known"""
+    language = language.lower()
+    config = search_config_for(language)
+    if config == DEFAULT_SEARCH_CONFIG:
+        return [language]
+    return [code for code, name in SEARCH_CONFIGS.items() if name == config] + [config]
+
+
+def language_key(language: str) -> str:
+    """One spelling per language: its configuration name when known, else the lowercase value"""
+    config = search_config_for(language)
+    return language.lower() if config == DEFAULT_SEARCH_CONFIG else config
+
+
+def _search_config_expression() -> str:
+    branches = " ".join(
+        f"WHEN '{key}' THEN '{config}'::regconfig"
+        for code, config in SEARCH_CONFIGS.items()
+        for key in (code, config)
+    )
+    return f"CASE lower(language) {branches} ELSE '{DEFAULT_SEARCH_CONFIG}'::regconfig END"
+
+
+# SQL expression of the configuration a book row is indexed with
+SEARCH_CONFIG_EXPRESSION = _search_config_expression()
+
+
+def _search_vector_expression() -> str:
+    config = SEARCH_CONFIG_EXPRESSION
+    return (
+        f"setweight(to_tsvector({config}, coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector({config}, coalesce(author, '')), 'B') || "
+        f"setweight(to_tsvector({config}, coalesce(publisher, '')), 'C')"
+    )
+
+
+# The search vector lives on the table only: it is maintained by Postgres and left out of the
+# mapper, so loading a Book never transfers it.
+Book.__table__.append_column(
+    Column("search_vector", pg.TSVECTOR, Computed(_search_vector_expression(), persisted=True))
+)
+Index("ix_books_search_vector", Book.__table__.c.search_vector, postgresql_using="gin")
@@ -0,0 +1,16 @@
+import uuid
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The user an authenticated request is made by, as far as authorization needs to know.
+
+    Loaded from four columns of users, never from the entity: authenticating costs the same
+    whatever the size of the user's library and review history.
+    """
+
+    uid: uuid.UUID
+    email: str
+    role: str
+    is_verified: bool
@@ -3,7 +3,8 @@ from datetime import datetime
 from typing import Optional
 
 import sqlalchemy.dialects.postgresql as pg
-from sqlmodel import Column, Field, Relationship, SQLModel
+from sqlalchemy import Computed, UniqueConstraint
+from sqlmodel import Column, Field, Index, Relationship, SQLModel
 
 from src.domain.models.books import Book
 from src.domain.models.users import User
@@ -11,6 +12,10 @@ from src.domain.models.users import User
 
 class Review(SQLModel, table=True):
     __tablename__ = "reviews"
+    # one review per user and book, enforced by the database so concurrent submits cannot race
+    __table_args__ = (
+        UniqueConstraint("user_uid", "book_uid", name="uq_reviews_user_uid_book_uid"),
+    )
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4)
     )
@@ -25,3 +30,37 @@ class Review(SQLModel, table=True):
 
     def __repr__(self):
         return f"<Review for book {self.book_uid} by user {self.user_uid}>"
+
+
+# review listings page newest first on (created_at, uid) within a book, a user or globally
+Index(
+    "ix_reviews_book_uid_created_at_uid",
+    Review.book_uid,
+    Review.created_at.desc(),
+    Review.uid.desc(),
+)
+Index(
+    "ix_reviews_user_uid_created_at_uid",
+    Review.user_uid,
+    Review.created_at.desc(),
+    Review.uid.desc(),
+)
+Index("ix_reviews_created_at_uid", Review.created_at.desc(), Review.uid.desc())
+
+
+# Reviews carry no language of their own: their text is indexed with one configuration, which
+# the search query must be parsed with too.
+REVIEW_SEARCH_CONFIG = "english"
+
+# Maintained by Postgres and left out of the mapper, like the search vector of books
+Review.__table__.append_column(
+    Column(
+        "search_vector",
+        pg.TSVECTOR,
+        Computed(
+            f"to_tsvector('{REVIEW_SEARCH_CONFIG}'::regconfig, coalesce(review_text, ''))",
+            persisted=True,
+        ),
+    )
+)
+Index("ix_reviews_search_vector", Review.__table__.c.search_vector, postgresql_using="gin")
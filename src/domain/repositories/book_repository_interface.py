@@ -1,16 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import timedelta
+from typing import AsyncIterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 from src.domain.models.books import Book
-from src.presentation.web.schemas.books import BookCreateModel, BookUpdateModel
+from src.presentation.web.schemas.books import (
+    BookCreateModel,
+    BookFacetsModel,
+    BookFilterModel,
+    BookLeaderboardModel,
+    BookUpdateModel,
+)
 
 
 class IBookRepository(ABC):
     """Interface for book repository"""
 
     @abstractmethod
-    async def get_all_books(self) -> List[Book]:
+    async def get_all_books(
+        self, limit: int, cursor: Optional[str] = None, filters: Optional[BookFilterModel] = None
+    ) -> Tuple[List[Book], Optional[str]]:
+        pass
+
+    @abstractmethod
+    async def get_book_facets(self, filters: Optional[BookFilterModel] = None) -> BookFacetsModel:
+        pass
+
+    @abstractmethod
+    async def search_books(
+        self, query: str, limit: int, cursor: Optional[str] = None, language: Optional[str] = None
+    ) -> Tuple[List[Book], Optional[str]]:
+        pass
+
+    @abstractmethod
+    def stream_books(self, batch_size: int) -> AsyncIterator[Sequence[Book]]:
         pass
 
     @abstractmethod
@@ -21,14 +44,40 @@ class IBookRepository(ABC):
     async def create_book(self, book_data: BookCreateModel, user_uid: UUID) -> Optional[Book]:
         pass
 
+    @abstractmethod
+    async def bulk_create_books(self, books_data: List[BookCreateModel], user_uid: UUID) -> int:
+        pass
+
     @abstractmethod
     async def get_book(self, book_id: UUID) -> Optional[Book]:
         pass
 
     @abstractmethod
-    async def update_book(self, book_uid: UUID, update_data: BookUpdateModel) -> Optional[Book]:
+    async def get_books_by_uids(self, book_uids: Sequence[UUID]) -> List[Book]:
+        pass
+
+    @abstractmethod
+    async def get_book_fingerprint(self, book_uid: UUID) -> Optional[Tuple]:
+        pass
+
+    @abstractmethod
+    async def update_book(
+        self, book_uid: UUID, update_data: BookUpdateModel, versions: Optional[Set[int]] = None
+    ) -> Optional[Book]:
         pass
 
     @abstractmethod
     async def delete_book(self, book_id: UUID) -> bool:
         pass
+
+    @abstractmethod
+    async def get_leaderboard(
+        self, scope: str, limit: int, cursor: Optional[str] = None
+    ) -> BookLeaderboardModel:
+        pass
+
+    @abstractmethod
+    async def refresh_rankings(
+        self, size: int, prior_weight: int, min_reviews: int, min_interval: timedelta
+    ) -> Optional[int]:
+        pass
@@ -1,9 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
 from src.domain.models.reviews import Review
-from src.presentation.web.schemas.reviews import ReviewCreateModel, ReviewUpdateModel
+from src.presentation.web.schemas.reviews import (
+    BookRatingStatsModel,
+    ReviewCreateModel,
+    ReviewUpdateModel,
+)
+
+
+class ReviewTotal(NamedTuple):
+    """Number of reviews of a listing and whether it is the planner's estimate"""
+
+    count: int
+    estimated: bool
 
 
 class IReviewRepository(ABC):
@@ -12,28 +23,45 @@ class IReviewRepository(ABC):
     @abstractmethod
     async def create_review(
         self, review_data: ReviewCreateModel, user_uid: UUID, book_uid: UUID
-    ) -> Review:
-        """Create a new review"""
+    ) -> Optional[Review]:
+        """Create a new review, None if the user has already reviewed the book"""
 
     @abstractmethod
     async def get_review_by_uid(self, review_uid: UUID) -> Optional[Review]:
         """Get a review by its UID"""
 
     @abstractmethod
-    async def get_all_reviews(self, limit: int = 100, offset: int = 0) -> List[Review]:
-        """Get all reviews with pagination"""
+    async def get_all_reviews(
+        self, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of all reviews, newest first, the cursor of the next page and, on
+        request, the (possibly estimated) number of reviews"""
 
     @abstractmethod
     async def get_reviews_by_book(
-        self, book_uid: UUID, limit: int = 100, offset: int = 0
-    ) -> List[Review]:
-        """Get all reviews for a specific book"""
+        self, book_uid: UUID, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of the reviews of a specific book, the cursor of the next page and, on
+        request, the number of reviews of the book"""
 
     @abstractmethod
     async def get_reviews_by_user(
-        self, user_uid: UUID, limit: int = 100, offset: int = 0
-    ) -> List[Review]:
-        """Get all reviews by a specific user"""
+        self, user_uid: UUID, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of the reviews by a specific user, the cursor of the next page and, on
+        request, the number of reviews by the user"""
+
+    @abstractmethod
+    async def search_book_reviews(
+        self,
+        book_uid: UUID,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        min_rating: Optional[int] = None,
+        max_rating: Optional[int] = None,
+    ) -> Tuple[List[Review], Optional[str]]:
+        """Full-text search in the reviews of a book, best match first, and the next cursor"""
 
     @abstractmethod
     async def update_review(
@@ -46,12 +74,12 @@ class IReviewRepository(ABC):
         """Delete a review by UID"""
 
     @abstractmethod
-    async def user_has_reviewed_book(self, user_uid: UUID, book_uid: UUID) -> bool:
-        """Check if user has already reviewed a book"""
+    async def get_book_rating_stats(self, book_uid: UUID) -> Optional[BookRatingStatsModel]:
+        """Get rating statistics of a book, None if the book does not exist"""
 
     @abstractmethod
-    async def get_average_rating_by_book(self, book_uid: UUID) -> Optional[float]:
-        """Get average rating for a book"""
+    async def get_books_rating_stats(self, book_uids: List[UUID]) -> List[BookRatingStatsModel]:
+        """Get rating statistics of the books that exist among book_uids, in no particular order"""
 
     @abstractmethod
     async def review_exists(self, review_uid: UUID) -> bool:
@@ -20,6 +20,11 @@ class ITagRepository(ABC):
         """Get tag by uid"""
         raise NotImplementedError()
 
+    @abstractmethod
+    async def get_tagged_book_uids(self, tag_uid: UUID) -> List[UUID]:
+        """Get uids of the books carrying a tag"""
+        raise NotImplementedError()
+
     @abstractmethod
     async def add_tag(self, tag_data: TagCreateModel) -> Optional[Tag]:
         """Create a tag"""
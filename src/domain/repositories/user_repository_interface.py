@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.domain.models.principal import Principal
 from src.domain.models.users import User
 from src.domain.services.password_interface import IPasswordService
 from src.presentation.web.schemas.users import UserCreateModel
@@ -10,6 +13,10 @@ from src.presentation.web.schemas.users import UserCreateModel
 class IUserRepository(ABC):
     """Interface for user repository operations"""
 
+    @abstractmethod
+    async def get_principal(self, user_uid: UUID, session: AsyncSession) -> Optional[Principal]:
+        """Fetch what authorization needs to know about a user"""
+
     @abstractmethod
     async def get_user_by_email(self, email: str, session: AsyncSession) -> User:
         """Fetch a user by email"""
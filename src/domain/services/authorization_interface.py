@@ -1,19 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.domain.models.users import User
+from src.domain.models.principal import Principal
 
 
 class IRolePolicy(ABC):
     """
-    Domain contract for evaluating whether a User
+    Domain contract for evaluating whether a Principal
     has the rights to perform an action.
     """
 
     @abstractmethod
-    def is_allowed(self, user: User) -> bool:
+    def is_allowed(self, principal: Principal) -> bool:
         """
-        Return True if user is authorized according to the policy.
+        Return True if the principal is authorized according to the policy.
         """
 
 
@@ -25,5 +25,5 @@ class RoleBasedPolicy(IRolePolicy):
     def __init__(self, allowed_roles: Iterable[str]):
         self._allowed_roles = set(allowed_roles)
 
-    def is_allowed(self, user: User) -> bool:
-        return user.role in self._allowed_roles
+    def is_allowed(self, principal: Principal) -> bool:
+        return principal.role in self._allowed_roles
@@ -8,11 +8,11 @@ class IBlocklistTokenService(ABC):
 
     @abstractmethod
     async def connect(self):
-        """Initialize Redis connection."""
+        """Acquire the Redis client."""
 
     @abstractmethod
     async def disconnect(self):
-        """Close Redis connection."""
+        """Release the Redis client."""
 
     @abstractmethod
     async def add_to_blocklist(self, jti: str) -> None:
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from uuid import UUID
+
+
+class IBookCacheService(ABC):
+    """
+    Read-through cache of serialized book detail representations.
+    """
+
+    @abstractmethod
+    async def get_book(self, book_uid: UUID) -> Optional[Tuple[str, str]]:
+        """Return the cached (etag, body) of a book, None on a miss."""
+
+    @abstractmethod
+    async def set_book(self, book_uid: UUID, etag: str, body: str) -> None:
+        """Cache the serialized representation of a book with its entity tag."""
+
+    @abstractmethod
+    async def invalidate_books(self, *book_uids: UUID) -> None:
+        """Drop cached representations after the books, their reviews or tags changed."""
+
+    @abstractmethod
+    async def get_stats(self) -> dict:
+        """Return hit and miss counters of the cache."""
@@ -2,12 +2,20 @@ from abc import ABC, abstractmethod
 
 
 class IPasswordService(ABC):
-    """Abstract interface for password service"""
+    """Abstract interface for password service
+
+    Hashing is CPU bound: implementations run it off the event loop.
+    """
+
+    @abstractmethod
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        raise NotImplementedError()
 
     @abstractmethod
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def hash_password(self, password: str) -> str:
         raise NotImplementedError()
 
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    def get_stats(self) -> dict:
+        """Return the load and queue wait counters of the hashing workers."""
         raise NotImplementedError()
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.domain.models.principal import Principal
+
+
+class IPrincipalCacheService(ABC):
+    """
+    Per-process cache of the users authenticated requests are made by.
+    """
+
+    @abstractmethod
+    def get_principal(self, user_uid: UUID) -> Optional[Principal]:
+        """Return the cached principal, None on a miss or once the entry expired."""
+
+    @abstractmethod
+    def set_principal(self, principal: Principal) -> None:
+        """Cache a principal loaded for an authenticated request."""
+
+    @abstractmethod
+    def invalidate_principal(self, user_uid: UUID) -> None:
+        """Drop a user after its account changed or was deleted."""
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """Return hit and miss counters and the size of the cache."""
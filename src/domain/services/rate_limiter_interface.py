@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+
+class IRateLimiterService(ABC):
+    """
+    Request budgets of the expensive unauthenticated endpoints.
+    """
+
+    @abstractmethod
+    async def check_rate_limit(self, route: str, **identities: str) -> None:
+        """Take one request from each budget of a route, e.g. ip="1.2.3.4", email="a@b.c".
+
+        Raises:
+            RateLimitExceeded: If any of the budgets is exhausted, nothing is taken then
+        """
+
+    @abstractmethod
+    async def claim_once(self, action: str, identity: str, window: int) -> bool:
+        """Return True for the first claim of an action in a window, False for repeats."""
+
+    @abstractmethod
+    async def release_claim(self, action: str, identity: str) -> None:
+        """Drop a claim whose action failed, so that a retry is not taken for a repeat."""
@@ -1,10 +1,15 @@
+from uuid import UUID
+
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.application.errors import UserNotFound
+from src.domain.models.principal import Principal
 from src.domain.repositories.user_repository_interface import IUserRepository
+from src.domain.services.principal_cache_interface import IPrincipalCacheService
 from src.infrastructure.dependencies.database import get_session
 from src.infrastructure.dependencies.repositories import get_user_repository
+from src.infrastructure.dependencies.services import get_principal_cache_service
 from src.infrastructure.service.auth.token_bearer import AccessTokenBearer
 
 access_security_scheme = AccessTokenBearer()
@@ -15,9 +20,18 @@ async def get_current_user(
     token_data: dict = Depends(access_security_scheme),
     user_repository: IUserRepository = Depends(get_user_repository),
     session: AsyncSession = Depends(get_session),
-):
-    user_email = token_data["user"]["email"]
-    user = await user_repository.get_user_by_email(user_email, session)
-    if not user:
-        raise UserNotFound()
-    return user
+    principal_cache: IPrincipalCacheService = Depends(get_principal_cache_service),
+) -> Principal:
+    """Principal of the user the access token was issued to.
+
+    Served from the per-process principal cache: a hit needs no query, the session is never
+    used then and does not check out a connection.
+    """
+    user_uid = UUID(token_data["user"]["user_uid"])
+    principal = principal_cache.get_principal(user_uid)
+    if principal is None:
+        principal = await user_repository.get_principal(user_uid, session)
+        if not principal:
+            raise UserNotFound()
+        principal_cache.set_principal(principal)
+    return principal
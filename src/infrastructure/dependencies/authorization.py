@@ -1,7 +1,7 @@
 from fastapi import Depends
 
 from src.application.services.authorization import AuthorizationService
-from src.domain.models.users import User
+from src.domain.models.principal import Principal
 from src.domain.services.authorization_interface import RoleBasedPolicy
 from src.infrastructure.dependencies.authentication import get_current_user
 
@@ -15,7 +15,7 @@ def get_role_checker(allowed_roles: list[str]):
     policy = RoleBasedPolicy(allowed_roles)
     auth_service = AuthorizationService(policy)
 
-    def checker(current_user: User = Depends(get_current_user)):
+    def checker(current_user: Principal = Depends(get_current_user)):
         auth_service.authorize(current_user)
         return current_user
 
@@ -0,0 +1,22 @@
+from fastapi import Request
+
+from config.settings import Config
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Address of the client a request comes from, as seen through TRUSTED_PROXY_HOPS proxies.
+
+    Each proxy appends the address it received the request from to X-Forwarded-For, so with
+    N trusted proxies in front of the app the client is the N-th address from the right.
+    Addresses further left are supplied by the client and cannot be trusted.
+    """
+    peer = request.client.host if request.client else ""
+    hops = Config.TRUSTED_PROXY_HOPS
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if hops <= 0 or not forwarded_for:
+        return peer
+    addresses = [address.strip() for address in forwarded_for.split(",") if address.strip()]
+    if not addresses:
+        return peer
+    return addresses[-hops] if len(addresses) >= hops else addresses[0]
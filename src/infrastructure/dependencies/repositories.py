@@ -1,12 +1,21 @@
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
+
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.application.services.book_import import BookImportService
 from src.application.services.reviews import ReviewService
 from src.domain.repositories.book_repository_interface import IBookRepository
 from src.domain.repositories.reviews_repository_interface import IReviewRepository
 from src.domain.repositories.tags_repository_interface import ITagRepository
 from src.domain.repositories.user_repository_interface import IUserRepository
-from src.infrastructure.dependencies.database import get_session
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.infrastructure.dependencies.database import AsyncSessionLocal, get_session
+from src.infrastructure.dependencies.services import (
+    get_book_cache_service,
+    get_principal_cache_service,
+)
 from src.infrastructure.repositories.books_repository import BookRepository
 from src.infrastructure.repositories.reviews_repository import ReviewRepository
 from src.infrastructure.repositories.tags_repository import TagRepository
@@ -14,7 +23,7 @@ from src.infrastructure.repositories.users_repository import UserRepository
 
 
 async def get_user_repository() -> IUserRepository:
-    return UserRepository()
+    return UserRepository(get_principal_cache_service())
 
 
 async def get_book_repository(
@@ -23,6 +32,21 @@ async def get_book_repository(
     return BookRepository(session)
 
 
+@asynccontextmanager
+async def book_repository_scope() -> AsyncIterator[IBookRepository]:
+    async with AsyncSessionLocal() as session:
+        yield BookRepository(session)
+
+
+async def get_book_repository_scope() -> Callable[[], AsyncContextManager[IBookRepository]]:
+    """Provide a factory of book repositories owning their own session.
+
+    Request-scoped sessions can be closed before a streamed response body is produced,
+    so work that outlives the endpoint function opens its session through this scope.
+    """
+    return book_repository_scope
+
+
 async def get_review_repository(
     session: AsyncSession = Depends(get_session),
 ) -> IReviewRepository:
@@ -31,13 +55,19 @@ async def get_review_repository(
 
 async def get_review_service(
     review_repository: IReviewRepository = Depends(get_review_repository),
-    user_repository: IUserRepository = Depends(get_user_repository),
     book_repository: IBookRepository = Depends(get_book_repository),
+    book_cache: IBookCacheService = Depends(get_book_cache_service),
 ) -> ReviewService:
-    return ReviewService(review_repository, user_repository, book_repository)
+    return ReviewService(review_repository, book_repository, book_cache)
 
 
 async def get_tags_repository(
     session: AsyncSession = Depends(get_session),
 ) -> ITagRepository:
     return TagRepository(session)
+
+
+async def get_book_import_service(
+    book_repository: IBookRepository = Depends(get_book_repository),
+) -> BookImportService:
+    return BookImportService(book_repository)
@@ -1,21 +1,56 @@
 from src.domain.services.blocklist_token_interface import IBlocklistTokenService
+from src.domain.services.book_cache_interface import IBookCacheService
 from src.domain.services.password_interface import IPasswordService
+from src.domain.services.principal_cache_interface import IPrincipalCacheService
+from src.domain.services.rate_limiter_interface import IRateLimiterService
 from src.domain.services.token_interface import ITokenService
 from src.infrastructure.service.auth.blocklist_token_management import BlocklistTokenService
+from src.infrastructure.service.auth.claims_cache import VerifiedClaimsCache
 from src.infrastructure.service.auth.password_management import PasswordService
+from src.infrastructure.service.auth.rate_limiter import RateLimiterService
 from src.infrastructure.service.auth.token_management import TokenService
+from src.infrastructure.service.cache.book_cache import BookCacheService
+from src.infrastructure.service.cache.principal_cache import PrincipalCacheService
+
+# shared by every request so the Redis connection pool is reused
+book_cache_service = BookCacheService()
+# per process: every request of a worker shares its authenticated users
+principal_cache_service = PrincipalCacheService()
+# per process: its listener keeps the worker's copy of the revoked tokens in sync
+blocklist_token_service = BlocklistTokenService()
+# per process: a token is verified once, not on each request presenting it
+verified_claims_cache = VerifiedClaimsCache()
+# per process: its worker threads bound how many passwords are hashed at once
+password_service = PasswordService()
+# shared by every request, the budgets themselves live in Redis
+rate_limiter_service = RateLimiterService()
 
 
 def get_password_service() -> IPasswordService:
-    """Provide PasswordService instance for dependency injection."""
-    return PasswordService()
+    """Provide the shared PasswordService instance for dependency injection."""
+    return password_service
 
 
 def get_token_service() -> ITokenService:
     """Provide TokenService instance for dependency injection."""
-    return TokenService()
+    return TokenService(claims_cache=verified_claims_cache)
 
 
 def get_blocklist_token_service() -> IBlocklistTokenService:
-    """Provide TokenService instance for dependency injection."""
-    return BlocklistTokenService()
+    """Provide the shared BlocklistTokenService instance for dependency injection."""
+    return blocklist_token_service
+
+
+def get_book_cache_service() -> IBookCacheService:
+    """Provide the shared BookCacheService instance for dependency injection."""
+    return book_cache_service
+
+
+def get_principal_cache_service() -> IPrincipalCacheService:
+    """Provide the shared PrincipalCacheService instance for dependency injection."""
+    return principal_cache_service
+
+
+def get_rate_limiter_service() -> IRateLimiterService:
+    """Provide the shared RateLimiterService instance for dependency injection."""
+    return rate_limiter_service
@@ -0,0 +1,49 @@
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from config.settings import Config
+
+# one pooled client per process, shared by every service talking to Redis
+_redis_client: Optional[aioredis.Redis] = None
+
+
+def create_redis_client(redis_url: str = Config.REDIS_URL) -> aioredis.Redis:
+    """Build a Redis client over a bounded pool of reusable connections.
+
+    A request finding every connection busy waits up to REDIS_POOL_TIMEOUT seconds for one
+    instead of opening another; health checks replace connections that died while idle.
+    """
+    pool = aioredis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=Config.REDIS_MAX_CONNECTIONS,
+        timeout=Config.REDIS_POOL_TIMEOUT,
+        socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=Config.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=Config.REDIS_HEALTH_CHECK_INTERVAL,
+        decode_responses=True,
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def init_redis() -> aioredis.Redis:
+    """Create the shared client when the application starts and check that Redis answers."""
+    client = get_redis_client()
+    await client.ping()
+    return client
+
+
+def get_redis_client() -> aioredis.Redis:
+    """Provide the shared client, created on first use outside of the application lifespan."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = create_redis_client()
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close every pooled connection when the application stops."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
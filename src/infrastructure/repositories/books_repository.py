@@ -1,15 +1,132 @@
-from datetime import datetime
-from typing import List, Optional
+import uuid
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
+import asyncpg
 from fastapi import HTTPException
 from fastapi.exceptions import ResponseValidationError
+import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import (
+    Float,
+    String,
+    any_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, aggregate_order_by
 from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.domain.models.books import Book
+from config.settings import Config
+from src.application.errors import BookImportBatchRejected, BookVersionConflict, InvalidCursor
+from src.domain.models.book_rankings import (
+    LANGUAGE_SCOPE_PREFIX,
+    OVERALL_SCOPE,
+    TAG_SCOPE_PREFIX,
+    BookRanking,
+)
+from src.domain.models.book_tags import BookTag, Tag
+from src.domain.models.books import (
+    DEFAULT_SEARCH_CONFIG,
+    SEARCH_CONFIG_EXPRESSION,
+    SEARCH_CONFIGS,
+    Book,
+    language_aliases,
+    search_config_for,
+)
+from src.domain.models.reviews import Review
 from src.domain.repositories.book_repository_interface import IBookRepository
-from src.presentation.web.schemas.books import BookCreateModel, BookUpdateModel
+from src.infrastructure.repositories.pagination import decode_cursor, encode_cursor
+from src.presentation.web.schemas.books import (
+    BookCreateModel,
+    BookFacetsModel,
+    BookFilterModel,
+    BookLeaderboardModel,
+    BookRankingModel,
+    BookUpdateModel,
+    FacetCountModel,
+)
+
+# Columns of the Book list DTO. Selecting them instead of the entity skips the identity map
+# and the selectin loads of reviews and tags, which list endpoints never serialize.
+BOOK_LIST_COLUMNS = (
+    Book.uid,
+    Book.title,
+    Book.author,
+    Book.publisher,
+    Book.published_date,
+    Book.page_count,
+    Book.language,
+    Book.created_at,
+    Book.updated_at,
+    Book.version,
+)
+
+# Columns written by bulk imports, anything else falls back to its server default
+BOOK_COPY_COLUMNS = (
+    "uid",
+    "user_uid",
+    "title",
+    "author",
+    "publisher",
+    "published_date",
+    "page_count",
+    "language",
+    "created_at",
+    "updated_at",
+)
+
+
+# key of the advisory lock serializing rankings refreshes across workers
+BOOK_RANKINGS_LOCK_KEY = 0x626F6F6B72616E6B  # "bookrank"
+
+
+# sortable columns of the books list, with the parser restoring a value from a cursor;
+# each has a (column, uid) index so a filtered page is an ordered index range scan
+BOOK_SORT_KEYS = {
+    "created_at": (Book.created_at, datetime.fromisoformat),
+    "title": (Book.title, str),
+    "published_date": (Book.published_date, date.fromisoformat),
+}
+
+
+def _language_key(language):
+    """SQL of `language_key`, so the rankings are written under the scopes readers look up"""
+    lowered = func.lower(language)
+    spellings = {
+        spelling: config for code, config in SEARCH_CONFIGS.items() for spelling in (code, config)
+    }
+    return case(spellings, value=lowered, else_=lowered)
+
+
+def _filter_conditions(filters: BookFilterModel, exclude: Optional[str] = None) -> list:
+    """WHERE clauses of the list filters, `exclude` names a facet dropping its own filter"""
+    conditions = []
+    if filters.language is not None and exclude != "language":
+        conditions.append(Book.language == filters.language)
+    if filters.publisher is not None and exclude != "publisher":
+        conditions.append(Book.publisher == filters.publisher)
+    if filters.author is not None:
+        conditions.append(Book.author == filters.author)
+    if filters.published_from is not None:
+        conditions.append(Book.published_date >= filters.published_from)
+    if filters.published_to is not None:
+        conditions.append(Book.published_date <= filters.published_to)
+    if filters.min_pages is not None:
+        conditions.append(Book.page_count >= filters.min_pages)
+    if filters.max_pages is not None:
+        conditions.append(Book.page_count <= filters.max_pages)
+    return conditions
 
 
 class BookRepository(IBookRepository):
@@ -18,35 +135,172 @@ class BookRepository(IBookRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_all_books(self) -> List[Book]:
-        """Get a list of all books
+    async def get_all_books(
+        self, limit: int, cursor: Optional[str] = None, filters: Optional[BookFilterModel] = None
+    ) -> Tuple[List[Book], Optional[str]]:
+        """Get a filtered page of books, newest first unless another order is requested
+        Args:
+            limit (int): maximum number of books on the page
+            cursor (str): next_cursor of the previous page, None for the first page
+            filters (BookFilterModel): filters and sort order, None for the whole catalog
         Returns:
-            list: list of books
+            tuple: list of book rows (list columns only) and the cursor of the next page
+            (None on the last page)
         """
-        statement = select(Book).order_by(desc(Book.created_at))
+        filters = filters or BookFilterModel()
+        sort_column, parse_sort_value = BOOK_SORT_KEYS[filters.sort]
+        sort_key = tuple_(sort_column, Book.uid)
+        cursor_key = f"{filters.sort}.{filters.order}"
+
+        statement = select(*BOOK_LIST_COLUMNS).where(*_filter_conditions(filters))
+        if filters.order == "desc":
+            statement = statement.order_by(desc(sort_column), desc(Book.uid))
+        else:
+            statement = statement.order_by(sort_column, Book.uid)
+        if cursor is not None:
+            key, sort_value, uid = decode_cursor(cursor, str, parse_sort_value, UUID)
+            if key != cursor_key:
+                raise InvalidCursor()
+            after = tuple_(sort_value, uid)
+            statement = statement.where(
+                sort_key < after if filters.order == "desc" else sort_key > after
+            )
+        # one extra row tells whether there is a next page without a COUNT
+        statement = statement.limit(limit + 1)
         try:
             result = await self.session.exec(statement)
 
         except ResponseValidationError as val_error:
             print(f"Validation error: {val_error}")
-            return []
+            return [], None
         except HTTPException as http_error:
             print(f"HTTP error: {http_error}")
-            return []
+            return [], None
         except Exception as e:
             print(f"An error occurred: {e}")
-            return []
+            return [], None
 
-        return result.all()
+        books = result.all()
+        if len(books) <= limit:
+            return books, None
+
+        books = books[:limit]
+        last = books[-1]
+        return books, encode_cursor((cursor_key, getattr(last, filters.sort), last.uid))
+
+    async def get_book_facets(
+        self, filters: Optional[BookFilterModel] = None, limit: int = Config.BOOK_FACET_LIMIT
+    ) -> BookFacetsModel:
+        """Count books per language and per publisher in one statement
+        Args:
+            filters (BookFilterModel): active filters; each facet ignores its own
+            limit (int): maximum number of values per facet, most frequent first
+        Returns:
+            BookFacetsModel: value counts of each facet
+        """
+        filters = filters or BookFilterModel()
+        count = func.count().label("count")
+        facets = [
+            select(literal(name).label("facet"), column.label("value"), count)
+            .where(*_filter_conditions(filters, exclude=name))
+            .group_by(column)
+            .order_by(desc(count), column)
+            .limit(limit)
+            .subquery()
+            for name, column in (("language", Book.language), ("publisher", Book.publisher))
+        ]
+        statement = union_all(*(select(facet) for facet in facets))
+
+        result = await self.session.exec(statement)
+
+        counts = {"language": [], "publisher": []}
+        for facet, value, value_count in result.all():
+            counts[facet].append(FacetCountModel(value=value, count=value_count))
+        return BookFacetsModel(**counts)
+
+    async def search_books(
+        self, query: str, limit: int, cursor: Optional[str] = None, language: Optional[str] = None
+    ) -> Tuple[List[Book], Optional[str]]:
+        """Full-text search over title, author and publisher, best match first
+        Args:
+            query (str): web search syntax: words, "quoted phrases", OR, -excluded
+            limit (int): maximum number of books on the page
+            cursor (str): next_cursor of the previous page, None for the first page
+            language (str): restrict the search to books in this language, given as ISO code
+                or configuration name in any case
+        Returns:
+            tuple: list of book rows (list columns only) and the cursor of the next page
+            (None on the last page)
+        """
+        search_vector = Book.__table__.c.search_vector
+
+        if language is not None:
+            config = cast(search_config_for(language), REGCONFIG)
+            row_query = func.websearch_to_tsquery(config, query)
+            index_query = row_query
+        else:
+            # each book is indexed with the configuration of its own language: the GIN index is
+            # probed with the query parsed by every configuration OR-ed together (a superset),
+            # then each row is rechecked against the query parsed with its own configuration
+            row_config = literal_column(SEARCH_CONFIG_EXPRESSION, REGCONFIG)
+            row_query = func.websearch_to_tsquery(row_config, query)
+            configs = sorted({*SEARCH_CONFIGS.values(), DEFAULT_SEARCH_CONFIG})
+            index_query = func.websearch_to_tsquery(cast(configs[0], REGCONFIG), query)
+            for config in configs[1:]:
+                index_query = index_query.op("||")(
+                    func.websearch_to_tsquery(cast(config, REGCONFIG), query)
+                )
+
+        rank = func.ts_rank_cd(search_vector, row_query).label("rank")
+        statement = (
+            select(*BOOK_LIST_COLUMNS, rank)
+            .where(search_vector.bool_op("@@")(index_query))
+            .order_by(desc(rank), desc(Book.uid))
+        )
+        if index_query is not row_query:
+            statement = statement.where(search_vector.bool_op("@@")(row_query))
+        if language is not None:
+            # "EN", "en" and "english" name the same language, as they do for the configuration
+            statement = statement.where(func.lower(Book.language).in_(language_aliases(language)))
+        if cursor is not None:
+            last_rank, uid = decode_cursor(cursor, float, UUID)
+            statement = statement.where(tuple_(rank, Book.uid) < tuple_(last_rank, uid))
+        statement = statement.limit(limit + 1)
+
+        result = await self.session.exec(statement)
+        books = result.all()
+        if len(books) <= limit:
+            return books, None
+
+        books = books[:limit]
+        last = books[-1]
+        return books, encode_cursor((last.rank, last.uid))
+
+    async def stream_books(self, batch_size: int) -> AsyncIterator[Sequence[Book]]:
+        """Iterate over the whole catalog through a server-side cursor
+        Args:
+            batch_size (int): rows fetched from the cursor per round trip
+        Returns:
+            AsyncIterator: batches of book rows (list columns only), in no particular order
+        """
+        # no ORDER BY: the scan starts returning rows at once instead of sorting the table first
+        statement = select(*BOOK_LIST_COLUMNS).execution_options(yield_per=batch_size)
+        result = await self.session.stream(statement)
+        async for partition in result.partitions():
+            yield partition
 
     async def get_user_books(self, user_uid: UUID) -> List[Book]:
         """Get a list of books for a user
         Args:
             user_uid (str): link user to book
         Returns:
-            list: list of user books
+            list: list of user book rows (list columns only)
         """
-        statement = select(Book).where(Book.user_uid == user_uid).order_by(desc(Book.created_at))
+        statement = (
+            select(*BOOK_LIST_COLUMNS)
+            .where(Book.user_uid == user_uid)
+            .order_by(desc(Book.created_at))
+        )
 
         result = await self.session.exec(statement)
 
@@ -79,6 +333,48 @@ class BookRepository(IBookRepository):
 
         return new_book
 
+    async def bulk_create_books(self, books_data: List[BookCreateModel], user_uid: UUID) -> int:
+        """Insert many books in one COPY round trip and commit them
+        Args:
+            books_data (list): validated books to create
+            user_uid (UUID): link user to the books
+        Returns:
+            int: number of books created
+        Raises:
+            BookImportBatchRejected: If the database rejects a row, the batch is rolled back
+        """
+        now = datetime.now()
+        records = [
+            (
+                uuid.uuid4(),
+                user_uid,
+                book_data.title,
+                book_data.author,
+                book_data.publisher,
+                date.fromisoformat(book_data.published_date),
+                book_data.page_count,
+                book_data.language,
+                now,
+                now,
+            )
+            for book_data in books_data
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(
+                Book.__tablename__, records=records, columns=BOOK_COPY_COLUMNS
+            )
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, ValueError, OverflowError) as error:
+            # COPY runs on the driver connection: neither server errors nor values the driver
+            # cannot encode (e.g. an int out of int32 range) are wrapped by SQLAlchemy
+            await self.session.rollback()
+            raise BookImportBatchRejected(str(error)) from error
+        await self.session.commit()
+
+        return len(records)
+
     async def get_book(self, book_id: UUID) -> Optional[Book]:
         """Get a book by id
         Args:
@@ -92,49 +388,259 @@ class BookRepository(IBookRepository):
 
         return book if book is not None else None
 
-    async def update_book(self, book_uid: UUID, update_data: BookUpdateModel) -> Optional[Book]:
-        """Update book by id
-         Args:
+    async def get_books_by_uids(self, book_uids: Sequence[UUID]) -> List[Book]:
+        """Get many books by uid in one query
+        Args:
+            book_uids (list): uids to look up
+        Returns:
+            list: rows (list columns only) of the books that exist, in no particular order
+        """
+        # one array parameter keeps a single prepared statement whatever the number of uids
+        uids = bindparam("book_uids", list(book_uids), type_=pg.ARRAY(pg.UUID(as_uuid=True)))
+        statement = select(*BOOK_LIST_COLUMNS).where(Book.uid == any_(uids))
+
+        result = await self.session.exec(statement)
+
+        return result.all()
+
+    async def get_book_fingerprint(self, book_uid: UUID) -> Optional[Tuple]:
+        """Get the values a book detail representation changes with, without loading it
+        Args:
             book_uid (UUID)
-            update_data (BookUpdateModel)
         Returns:
-            Book: the book or None
+            tuple: book version and updated_at, review count and last review update, tag list;
+            None if missing
         """
-        book_to_update = await self.get_book(book_uid)
+        review_count = select(func.count()).where(Review.book_uid == Book.uid).scalar_subquery()
+        last_review_update = (
+            select(func.max(Review.updated_at)).where(Review.book_uid == Book.uid).scalar_subquery()
+        )
+        tag_list = (
+            select(
+                func.string_agg(
+                    cast(Tag.uid, String) + ":" + Tag.name,
+                    aggregate_order_by(literal(","), Tag.uid),
+                )
+            )
+            .join(BookTag, BookTag.tag_uid == Tag.uid)
+            .where(BookTag.book_uid == Book.uid)
+            .scalar_subquery()
+        )
+        statement = select(
+            Book.version, Book.updated_at, review_count, last_review_update, tag_list
+        ).where(Book.uid == book_uid)
+        result = await self.session.exec(statement)
+        fingerprint = result.first()
 
-        if book_to_update is not None:
-            update_data_dict = update_data.model_dump()
+        return tuple(fingerprint) if fingerprint is not None else None
 
-            for key, value in update_data_dict.items():
-                if key == "published_date":
-                    value = datetime.strptime(value, "%Y-%m-%d")
-                setattr(book_to_update, key, value)
-            book_to_update.updated_at = datetime.now()
+    async def update_book(
+        self, book_uid: UUID, update_data: BookUpdateModel, versions: Optional[Set[int]] = None
+    ) -> Optional[Book]:
+        """Update the fields sent for a book with a single compare-and-swap UPDATE ... RETURNING
+         Args:
+            book_uid (UUID)
+            update_data (BookUpdateModel): only the fields set by the client are written
+            versions (set): versions the client expects the book to be at, None for any
+        Returns:
+            Book: the updated book row (list columns only) or None
+        Raises:
+            BookVersionConflict: if the book exists at another version
+        """
+        values = update_data.model_dump(exclude_unset=True)
+        if "published_date" in values:
+            values["published_date"] = date.fromisoformat(values["published_date"])
+        values["updated_at"] = datetime.now()
+        values["version"] = Book.version + 1
 
-            await self.session.commit()
+        statement = update(Book).where(Book.uid == book_uid)
+        if versions is not None:
+            statement = statement.where(Book.version.in_(versions))
+        statement = (
+            statement.values(**values)
+            .returning(*BOOK_LIST_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.exec(statement)
+        updated_book = result.first()
+
+        await self.session.commit()
 
-            return book_to_update
+        if updated_book is None and versions is not None:
+            # only a failed precondition pays for telling a conflict from a missing book
+            result = await self.session.exec(select(Book.uid).where(Book.uid == book_uid))
+            if result.first() is not None:
+                raise BookVersionConflict()
 
-        return None
+        return updated_book
 
     async def delete_book(self, book_id: UUID) -> bool:
-        """Delete book by id
+        """Delete book by id in one statement
         Args:
             book_id (UUID)
         Returns:
             bool: Turn True on success, False otherwise
         """
-        try:
-            book_to_delete = await self.get_book(book_id)
-            if book_to_delete is not None:
-                await self.session.delete(book_to_delete)
-                await self.session.commit()
-                return True
+        # same effect as deleting the loaded entity: its tag links go away and its reviews
+        # are detached; foreign keys are checked at the end of the statement
+        untag = delete(BookTag).where(BookTag.book_uid == book_id).cte("untag")
+        detach_reviews = (
+            update(Review)
+            .where(Review.book_uid == book_id)
+            .values(book_uid=None)
+            .cte("detach_reviews")
+        )
+        statement = (
+            delete(Book)
+            .where(Book.uid == book_id)
+            .returning(Book.uid)
+            .add_cte(untag)
+            .add_cte(detach_reviews)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.exec(statement)
+        deleted_uid = result.scalar_one_or_none()
 
-            return False
-        except HTTPException as http_error:
-            print("HTTP error:", http_error)
-            return False  # Or handle differently as per your application's needs
-        except Exception as e:
-            print("An error occurred:", e)
-            return False
+        await self.session.commit()
+
+        return deleted_uid is not None
+
+    async def get_leaderboard(
+        self, scope: str, limit: int, cursor: Optional[str] = None
+    ) -> BookLeaderboardModel:
+        """Get a page of a leaderboard from the rankings snapshot
+        Args:
+            scope (str): leaderboard scope, see `ranking_scope`
+            limit (int): maximum number of entries on the page
+            cursor (str): next_cursor of the previous page, None for the first page
+        Returns:
+            BookLeaderboardModel: entries in rank order and the cursor of the next page
+        """
+        # (scope, rank) is the primary key: a page is a range scan plus limit book lookups
+        statement = (
+            select(
+                BookRanking.rank,
+                BookRanking.score,
+                BookRanking.average_rating,
+                BookRanking.review_count,
+                BookRanking.computed_at,
+                *BOOK_LIST_COLUMNS,
+            )
+            .join(Book, Book.uid == BookRanking.book_uid)
+            .where(BookRanking.scope == scope)
+            .order_by(BookRanking.rank)
+        )
+        if cursor is not None:
+            cursor_scope, rank = decode_cursor(cursor, str, int)
+            if cursor_scope != scope:
+                raise InvalidCursor()
+            statement = statement.where(BookRanking.rank > rank)
+        result = await self.session.exec(statement.limit(limit + 1))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor((scope, rows[-1].rank))
+
+        return BookLeaderboardModel(
+            items=[
+                BookRankingModel(
+                    rank=row.rank,
+                    score=row.score,
+                    average_rating=row.average_rating,
+                    review_count=row.review_count,
+                    book=row,
+                )
+                for row in rows
+            ],
+            next_cursor=next_cursor,
+            computed_at=rows[0].computed_at if rows else None,
+        )
+
+    async def refresh_rankings(
+        self, size: int, prior_weight: int, min_reviews: int, min_interval: timedelta
+    ) -> Optional[int]:
+        """Rebuild every leaderboard in the rankings snapshot with one INSERT ... SELECT
+        Args:
+            size (int): number of books kept per leaderboard
+            prior_weight (int): number of reviews at the catalog average every book starts with
+            min_reviews (int): books with fewer reviews are not ranked
+            min_interval (timedelta): keep a snapshot that is younger than this
+        Returns:
+            int: number of rankings written, None if the refresh was left to another worker
+        """
+        # workers share the schedule: the first one to take the lock refreshes, the others
+        # find the lock taken or the snapshot fresh
+        result = await self.session.exec(
+            select(func.pg_try_advisory_xact_lock(BOOK_RANKINGS_LOCK_KEY))
+        )
+        if not result.one():
+            await self.session.rollback()
+            return None
+        now = datetime.now()
+        result = await self.session.exec(select(func.max(BookRanking.computed_at)))
+        computed_at = result.one()
+        if computed_at is not None and now - computed_at < min_interval:
+            await self.session.rollback()
+            return None
+
+        # Bayesian average: every book starts with prior_weight reviews at the catalog mean,
+        # so a few perfect ratings do not outrank many good ones. It is computed from the
+        # per-book aggregates, reviews are never scanned.
+        catalog_mean = select(
+            func.coalesce(
+                cast(func.sum(Book.rating_sum), Float)
+                / func.nullif(func.sum(Book.review_count), 0),
+                0.0,
+            )
+        ).scalar_subquery()
+        scored = (
+            select(
+                Book.uid.label("book_uid"),
+                _language_key(Book.language).label("language"),
+                Book.review_count,
+                (
+                    (prior_weight * catalog_mean + Book.rating_sum)
+                    / (prior_weight + Book.review_count)
+                ).label("score"),
+                func.coalesce(
+                    cast(Book.rating_sum, Float) / func.nullif(Book.review_count, 0), 0.0
+                ).label("average_rating"),
+            )
+            .where(Book.review_count >= min_reviews)
+            .cte("scored")
+        )
+        entry = (scored.c.book_uid, scored.c.score, scored.c.review_count, scored.c.average_rating)
+        scoped = union_all(
+            select(literal(OVERALL_SCOPE).label("scope"), *entry),
+            select(literal(LANGUAGE_SCOPE_PREFIX) + scored.c.language, *entry),
+            select(literal(TAG_SCOPE_PREFIX) + cast(BookTag.tag_uid, String), *entry).join(
+                BookTag, BookTag.book_uid == scored.c.book_uid
+            ),
+        ).subquery("scoped")
+        ranked = select(
+            *scoped.c,
+            func.row_number()
+            .over(
+                partition_by=scoped.c.scope,
+                order_by=(desc(scoped.c.score), desc(scoped.c.review_count), scoped.c.book_uid),
+            )
+            .label("rank"),
+        ).subquery("ranked")
+        rankings = select(
+            ranked.c.scope,
+            ranked.c.rank,
+            ranked.c.book_uid,
+            ranked.c.score,
+            ranked.c.review_count,
+            ranked.c.average_rating,
+            literal(now, pg.TIMESTAMP),
+        ).where(ranked.c.rank <= size)
+
+        # readers keep seeing the previous snapshot until the commit
+        await self.session.exec(delete(BookRanking))
+        columns = [column.name for column in BookRanking.__table__.columns]
+        result = await self.session.exec(insert(BookRanking).from_select(columns, rankings))
+        await self.session.commit()
+        return result.rowcount
@@ -0,0 +1,37 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Sequence, Tuple
+
+from src.application.errors import InvalidCursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor
+    Args:
+        values: sort key columns in ORDER BY order, e.g. (created_at, uid)
+    Returns:
+        str: url-safe cursor to be passed back as the `cursor` query parameter
+    """
+    payload = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> Tuple[Any, ...]:
+    """Decode a cursor produced by `encode_cursor`
+    Args:
+        cursor: opaque cursor received from the client
+        parsers: one callable per sort key column restoring its python type
+    Returns:
+        tuple: parsed sort key values
+    Raises:
+        InvalidCursor: if the cursor cannot be decoded or does not match the sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise InvalidCursor()
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise InvalidCursor() from error
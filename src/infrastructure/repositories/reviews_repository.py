@@ -1,14 +1,84 @@
+import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func
+import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import (
+    BigInteger,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    false,
+    func,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.domain.models.reviews import Review
-from src.domain.repositories.reviews_repository_interface import IReviewRepository
-from src.presentation.web.schemas.reviews import ReviewCreateModel, ReviewUpdateModel
+from src.application.errors import BookNotFound, UserNotFound
+from src.domain.models.books import Book
+from src.domain.models.reviews import REVIEW_SEARCH_CONFIG, Review
+from src.domain.repositories.reviews_repository_interface import IReviewRepository, ReviewTotal
+from src.infrastructure.repositories.pagination import decode_cursor, encode_cursor
+from src.presentation.web.schemas.reviews import (
+    BookRatingStatsModel,
+    ReviewCreateModel,
+    ReviewUpdateModel,
+)
+
+FOREIGN_KEY_VIOLATION = "23503"
+
+# rating -> histogram bucket column on books
+RATING_BUCKETS = {rating: getattr(Book, f"rating_{rating}_count") for rating in range(1, 6)}
+RATING_STATS_COLUMNS = (Book.uid, Book.review_count, Book.rating_sum, *RATING_BUCKETS.values())
+
+PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+
+
+def _update_rating_aggregates(
+    book_uid: UUID, added: Optional[int] = None, removed: Optional[int] = None
+):
+    """UPDATE of a book's rating aggregates for a rating added to and/or removed from it"""
+    count_delta = int(added is not None) - int(removed is not None)
+    values = {
+        Book.review_count: Book.review_count + count_delta,
+        Book.rating_sum: Book.rating_sum + (added or 0) - (removed or 0),
+    }
+    if added in RATING_BUCKETS:
+        values[RATING_BUCKETS[added]] = RATING_BUCKETS[added] + 1
+    if removed in RATING_BUCKETS:
+        bucket = RATING_BUCKETS[removed]
+        values[bucket] = values.get(bucket, bucket) - 1
+    return update(Book).where(Book.uid == book_uid).values(values)
+
+
+def _review_count(conditions: list):
+    """Exact number of reviews matching the conditions, as a scalar subquery"""
+    return select(func.count()).select_from(Review).where(*conditions).scalar_subquery()
+
+
+def _estimated_review_count():
+    """Planner's row estimate of the reviews table, the exact count until it was analyzed
+
+    Counting every review is a full scan; the estimate is maintained by (auto)vacuum and
+    analyze and is close enough for the page count of an admin listing.
+    Returns the count and whether it is the estimate, as scalar subquery expressions.
+    """
+    estimate = (
+        select(cast(PG_CLASS.c.reltuples, BigInteger))
+        .where(PG_CLASS.c.oid == cast(Review.__tablename__, pg.REGCLASS))
+        .scalar_subquery()
+    )
+    # reltuples is -1 for a table that has never been vacuumed or analyzed
+    return case((estimate >= 0, estimate), else_=_review_count([])), estimate >= 0
 
 
 class ReviewRepository(IReviewRepository):
@@ -19,16 +89,61 @@ class ReviewRepository(IReviewRepository):
 
     async def create_review(
         self, review_data: ReviewCreateModel, user_uid: UUID, book_uid: UUID
-    ) -> Review:
-        """Create a new review"""
-        review_dict = review_data.model_dump()
-        new_review = Review(**review_dict, user_uid=user_uid, book_uid=book_uid)
+    ) -> Optional[Review]:
+        """Create a review and count it in the book's aggregates in one statement
 
-        self.session.add(new_review)
-        await self.session.commit()
-        await self.session.refresh(new_review)
+        Returns None if the user has already reviewed the book.
+        Raises BookNotFound (or UserNotFound) if the foreign key is violated.
+        """
+        now = datetime.now()
+        new_review = (
+            pg_insert(Review)
+            .values(
+                uid=uuid.uuid4(),
+                **review_data.model_dump(),
+                user_uid=user_uid,
+                book_uid=book_uid,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=[Review.user_uid, Review.book_uid])
+            # mapped columns only, the search vector stays in the database
+            .returning(*Review.__mapper__.columns)
+            .cte("new_review")
+        )
+        # runs only when the insert did: a conflict leaves the aggregates alone
+        aggregates = (
+            _update_rating_aggregates(book_uid, added=review_data.rating)
+            .where(Book.uid.in_(select(new_review.c.book_uid)))
+            .cte("rating_aggregates")
+        )
+        statement = select(*new_review.c).add_cte(aggregates)
 
-        return new_review
+        try:
+            result = await self.session.exec(statement)
+            created = result.first()
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.session.rollback()
+            if getattr(error.orig, "sqlstate", None) != FOREIGN_KEY_VIOLATION:
+                raise
+            constraint = getattr(error.orig.__cause__, "constraint_name", None) or ""
+            if "user_uid" in constraint:
+                raise UserNotFound() from error
+            raise BookNotFound() from error
+
+        return created
+
+    async def _lock_review(self, review_uid: UUID) -> Optional[Review]:
+        """Load a review with a row lock, so its old rating is exact until commit"""
+        statement = (
+            select(Review)
+            .where(Review.uid == review_uid)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.exec(statement)
+        return result.first()
 
     async def get_review_by_uid(self, review_uid: UUID) -> Optional[Review]:
         """Get a review by its UID"""
@@ -36,49 +151,133 @@ class ReviewRepository(IReviewRepository):
         result = await self.session.exec(statement)
         return result.first()
 
-    async def get_all_reviews(self, limit: int = 100, offset: int = 0) -> List[Review]:
-        """Get all reviews with pagination"""
-        statement = select(Review).order_by(desc(Review.created_at)).limit(limit).offset(offset)
-        result = await self.session.exec(statement)
-        return result.all()
+    async def _get_review_page(
+        self,
+        conditions: list,
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool = False,
+        estimate_total: bool = False,
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Keyset page of reviews, newest first: cost does not grow with the page depth
 
-    async def get_reviews_by_book(
-        self, book_uid: UUID, limit: int = 100, offset: int = 0
-    ) -> List[Review]:
-        """Get all reviews for a specific book"""
+        The total, when requested, rides along in the page query as an uncorrelated scalar
+        subquery that Postgres evaluates once, so it costs no extra round trip.
+        """
+        total = estimated = None
+        if include_total:
+            if estimate_total:
+                total, estimated = _estimated_review_count()
+            else:
+                total, estimated = _review_count(conditions), false()
+
+        columns = (Review,)
+        if total is not None:
+            columns += (total.label("total"), estimated.label("total_estimated"))
         statement = (
-            select(Review)
-            .where(Review.book_uid == book_uid)
-            .order_by(desc(Review.created_at))
-            .limit(limit)
-            .offset(offset)
+            select(*columns).where(*conditions).order_by(desc(Review.created_at), desc(Review.uid))
+        )
+        if cursor is not None:
+            created_at, uid = decode_cursor(cursor, datetime.fromisoformat, UUID)
+            statement = statement.where(
+                tuple_(Review.created_at, Review.uid) < tuple_(created_at, uid)
+            )
+        # one extra row tells whether there is a next page without a COUNT
+        result = await self.session.exec(statement.limit(limit + 1))
+        rows = result.all()
+
+        row_count = None
+        if total is not None:
+            if rows:
+                row_count = ReviewTotal(rows[0].total, rows[0].total_estimated)
+            elif cursor is None:
+                row_count = ReviewTotal(0, False)
+            else:
+                # past the last row nothing carries the total, only then it is a query of its own
+                result = await self.session.exec(select(total, estimated))
+                row_count = ReviewTotal(*result.one())
+            rows = [review for review, *_ in rows]
+
+        if len(rows) <= limit:
+            return rows, None, row_count
+
+        reviews = rows[:limit]
+        last = reviews[-1]
+        return reviews, encode_cursor((last.created_at, last.uid)), row_count
+
+    async def get_all_reviews(
+        self, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of all reviews, newest first, with the estimated total on request"""
+        return await self._get_review_page(
+            [], limit, cursor, include_total=include_total, estimate_total=True
+        )
+
+    async def get_reviews_by_book(
+        self, book_uid: UUID, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of the reviews of a specific book, newest first, with the total on request"""
+        return await self._get_review_page(
+            [Review.book_uid == book_uid], limit, cursor, include_total=include_total
         )
-        result = await self.session.exec(statement)
-        return result.all()
 
     async def get_reviews_by_user(
-        self, user_uid: UUID, limit: int = 100, offset: int = 0
-    ) -> List[Review]:
-        """Get all reviews by a specific user"""
+        self, user_uid: UUID, limit: int, cursor: Optional[str] = None, include_total: bool = False
+    ) -> Tuple[List[Review], Optional[str], Optional[ReviewTotal]]:
+        """Get a page of the reviews by a specific user, newest first, with the total on request"""
+        return await self._get_review_page(
+            [Review.user_uid == user_uid], limit, cursor, include_total=include_total
+        )
+
+    async def search_book_reviews(
+        self,
+        book_uid: UUID,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        min_rating: Optional[int] = None,
+        max_rating: Optional[int] = None,
+    ) -> Tuple[List[Review], Optional[str]]:
+        """Full-text search in the reviews of a book, best match first
+
+        `query` uses the web search syntax: words, "quoted phrases", OR, -excluded.
+        """
+        search_vector = Review.__table__.c.search_vector
+        ts_query = func.websearch_to_tsquery(cast(REVIEW_SEARCH_CONFIG, REGCONFIG), query)
+        rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+
         statement = (
-            select(Review)
-            .where(Review.user_uid == user_uid)
-            .order_by(desc(Review.created_at))
-            .limit(limit)
-            .offset(offset)
+            select(Review, rank)
+            .where(Review.book_uid == book_uid, search_vector.bool_op("@@")(ts_query))
+            .order_by(desc(rank), desc(Review.uid))
         )
-        result = await self.session.exec(statement)
-        return result.all()
+        if min_rating is not None:
+            statement = statement.where(Review.rating >= min_rating)
+        if max_rating is not None:
+            statement = statement.where(Review.rating <= max_rating)
+        if cursor is not None:
+            last_rank, uid = decode_cursor(cursor, float, UUID)
+            statement = statement.where(tuple_(rank, Review.uid) < tuple_(last_rank, uid))
+
+        result = await self.session.exec(statement.limit(limit + 1))
+        rows = result.all()
+        reviews = [review for review, _ in rows[:limit]]
+        if len(rows) <= limit:
+            return reviews, None
+
+        _, last_rank = rows[limit - 1]
+        return reviews, encode_cursor((last_rank, reviews[-1].uid))
 
     async def update_review(
         self, review_uid: UUID, review_data: ReviewUpdateModel
     ) -> Optional[Review]:
         """Update an existing review"""
-        review = await self.get_review_by_uid(review_uid)
+        review = await self._lock_review(review_uid)
 
         if not review:
             return None
 
+        previous_rating = review.rating
         update_data = review_data.model_dump(exclude_unset=True)
 
         for key, value in update_data.items():
@@ -87,6 +286,12 @@ class ReviewRepository(IReviewRepository):
         review.updated_at = datetime.now()
 
         self.session.add(review)
+        if review.book_uid is not None and review.rating != previous_rating:
+            await self.session.exec(
+                _update_rating_aggregates(
+                    review.book_uid, added=review.rating, removed=previous_rating
+                )
+            )
         await self.session.commit()
         await self.session.refresh(review)
 
@@ -94,29 +299,42 @@ class ReviewRepository(IReviewRepository):
 
     async def delete_review(self, review_uid: UUID) -> bool:
         """Delete a review by UID"""
-        review = await self.get_review_by_uid(review_uid)
+        review = await self._lock_review(review_uid)
 
         if not review:
             return False
 
         await self.session.delete(review)
+        if review.book_uid is not None:
+            await self.session.exec(
+                _update_rating_aggregates(review.book_uid, removed=review.rating)
+            )
         await self.session.commit()
 
         return True
 
-    async def user_has_reviewed_book(self, user_uid: UUID, book_uid: UUID) -> bool:
-        """Check if user has already reviewed a book"""
-        statement = select(Review).where(Review.user_uid == user_uid, Review.book_uid == book_uid)
-        result = await self.session.exec(statement)
-        return result.first() is not None
+    async def get_book_rating_stats(self, book_uid: UUID) -> Optional[BookRatingStatsModel]:
+        """Get rating statistics of a book from its aggregates, one primary-key lookup"""
+        stats = await self.get_books_rating_stats([book_uid])
+        return stats[0] if stats else None
 
-    async def get_average_rating_by_book(self, book_uid: UUID) -> Optional[float]:
-        """Get average rating for a book"""
-        statement = select(func.avg(Review.rating)).where(Review.book_uid == book_uid)
+    async def get_books_rating_stats(self, book_uids: List[UUID]) -> List[BookRatingStatsModel]:
+        """Get rating statistics of many books from their aggregates in one query"""
+        uids = bindparam("book_uids", list(book_uids), type_=pg.ARRAY(pg.UUID(as_uuid=True)))
+        statement = select(*RATING_STATS_COLUMNS).where(Book.uid == any_(uids))
         result = await self.session.exec(statement)
-        avg_rating = result.one()
 
-        return round(avg_rating, 2) if avg_rating else None
+        stats = []
+        for book_uid, review_count, rating_sum, *histogram in result.all():
+            stats.append(
+                BookRatingStatsModel(
+                    book_uid=book_uid,
+                    total_reviews=review_count,
+                    average_rating=round(rating_sum / review_count, 2) if review_count else 0.0,
+                    rating_histogram=dict(zip(RATING_BUCKETS, histogram)),
+                )
+            )
+        return stats
 
     async def review_exists(self, review_uid: UUID) -> bool:
         """Check if a review exists by UID"""
@@ -5,7 +5,7 @@ from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.application.errors import BookNotFound, TagAlreadyExists, TagNotFound
-from src.domain.models.book_tags import Tag
+from src.domain.models.book_tags import BookTag, Tag
 from src.domain.models.books import Book
 from src.domain.repositories.tags_repository_interface import ITagRepository
 from src.infrastructure.repositories.books_repository import BookRepository
@@ -62,6 +62,15 @@ class TagRepository(ITagRepository):
 
         return result.first()
 
+    async def get_tagged_book_uids(self, tag_uid: UUID) -> List[UUID]:
+        """Get uids of the books carrying a tag"""
+
+        statement = select(BookTag.book_uid).where(BookTag.tag_uid == tag_uid)
+
+        result = await self.session.exec(statement)
+
+        return result.all()
+
     async def add_tag(self, tag_data: TagCreateModel) -> Optional[Tag]:
         """Create a tag"""
 
@@ -101,7 +110,7 @@ class TagRepository(ITagRepository):
     async def delete_tag(self, tag_uid: UUID) -> bool:
         """Delete a tag"""
 
-        tag = self.get_tag_by_uid(tag_uid)
+        tag = await self.get_tag_by_uid(tag_uid)
 
         if not tag:
             raise TagNotFound()
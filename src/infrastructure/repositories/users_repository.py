@@ -1,14 +1,32 @@
+from typing import Optional
+from uuid import UUID
+
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.domain.models.principal import Principal
 from src.domain.models.users import User
 from src.domain.repositories.user_repository_interface import IUserRepository
 from src.domain.services.password_interface import IPasswordService
+from src.domain.services.principal_cache_interface import IPrincipalCacheService
 from src.presentation.web.schemas.users import UserCreateModel
 
 
 class UserRepository(IUserRepository):
 
+    def __init__(self, principal_cache: Optional[IPrincipalCacheService] = None):
+        self.principal_cache = principal_cache
+
+    async def get_principal(self, user_uid: UUID, session: AsyncSession) -> Optional[Principal]:
+        # four columns by primary key: no entity, no selectin loads of books and reviews
+        statement = select(User.uid, User.email, User.role, User.is_verified).where(
+            User.uid == user_uid
+        )
+        result = await session.exec(statement)
+        row = result.first()
+
+        return Principal(*row) if row is not None else None
+
     async def get_user_by_email(self, email: str, session: AsyncSession) -> User:
         statement = select(User).where(User.email == email)
         result = await session.exec(statement)
@@ -26,7 +44,7 @@ class UserRepository(IUserRepository):
     ) -> User:
         user_data_dict = user_data.model_dump()
         new_user = User(**user_data_dict)
-        new_user.password_hash = password_service.hash_password(user_data_dict["password"])
+        new_user.password_hash = await password_service.hash_password(user_data_dict["password"])
         session.add(new_user)
 
         await session.commit()
@@ -39,6 +57,7 @@ class UserRepository(IUserRepository):
         if user is not None:
             await session.delete(user)
             await session.commit()
+            self._invalidate_principal(user.uid)
             return True
         return False
 
@@ -47,5 +66,11 @@ class UserRepository(IUserRepository):
             setattr(user, key, value)
 
         await session.commit()
+        # role and verification status are checked on the cached principal
+        self._invalidate_principal(user.uid)
 
         return user
+
+    def _invalidate_principal(self, user_uid: UUID) -> None:
+        if self.principal_cache is not None:
+            self.principal_cache.invalidate_principal(user_uid)
@@ -1,37 +1,136 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Dict, Optional
+
 import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 from config.settings import Config
 from src.domain.services.blocklist_token_interface import IBlocklistTokenService
+from src.infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
 
 
 class BlocklistTokenService(IBlocklistTokenService):
     """
     Handles JWT token blocklist operations in Redis.
+
+    A revoked JTI is written in one transaction as a key expiring after JTI_EXPIRY (the
+    source of truth), as a member of a sorted set scored by its expiry (the snapshot a worker
+    starts from) and as a message on a channel (the updates keeping workers in sync).
+
+    While its listener is in sync, a worker answers `is_token_blocked` from its own set of
+    revoked JTIs without any I/O. Before the first sync and whenever the subscription is lost,
+    it asks Redis, so a revoked token is never let through for want of a message.
     """
 
-    def __init__(self, redis_url: str = Config.REDIS_URL, expiry: int = Config.JTI_EXPIRY):
-        self.redis_url = redis_url
+    CHANNEL = "token_blocklist:revoked"
+    EXPIRIES_KEY = "token_blocklist:expiries"
+    # the local set is pruned and checked against the snapshot this often
+    RESYNC_INTERVAL = 60
+    RETRY_DELAY = 1
+
+    def __init__(
+        self, redis_client: Optional[aioredis.Redis] = None, expiry: int = Config.JTI_EXPIRY
+    ):
         self.expiry = expiry
-        self._redis = None
+        self._redis = redis_client
+        # revoked jti -> expiry as a unix timestamp, trusted only while in sync
+        self._revoked: Dict[str, float] = {}
+        self._synced = False
+        self._listener: Optional[asyncio.Task] = None
 
     async def connect(self):
-        """Initialize Redis connection."""
+        """Use the shared Redis client unless one was given."""
         if self._redis is None:
-            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+            # its health checks let the subscription notice a dead connection and fall back
+            self._redis = get_redis_client()
 
     async def disconnect(self):
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.close()
-            self._redis = None
+        """Stop the listener and release the Redis client, its pool is closed by its owner."""
+        await self.stop_listener()
+        self._redis = None
+
+    def start_listener(self) -> None:
+        """Start keeping the local set of revoked JTIs in sync, from the running event loop."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """Stop the listener, checks go to Redis again."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._synced = False
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._sync()
+            except RedisError as error:
+                logger.warning(f"Token blocklist out of sync, checking Redis meanwhile: {error}")
+            await asyncio.sleep(self.RETRY_DELAY)
+
+    async def _load_snapshot(self) -> None:
+        now = time.time()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self.EXPIRIES_KEY, "-inf", now)
+            pipe.zrangebyscore(self.EXPIRIES_KEY, now, "+inf", withscores=True)
+            _, revoked = await pipe.execute()
+        snapshot = dict(revoked)
+        # keep what arrived while the snapshot was read, drop what has expired
+        for jti, expires_at in self._revoked.items():
+            if expires_at > now:
+                snapshot.setdefault(jti, expires_at)
+        self._revoked = snapshot
+
+    async def _sync(self) -> None:
+        await self.connect()
+        pubsub = self._redis.pubsub()
+        try:
+            # subscribed before the snapshot is read: every revocation is in one or the other
+            await pubsub.subscribe(self.CHANNEL)
+            while await pubsub.get_message(timeout=self.RESYNC_INTERVAL) is None:
+                pass
+            await self._load_snapshot()
+            self._synced = True
+
+            resync_at = time.monotonic() + self.RESYNC_INTERVAL
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.RESYNC_INTERVAL
+                )
+                if message is not None and message["type"] == "message":
+                    self._revoked[message["data"]] = time.time() + self.expiry
+                if time.monotonic() >= resync_at:
+                    await self._load_snapshot()
+                    resync_at = time.monotonic() + self.RESYNC_INTERVAL
+        finally:
+            self._synced = False
+            await pubsub.aclose()
 
     async def add_to_blocklist(self, jti: str) -> None:
-        """Add JTI to Redis blocklist with expiry."""
+        """Add JTI to Redis blocklist with expiry and notify every worker."""
         await self.connect()
-        await self._redis.set(name=jti, value="", ex=self.expiry)
+        expires_at = time.time() + self.expiry
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(name=jti, value="", ex=self.expiry)
+            pipe.zadd(self.EXPIRIES_KEY, {jti: expires_at})
+            pipe.publish(self.CHANNEL, jti)
+            await pipe.execute()
+        self._revoked[jti] = expires_at
 
     async def is_token_blocked(self, jti: str) -> bool:
-        """Check if token JTI exists in blocklist."""
+        """Check if token JTI is revoked: locally while in sync, in Redis otherwise."""
+        if self._synced:
+            expires_at = self._revoked.get(jti)
+            return expires_at is not None and expires_at > time.time()
+
         await self.connect()
         result = await self._redis.get(jti)
         return result is not None
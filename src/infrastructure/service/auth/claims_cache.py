@@ -0,0 +1,52 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from config.settings import Config
+
+
+class VerifiedClaimsCache:
+    """
+    LRU of the claims of JWTs whose signature has already been verified.
+
+    Entries are keyed by a hash of the raw token, so the cache holds no bearer credentials,
+    and expire at the token's `exp`. Only a valid token is ever cached: a tampered token
+    hashes to another key and goes through the full verification. Revocation is checked by
+    the caller on every request and is not affected.
+
+    Cached claims are shared by every request presenting the token and must not be mutated.
+    """
+
+    def __init__(self, max_size: int = Config.TOKEN_CLAIMS_CACHE_SIZE):
+        self.max_size = max_size
+        # token digest -> (exp as a unix timestamp, claims), least recently used first
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Return the verified claims of a token, None if unknown or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, token: str, claims: dict) -> None:
+        """Remember the claims of a token that passed verification until it expires."""
+        expires_at = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        self._entries[key] = (expires_at, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -1,18 +1,87 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
+from config.settings import Config
+from src.application.errors import PasswordHashingUnavailable
 from src.domain.services.password_interface import IPasswordService
 
+T = TypeVar("T")
+
 
 class PasswordService(IPasswordService):
-    """Handles password hashing and verification."""
+    """
+    Handles password hashing and verification on a bounded pool of worker threads.
+
+    bcrypt releases the GIL while hashing, so the event loop keeps serving other requests.
+    At most `workers` hashes run at once and `max_queue` more wait for a worker, any other
+    call is rejected at once with PasswordHashingUnavailable instead of queueing unbounded.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        workers: int = Config.PASSWORD_HASH_WORKERS,
+        max_queue: int = Config.PASSWORD_HASH_MAX_QUEUE,
+    ):
         self._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        if self._pending >= self.workers + self.max_queue:
+            self._rejected += 1
+            raise PasswordHashingUnavailable()
+
+        submitted = time.perf_counter()
 
-    def hash_password(self, password: str) -> str:
+        def job() -> Tuple[float, T]:
+            return time.perf_counter() - submitted, function(*args)
+
+        # counters are only touched on the event loop, the worker threads just report the wait.
+        # A hash keeps its slot until its thread is done, even if its request was cancelled.
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(job)
+        self._pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        queue_wait, result = await asyncio.wrap_future(future)
+        self._completed += 1
+        self._queue_wait_total += queue_wait
+        self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+        return result
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+    async def hash_password(self, password: str) -> str:
         """Generate bcrypt hash for a password."""
-        return self._context.hash(password)
+        return await self._run(self._context.hash, password)
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
         """Verify that a plain password matches the hashed one."""
-        return self._context.verify(password, hashed_password)
+        return await self._run(self._context.verify, password, hashed_password)
+
+    def get_stats(self) -> dict:
+        """Return the counters of this worker since it started."""
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._pending,
+            "queued": max(self._pending - self.workers, 0),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "queue_wait_avg": self._queue_wait_total / self._completed if self._completed else 0.0,
+            "queue_wait_max": self._queue_wait_max,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the running hashes are done."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,132 @@
+import logging
+import math
+from typing import Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from config.settings import Config
+from src.application.errors import RateLimitExceeded
+from src.domain.services.rate_limiter_interface import IRateLimiterService
+from src.infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Token buckets, one hash (tokens, updated) per key. KEYS are the buckets of one request,
+# ARGV their (capacity, period) pairs: a bucket refills capacity tokens per period seconds.
+# A token is taken from every bucket or, if one is empty, from none of them.
+# Returns 0 when the request is allowed, else the seconds until it would be.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local buckets = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local period = tonumber(ARGV[2 * i])
+    local rate = capacity / period
+    local state = redis.call('HMGET', key, 'tokens', 'updated')
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    if tokens < 1 then
+        retry_after = math.max(retry_after, (1 - tokens) / rate)
+    end
+    buckets[i] = {tokens, period}
+end
+if retry_after > 0 then
+    return tostring(retry_after)
+end
+for i, key in ipairs(KEYS) do
+    redis.call('HSET', key, 'tokens', buckets[i][1] - 1, 'updated', now)
+    redis.call('EXPIRE', key, math.ceil(buckets[i][2]))
+end
+return '0'
+"""
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """Split a "<requests>/<seconds>" rate, e.g. "5/60" for five requests a minute."""
+    requests, _, seconds = rate.partition("/")
+    return int(requests), float(seconds)
+
+
+class RateLimiterService(IRateLimiterService):
+    """
+    Token bucket limiter in Redis, shared by all workers.
+
+    Each route has a budget per identity kind (ip, email) configured in RATE_LIMITS, all the
+    buckets of a request are checked and taken in one Lua script so concurrent requests
+    cannot overdraw them. The limiter must not take the endpoints down with Redis:
+    Redis errors are logged and the request is allowed.
+    """
+
+    KEY_PREFIX = "rate_limit:"
+    CLAIM_PREFIX = "claim:"
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        limits: Dict[str, Dict[str, str]] = Config.RATE_LIMITS,
+    ):
+        self._redis = redis_client
+        self.limits = {
+            route: {kind: parse_rate(rate) for kind, rate in rates.items()}
+            for route, rates in limits.items()
+        }
+        self._script = None
+
+    async def connect(self):
+        """Use the shared Redis client unless one was given."""
+        if self._redis is None:
+            self._redis = get_redis_client()
+        if self._script is None:
+            self._script = self._redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def check_rate_limit(self, route: str, **identities: str) -> None:
+        """Take one token from each configured bucket of the route."""
+        rates = self.limits.get(route, {})
+        buckets = [
+            (f"{self.KEY_PREFIX}{route}:{kind}:{identity.lower()}", rates[kind])
+            for kind, identity in identities.items()
+            if kind in rates and identity
+        ]
+        if not buckets:
+            return
+
+        try:
+            await self.connect()
+            retry_after = float(
+                await self._script(
+                    keys=[key for key, _ in buckets],
+                    args=[value for _, rate in buckets for value in rate],
+                )
+            )
+        except RedisError as error:
+            logger.warning(f"Rate limiter unavailable, allowing {route}: {error}")
+            return
+
+        if retry_after > 0:
+            raise RateLimitExceeded(retry_after=math.ceil(retry_after))
+
+    def _claim_key(self, action: str, identity: str) -> str:
+        return f"{self.CLAIM_PREFIX}{action}:{identity.lower()}"
+
+    async def claim_once(self, action: str, identity: str, window: int) -> bool:
+        """Claim an action with SET NX, the claim expires after the window."""
+        try:
+            await self.connect()
+            return bool(
+                await self._redis.set(self._claim_key(action, identity), 1, nx=True, ex=window)
+            )
+        except RedisError as error:
+            logger.warning(f"Rate limiter unavailable, allowing {action}: {error}")
+            return True
+
+    async def release_claim(self, action: str, identity: str) -> None:
+        """Delete a claim, the next request for the action is a first one again."""
+        try:
+            await self.connect()
+            await self._redis.delete(self._claim_key(action, identity))
+        except RedisError as error:
+            logger.warning(f"Claim of {action} could not be released: {error}")
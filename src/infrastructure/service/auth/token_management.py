@@ -1,20 +1,28 @@
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import jwt
 from itsdangerous import URLSafeTimedSerializer
 
 from config.settings import Config
 from src.domain.services.token_interface import ITokenService
+from src.infrastructure.service.auth.claims_cache import VerifiedClaimsCache
 
 
 class TokenService(ITokenService):
     """Handles JWT token creation and decoding."""
 
-    def __init__(self, secret: str = Config.JWT_SECRET, algorithm: str = Config.JWT_ALGORITHM):
+    def __init__(
+        self,
+        secret: str = Config.JWT_SECRET,
+        algorithm: str = Config.JWT_ALGORITHM,
+        claims_cache: Optional[VerifiedClaimsCache] = None,
+    ):
         self.secret = secret
         self.algorithm = algorithm
+        self.claims_cache = claims_cache
         self.serializer = URLSafeTimedSerializer(self.secret, salt="email-configuration")
 
     def create_access_token(
@@ -33,9 +41,17 @@ class TokenService(ITokenService):
         return token
 
     def decode_token(self, token: str) -> dict:
-        """Decode a JWT token and handle invalid cases."""
+        """Decode a JWT token and handle invalid cases.
+
+        With a claims cache, a token seen before is not verified and parsed again until it
+        expires; the returned claims are then shared and must not be mutated.
+        """
+        if self.claims_cache is not None:
+            claims = self.claims_cache.get(token)
+            if claims is not None:
+                return claims
         try:
-            return jwt.decode(token, self.secret, algorithms=[self.algorithm])
+            claims = jwt.decode(token, self.secret, algorithms=[self.algorithm])
         except jwt.ExpiredSignatureError:
             logging.warning("Token expired.")
             return {}
@@ -43,6 +59,10 @@ class TokenService(ITokenService):
             logging.exception(f"Invalid token: {e}")
             return {}
 
+        if self.claims_cache is not None:
+            self.claims_cache.set(token, claims)
+        return claims
+
     def create_url_safe_token(self, data: dict):
         """Serialize a dict into a URLSafe token"""
 
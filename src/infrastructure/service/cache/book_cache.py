@@ -0,0 +1,103 @@
+import logging
+from typing import Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from config.settings import Config
+from src.application.errors import BookCacheUnavailable
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class BookCacheService(IBookCacheService):
+    """
+    Caches BookDetailModel JSON in Redis, one hash (etag, body) per book with a TTL.
+
+    The cache is an optimization only: Redis errors are logged and treated as misses,
+    the TTL bounds staleness if an invalidation is lost.
+    """
+
+    KEY_PREFIX = "book_detail:"
+    STATS_KEY = "book_detail_cache:stats"
+
+    def __init__(
+        self, redis_client: Optional[aioredis.Redis] = None, ttl: int = Config.BOOK_CACHE_TTL
+    ):
+        self.ttl = ttl
+        self._redis = redis_client
+
+    async def connect(self):
+        """Use the shared Redis client unless one was given."""
+        if self._redis is None:
+            self._redis = get_redis_client()
+
+    async def disconnect(self):
+        """Release the Redis client, its pool is closed by its owner."""
+        self._redis = None
+
+    def _key(self, book_uid: UUID) -> str:
+        return f"{self.KEY_PREFIX}{book_uid}"
+
+    async def get_book(self, book_uid: UUID) -> Optional[Tuple[str, str]]:
+        """Return the cached (etag, body) of a book and count the lookup."""
+        await self.connect()
+        try:
+            # a hit costs one round trip: misses are counted on the miss path only,
+            # which reads the database anyway
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hmget(self._key(book_uid), "etag", "body")
+                pipe.hincrby(self.STATS_KEY, "lookups", 1)
+                (etag, body), _ = await pipe.execute()
+            if body is None:
+                await self._redis.hincrby(self.STATS_KEY, "misses", 1)
+        except RedisError as error:
+            logger.warning(f"Book cache read failed for {book_uid}: {error}")
+            return None
+
+        return (etag, body) if body is not None else None
+
+    async def set_book(self, book_uid: UUID, etag: str, body: str) -> None:
+        """Store the representation of a book for the configured TTL."""
+        await self.connect()
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(self._key(book_uid), mapping={"etag": etag, "body": body})
+                pipe.expire(self._key(book_uid), self.ttl)
+                await pipe.execute()
+        except RedisError as error:
+            logger.warning(f"Book cache write failed for {book_uid}: {error}")
+
+    async def invalidate_books(self, *book_uids: UUID) -> None:
+        """Delete the cached representations of the given books."""
+        if not book_uids:
+            return
+        await self.connect()
+        try:
+            await self._redis.delete(*(self._key(book_uid) for book_uid in book_uids))
+        except RedisError as error:
+            logger.warning(f"Book cache invalidation failed for {book_uids}: {error}")
+
+    async def get_stats(self) -> dict:
+        """Return hits, misses and hit ratio accumulated by every worker.
+
+        Raises:
+            BookCacheUnavailable: If Redis cannot be reached, zeroed counters would be misleading
+        """
+        await self.connect()
+        try:
+            counters = await self._redis.hgetall(self.STATS_KEY)
+        except RedisError as error:
+            logger.warning(f"Book cache stats read failed: {error}")
+            raise BookCacheUnavailable() from error
+        lookups, misses = int(counters.get("lookups", 0)), int(counters.get("misses", 0))
+        hits = max(lookups - misses, 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "ttl": self.ttl,
+        }
@@ -0,0 +1,71 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from config.settings import Config
+from src.domain.models.principal import Principal
+from src.domain.services.principal_cache_interface import IPrincipalCacheService
+
+
+class PrincipalCacheService(IPrincipalCacheService):
+    """
+    LRU cache of principals with a TTL, held in the memory of one worker.
+
+    A hit costs no I/O at all. Invalidations only reach the worker that made the change:
+    the TTL bounds how long other workers keep acting on a changed role or verification
+    status, and how long a change made directly in the database goes unnoticed.
+    """
+
+    def __init__(
+        self,
+        ttl: int = Config.PRINCIPAL_CACHE_TTL,
+        max_size: int = Config.PRINCIPAL_CACHE_MAX_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        # user_uid -> (expiry on the monotonic clock, principal), least recently used first
+        self._entries: "OrderedDict[UUID, Tuple[float, Principal]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_principal(self, user_uid: UUID) -> Optional[Principal]:
+        """Return the cached principal and mark it as recently used."""
+        entry = self._entries.get(user_uid)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[user_uid]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(user_uid)
+        self._hits += 1
+        return entry[1]
+
+    def set_principal(self, principal: Principal) -> None:
+        """Cache a principal for the configured TTL, evicting the least recently used ones."""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        self._entries[principal.uid] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.uid)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate_principal(self, user_uid: UUID) -> None:
+        """Forget a user, its next request loads it again."""
+        self._entries.pop(user_uid, None)
+
+    def get_stats(self) -> dict:
+        """Return the counters of this worker since it started."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "ttl": self.ttl,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "evictions": self._evictions,
+        }
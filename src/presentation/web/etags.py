@@ -0,0 +1,52 @@
+import hashlib
+from typing import Any, Optional, Set
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: Any, version: Optional[int] = None) -> str:
+    """Build a strong entity tag from the values a representation is derived from.
+
+    The version of a versioned resource leads the tag ("<version>.<digest>") so that
+    If-Match can be checked against the stored version without rebuilding the digest.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    if version is not None:
+        return f'"{version}.{digest}"'
+    return f'"{digest}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against the current entity tag.
+
+    If-None-Match uses the weak comparison (RFC 9110 13.1.2): a W/ prefix is ignored.
+    """
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def if_match_versions(header: str) -> Optional[Set[int]]:
+    """Versions named by an If-Match header, None for "*" (any current version).
+
+    If-Match uses the strong comparison (RFC 9110 13.1.1): weak tags never match. A tag is
+    either an ETag of the resource or its bare version, e.g. "3.ab12..." or "3".
+    """
+    versions = set()
+    for candidate in (candidate.strip() for candidate in header.split(",")):
+        if candidate == "*":
+            return None
+        if len(candidate) < 2 or not (candidate[0] == candidate[-1] == '"'):
+            continue
+        version = candidate[1:-1].partition(".")[0]
+        if version.isdigit():
+            versions.add(int(version))
+    return versions
+
+
+def not_modified(etag: str) -> Response:
+    """304 response telling the client its cached representation is still current"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -8,12 +8,18 @@ from config.settings import Config
 from src.application.errors import UserNotFound, InvalidToken, PasswordsDoNotMatch
 from src.domain.repositories.user_repository_interface import IUserRepository
 from src.domain.services.password_interface import IPasswordService
+from src.domain.services.rate_limiter_interface import IRateLimiterService
 from src.domain.services.token_interface import ITokenService
 from src.infrastructure.dependencies.authentication import get_current_user
 from src.infrastructure.dependencies.authorization import get_role_checker
+from src.infrastructure.dependencies.client import get_client_ip
 from src.infrastructure.dependencies.database import get_session
 from src.infrastructure.dependencies.repositories import get_user_repository
-from src.infrastructure.dependencies.services import get_token_service, get_password_service
+from src.infrastructure.dependencies.services import (
+    get_token_service,
+    get_password_service,
+    get_rate_limiter_service,
+)
 from src.infrastructure.mail import mail, create_message
 from src.infrastructure.service.auth.token_bearer import RefreshTokenBearer
 from src.presentation.web.schemas.passwords import (
@@ -42,7 +48,16 @@ async def get_new_access_token(
 
 
 @auth_router.get("/me", response_model=UserBooksModel)
-async def get_user(user=Depends(get_current_user), _: bool = Depends(role_checker)):
+async def get_user(
+    current_user=Depends(get_current_user),
+    _: bool = Depends(role_checker),
+    user_repository: IUserRepository = Depends(get_user_repository),
+    session: AsyncSession = Depends(get_session),
+):
+    # the account page shows the user's books: load it fresh instead of the cached principal
+    user = await user_repository.get_user_by_email(current_user.email, session)
+    if not user:
+        raise UserNotFound()
     return user
 
 
@@ -78,9 +93,24 @@ async def verify_user_account(
 
 @auth_router.post("/password-reset-request")
 async def password_reset_request(
-    email_data: PasswordResetRequestModel, token_service: ITokenService = Depends(get_token_service)
+    email_data: PasswordResetRequestModel,
+    client_ip: str = Depends(get_client_ip),
+    token_service: ITokenService = Depends(get_token_service),
+    rate_limiter: IRateLimiterService = Depends(get_rate_limiter_service),
 ):
     email = email_data.email.email
+    await rate_limiter.check_rate_limit("password_reset", ip=client_ip, email=email)
+
+    # a repeated request inside the window gets the same answer but no new email
+    if not await rate_limiter.claim_once(
+        "password_reset", email, Config.PASSWORD_RESET_EMAIL_WINDOW
+    ):
+        return JSONResponse(
+            content={
+                "message": "Please check your email for instructions to reset your password",
+            },
+            status_code=status.HTTP_200_OK,
+        )
 
     token = token_service.create_url_safe_token({"email": email})
 
@@ -93,7 +123,12 @@ async def password_reset_request(
     subject = "Reset Your Password"
 
     message = create_message(recipients=[email], subject=subject, body=html_message)
-    await mail.send_message(message)
+    try:
+        await mail.send_message(message)
+    except Exception:
+        # the email was not sent: a retry must not be answered as a repeat
+        await rate_limiter.release_claim("password_reset", email)
+        raise
     return JSONResponse(
         content={
             "message": "Please check your email for instructions to reset your password",
@@ -127,7 +162,7 @@ async def reset_account_password(
         if not user:
             raise UserNotFound()
 
-        passwd_hash = password_service.hash_password(new_password)
+        passwd_hash = await password_service.hash_password(new_password)
         await user_repository.update_user(user, {"password_hash": passwd_hash}, session)
 
         return JSONResponse(
@@ -4,8 +4,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, status
 
 from src.domain.repositories.tags_repository_interface import ITagRepository
+from src.domain.services.book_cache_interface import IBookCacheService
 from src.infrastructure.dependencies.authorization import get_role_checker
 from src.infrastructure.dependencies.repositories import get_tags_repository
+from src.infrastructure.dependencies.services import get_book_cache_service
 from src.presentation.web.schemas.book_tags import TagModel, TagCreateModel, TagAddModel
 from src.presentation.web.schemas.books import Book
 
@@ -36,9 +38,13 @@ async def add_tag(
 
 @tags_router.post("/{book_uid}", response_model=Book, dependencies=[role_checker])
 async def add_tags_to_book(
-    book_uid: UUID, tag_data: TagAddModel, repo: ITagRepository = Depends(get_tags_repository)
+    book_uid: UUID,
+    tag_data: TagAddModel,
+    repo: ITagRepository = Depends(get_tags_repository),
+    cache: IBookCacheService = Depends(get_book_cache_service),
 ) -> Book:
     book_with_tag = await repo.add_tags_to_book(book_uid=book_uid, tag_data=tag_data)
+    await cache.invalidate_books(book_uid)
 
     return book_with_tag
 
@@ -48,8 +54,11 @@ async def update_tag(
     tag_uid: UUID,
     tag_update_data: TagCreateModel,
     repo: ITagRepository = Depends(get_tags_repository),
+    cache: IBookCacheService = Depends(get_book_cache_service),
 ) -> TagModel:
     updated_tag = await repo.update_tag(tag_uid, tag_update_data)
+    # a renamed tag shows up in the detail of every book carrying it
+    await cache.invalidate_books(*await repo.get_tagged_book_uids(tag_uid))
 
     return updated_tag
 
@@ -57,7 +66,13 @@ async def update_tag(
 @tags_router.delete(
     "/{tag_uid}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[role_checker]
 )
-async def delete_tag(tag_uid: UUID, repo: ITagRepository = Depends(get_tags_repository)):
+async def delete_tag(
+    tag_uid: UUID,
+    repo: ITagRepository = Depends(get_tags_repository),
+    cache: IBookCacheService = Depends(get_book_cache_service),
+):
+    tagged_book_uids = await repo.get_tagged_book_uids(tag_uid)
     updated_tag = await repo.delete_tag(tag_uid)
+    await cache.invalidate_books(*tagged_book_uids)
 
     return updated_tag
@@ -1,34 +1,91 @@
-from typing import List
+from typing import Annotated, AsyncContextManager, AsyncIterator, Callable, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status  # Depends is a dependency injection system
+# Depends is a dependency injection system
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 
-from src.application.errors import BookNotFound
+from config.settings import Config
+from src.application.errors import BookNotFound, BookVersionConflict, InvalidBookImport
+from src.application.services.book_import import BookImportService
+from src.domain.models.book_rankings import ranking_scope
 from src.domain.repositories.book_repository_interface import IBookRepository
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.infrastructure.dependencies.authentication import access_security_scheme
 from src.infrastructure.dependencies.authorization import get_role_checker
-from src.infrastructure.dependencies.repositories import get_book_repository
-from src.infrastructure.service.auth.token_bearer import AccessTokenBearer
+from src.infrastructure.dependencies.repositories import (
+    get_book_import_service,
+    get_book_repository,
+    get_book_repository_scope,
+)
+from src.infrastructure.dependencies.services import get_book_cache_service
+from src.presentation.web.etags import etag_matches, if_match_versions, make_etag, not_modified
 from src.presentation.web.schemas.books import (
     Book,
+    BookBatchGetModel,
+    BookBatchGetResultModel,
     BookDetailModel,
     BookCreateModel,
+    BookImportResultModel,
+    BookLeaderboardModel,
+    BookLeaderboardQueryModel,
+    BookListQueryModel,
+    BookPageModel,
     BookUpdateModel,
 )  # import schemas
 
 # Global level functions/names
 app = APIRouter()
-access_token_bearer = AccessTokenBearer()
+IMPORT_CONTENT_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+# the bearer of get_current_user: FastAPI resolves a dependency once per request, so routes
+# reading the token next to the role checker do not verify it and check its revocation twice
+access_token_bearer = access_security_scheme
 role_checker = Depends(get_role_checker(["admin", "user"]))
 
 
-@app.get("/", response_model=List[Book], dependencies=[role_checker])
+@app.get("/", response_model=BookPageModel, dependencies=[role_checker])
 async def get_all_books(
+        request: Request,
+        response: Response,
+        params: Annotated[BookListQueryModel, Query()],
         repo: IBookRepository = Depends(get_book_repository),
-) -> List[Book]:
-    """Connect to the database and load books."""
-    books = await repo.get_all_books()
-    return books
+) -> BookPageModel:
+    """Connect to the database and load a filtered page of books, newest first by default.
+
+    - **language**, **publisher**, **author**: exact match
+    - **published_from**, **published_to**: inclusive published date range (YYYY-MM-DD)
+    - **min_pages**, **max_pages**: inclusive page count range
+    - **sort**: `created_at`, `title` or `published_date`; **order**: `asc` or `desc`
+    - **limit**: Maximum number of books to return
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page.
+      A cursor is only valid for the sort and order it was issued with
+    - **facets**: also count books per language and per publisher (each facet ignores its
+      own filter)
+
+    Responds with an `ETag`; send it back in `If-None-Match` to get `304 Not Modified`
+    while the page is unchanged.
+    """
+    books, next_cursor = await repo.get_all_books(
+        limit=params.limit, cursor=params.cursor, filters=params
+    )
+    book_facets = await repo.get_book_facets(params) if params.facets else None
+
+    # the page is a cheap keyset read of list columns: its own rows are the exact fingerprint
+    etag = make_etag(
+        next_cursor,
+        book_facets and book_facets.model_dump_json(),
+        *((book.uid, book.updated_at) for book in books),
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+    return BookPageModel(items=books, next_cursor=next_cursor, facets=book_facets)
 
 
 @app.post(
@@ -50,6 +107,129 @@ async def create_a_book(
     return new_book
 
 
+@app.post(
+    "/import",
+    response_model=BookImportResultModel,
+    dependencies=[role_checker],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                content_type: {"schema": {"type": "string", "format": "binary"}}
+                for content_type in IMPORT_CONTENT_TYPES
+            },
+        }
+    },
+)
+async def import_books(
+        request: Request,
+        token_details=Depends(access_token_bearer),
+        import_service: BookImportService = Depends(get_book_import_service),
+) -> BookImportResultModel:
+    """Bulk create books from an NDJSON or CSV request body.
+
+    The body is streamed: rows are validated as they arrive and written in batches,
+    invalid rows are skipped and reported with their line number.
+
+    - **application/x-ndjson**: one `BookCreateModel` JSON object per line
+    - **text/csv**: header row with the `BookCreateModel` field names, then one book per row
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in IMPORT_CONTENT_TYPES:
+        raise InvalidBookImport()
+
+    user_id = token_details.get("user")["user_uid"]
+    return await import_service.import_books(
+        request.stream(), IMPORT_CONTENT_TYPES[content_type], user_id
+    )
+
+
+@app.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[role_checker],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_books(
+        repository_scope: Callable[[], AsyncContextManager[IBookRepository]] = Depends(
+            get_book_repository_scope
+        ),
+) -> StreamingResponse:
+    """Stream the whole catalog as NDJSON, one `Book` object per line.
+
+    Rows are read from a server-side cursor and written as they arrive,
+    so memory use is constant and the first line is sent right away.
+    """
+
+    async def ndjson() -> AsyncIterator[str]:
+        async with repository_scope() as repo:
+            async for books in repo.stream_books(batch_size=Config.BOOK_EXPORT_BATCH_SIZE):
+                yield "".join(Book.model_validate(book).model_dump_json() + "\n" for book in books)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@app.post("/batch-get", response_model=BookBatchGetResultModel, dependencies=[role_checker])
+async def batch_get_books(
+        batch: BookBatchGetModel,
+        repo: IBookRepository = Depends(get_book_repository),
+) -> BookBatchGetResultModel:
+    """Load many books by uid with one query, e.g. to render a shelf.
+
+    - **uids**: up to `BOOKS_BATCH_GET_MAX` book uids; duplicates are returned once
+
+    Books come back in request order, uids of books that do not exist are listed in `missing`.
+    """
+    requested = list(dict.fromkeys(batch.uids))
+    found = {book.uid: book for book in await repo.get_books_by_uids(requested)}
+
+    return BookBatchGetResultModel(
+        items=[found[uid] for uid in requested if uid in found],
+        missing=[uid for uid in requested if uid not in found],
+    )
+
+
+@app.get("/search", response_model=BookPageModel, dependencies=[role_checker])
+async def search_books(
+        q: str = Query(..., min_length=1, max_length=200),
+        language: Optional[str] = None,
+        limit: int = Query(Config.BOOKS_PAGE_SIZE, ge=1, le=Config.BOOKS_MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        repo: IBookRepository = Depends(get_book_repository),
+) -> BookPageModel:
+    """Full-text search over title, author and publisher, best match first.
+
+    - **q**: Search terms; supports "quoted phrases", `OR` and `-excluded` words
+    - **language**: Only search books in this language
+    - **limit**: Maximum number of books to return
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    """
+    books, next_cursor = await repo.search_books(
+        query=q, limit=limit, cursor=cursor, language=language
+    )
+    return BookPageModel(items=books, next_cursor=next_cursor)
+
+
+@app.get("/leaderboard", response_model=BookLeaderboardModel, dependencies=[role_checker])
+async def get_leaderboard(
+        params: Annotated[BookLeaderboardQueryModel, Query()],
+        repo: IBookRepository = Depends(get_book_repository),
+) -> BookLeaderboardModel:
+    """Best rated books, overall or within a language or a tag.
+
+    Books are ranked by the Bayesian average of their ratings, so a book needs many good
+    reviews to outrank one with a few perfect ones. The rankings are a snapshot refreshed
+    in the background every `BOOK_RANKINGS_REFRESH_INTERVAL` seconds, see `computed_at`.
+
+    - **language**: rank the books in this language only
+    - **tag**: rank the books with this tag only (uid of the tag)
+    - **limit**: Maximum number of books to return
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    """
+    scope = ranking_scope(language=params.language, tag_uid=params.tag)
+    return await repo.get_leaderboard(scope, limit=params.limit, cursor=params.cursor)
+
+
 @app.get(
     "/{book_uid}",
     response_model=BookDetailModel,
@@ -58,14 +238,40 @@ async def create_a_book(
 )
 async def get_book(
         book_uid: UUID,
+        request: Request,
         repo: IBookRepository = Depends(get_book_repository),
-) -> Book:
-    """Connect to the database and load book by uid."""
+        cache: IBookCacheService = Depends(get_book_cache_service),
+) -> Response:
+    """Load book by uid with its reviews and tags, read through the book cache.
+
+    Responds with an `ETag`; send it back in `If-None-Match` to get `304 Not Modified`
+    while neither the book nor its reviews and tags changed.
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    cached = await cache.get_book(book_uid)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    fingerprint = await repo.get_book_fingerprint(book_uid)
+    if fingerprint is None:
+        raise BookNotFound()
+
+    version, *fingerprint = fingerprint
+    etag = make_etag(book_uid, *fingerprint, version=version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     book = await repo.get_book(book_uid)
-    if book:
-        return book
+    if not book:
+        raise BookNotFound()
 
-    raise BookNotFound()
+    body = BookDetailModel.model_validate(book, from_attributes=True).model_dump_json()
+    await cache.set_book(book_uid, etag, body)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.patch(
@@ -77,11 +283,25 @@ async def get_book(
 async def update_book(
         book_uid: UUID,
         book_update_data: BookUpdateModel,
+        request: Request,
         repo: IBookRepository = Depends(get_book_repository),
+        cache: IBookCacheService = Depends(get_book_cache_service),
 ) -> Book:
-    """Connect to the database and update book by uid."""
-    updated_book = await repo.update_book(book_uid, book_update_data)
-    if update_book is None:
+    """Update the fields sent for a book, no need to read it first.
+
+    Send `If-Match` with the book's `ETag` (or its `version` in quotes, e.g. `"3"`) to only
+    apply the change if nobody updated the book since; a stale version gets
+    `412 Precondition Failed`, as does `If-Match: *` for a book that does not exist.
+    """
+    if_match = request.headers.get("if-match")
+    versions = if_match_versions(if_match) if if_match else None
+
+    updated_book = await repo.update_book(book_uid, book_update_data, versions=versions)
+    await cache.invalidate_books(book_uid)
+    if updated_book is None:
+        if if_match and versions is None:
+            # "*" only holds if the book has a current representation (RFC 9110 13.1.1)
+            raise BookVersionConflict()
         raise BookNotFound()
 
     return updated_book
@@ -91,8 +311,10 @@ async def update_book(
 async def delete_book(
         book_uid: UUID,
         repo: IBookRepository = Depends(get_book_repository),
+        cache: IBookCacheService = Depends(get_book_cache_service),
 ):
     deleted = await repo.delete_book(book_uid)
+    await cache.invalidate_books(book_uid)
 
     if not deleted:
         raise BookNotFound()
@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, status
+
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.domain.services.password_interface import IPasswordService
+from src.domain.services.principal_cache_interface import IPrincipalCacheService
+from src.infrastructure.dependencies.authorization import get_role_checker
+from src.infrastructure.dependencies.services import (
+    get_book_cache_service,
+    get_password_service,
+    get_principal_cache_service,
+)
+from src.presentation.web.schemas.metrics import (
+    CacheStatsModel,
+    PasswordHashingStatsModel,
+    PrincipalCacheStatsModel,
+)
+
+metrics_router = APIRouter()
+admin_role_checker = Depends(get_role_checker(["admin"]))
+
+
+@metrics_router.get(
+    "/book-cache",
+    response_model=CacheStatsModel,
+    dependencies=[admin_role_checker],
+    status_code=status.HTTP_200_OK,
+)
+async def get_book_cache_stats(cache: IBookCacheService = Depends(get_book_cache_service)):
+    """
+    Hit and miss counters of the book detail cache (Admin only)
+
+    Counters are shared by all workers; use the hit ratio to tune `BOOK_CACHE_TTL`.
+    """
+    return await cache.get_stats()
+
+
+@metrics_router.get(
+    "/principal-cache",
+    response_model=PrincipalCacheStatsModel,
+    dependencies=[admin_role_checker],
+    status_code=status.HTTP_200_OK,
+)
+async def get_principal_cache_stats(
+    cache: IPrincipalCacheService = Depends(get_principal_cache_service),
+):
+    """
+    Hit and miss counters of the authenticated user cache (Admin only)
+
+    The cache lives in each worker: the counters are those of the worker serving this request.
+    Tune `PRINCIPAL_CACHE_TTL` and `PRINCIPAL_CACHE_MAX_SIZE` with the hit ratio and evictions.
+    """
+    return cache.get_stats()
+
+
+@metrics_router.get(
+    "/password-hashing",
+    response_model=PasswordHashingStatsModel,
+    dependencies=[admin_role_checker],
+    status_code=status.HTTP_200_OK,
+)
+async def get_password_hashing_stats(
+    password_service: IPasswordService = Depends(get_password_service),
+):
+    """
+    Load and queue wait of the password hashing threads (Admin only)
+
+    The threads belong to each worker: the counters are those of the worker serving this request.
+    Raise `PASSWORD_HASH_WORKERS` when hashes wait long, `PASSWORD_HASH_MAX_QUEUE` bounds the wait.
+    """
+    return password_service.get_stats()
@@ -1,9 +1,10 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
+from config.settings import Config
 from src.application.services.reviews import ReviewService
-from src.domain.models.users import User
+from src.domain.models.principal import Principal
 from src.infrastructure.dependencies.authentication import get_current_user
 from src.infrastructure.dependencies.authorization import get_role_checker
 from src.infrastructure.dependencies.repositories import get_review_service
@@ -11,7 +12,10 @@ from src.presentation.web.schemas.reviews import (
     ReviewCreateModel,
     ReviewUpdateModel,
     ReviewModel,
+    ReviewPageModel,
     BookRatingStatsModel,
+    BookRatingStatsBatchModel,
+    BookRatingStatsBatchRequestModel,
 )
 
 reviews_router = APIRouter()
@@ -21,22 +25,37 @@ user_role_checker = Depends(get_role_checker(["admin", "user"]))
 admin_role_checker = Depends(get_role_checker(["admin"]))
 
 
+def _set_total_header(response: Response, page: ReviewPageModel) -> None:
+    """Expose a requested total as X-Total-Count as well"""
+    if page.total is not None:
+        response.headers["X-Total-Count"] = str(page.total)
+
+
 @reviews_router.get(
     "/",
-    response_model=List[ReviewModel],
+    response_model=ReviewPageModel,
     dependencies=[admin_role_checker],
     status_code=status.HTTP_200_OK,
 )
 async def get_all_reviews(
-    limit: int = 100, offset: int = 0, review_service: ReviewService = Depends(get_review_service)
+    response: Response,
+    limit: int = Query(Config.REVIEWS_PAGE_SIZE, ge=1, le=Config.REVIEWS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    review_service: ReviewService = Depends(get_review_service),
 ):
     """
-    Get all reviews (Admin only)
+    Get all reviews, newest first (Admin only)
 
     - **limit**: Maximum number of reviews to return (default: 100)
-    - **offset**: Number of reviews to skip (default: 0)
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    - **include_total**: also return the number of reviews (`total`, `X-Total-Count`);
+      it is the planner's estimate, flagged by `total_estimated`
     """
-    reviews = await review_service.get_all_reviews(limit=limit, offset=offset)
+    reviews = await review_service.get_all_reviews(
+        limit=limit, cursor=cursor, include_total=include_total
+    )
+    _set_total_header(response, reviews)
     return reviews
 
 
@@ -57,22 +76,60 @@ async def get_review(review_uid: str, review_service: ReviewService = Depends(ge
 
 
 @reviews_router.get(
-    "/book/{book_uid}", response_model=List[ReviewModel], status_code=status.HTTP_200_OK
+    "/book/{book_uid}", response_model=ReviewPageModel, status_code=status.HTTP_200_OK
 )
 async def get_book_reviews(
     book_uid: str,
-    limit: int = 100,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(Config.REVIEWS_PAGE_SIZE, ge=1, le=Config.REVIEWS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     review_service: ReviewService = Depends(get_review_service),
 ):
     """
-    Get all reviews for a specific book (Public)
+    Get the reviews for a specific book, newest first (Public)
 
     - **book_uid**: UUID of the book
     - **limit**: Maximum number of reviews to return (default: 100)
-    - **offset**: Number of reviews to skip (default: 0)
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    - **include_total**: also return the number of reviews of the book (`total`, `X-Total-Count`)
     """
-    reviews = await review_service.get_book_reviews(book_uid=book_uid, limit=limit, offset=offset)
+    reviews = await review_service.get_book_reviews(
+        book_uid=book_uid, limit=limit, cursor=cursor, include_total=include_total
+    )
+    _set_total_header(response, reviews)
+    return reviews
+
+
+@reviews_router.get(
+    "/book/{book_uid}/search", response_model=ReviewPageModel, status_code=status.HTTP_200_OK
+)
+async def search_book_reviews(
+    book_uid: str,
+    q: str = Query(..., min_length=1, max_length=200),
+    min_rating: Optional[int] = Query(None, ge=1, le=5),
+    max_rating: Optional[int] = Query(None, ge=1, le=5),
+    limit: int = Query(Config.REVIEWS_PAGE_SIZE, ge=1, le=Config.REVIEWS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Full-text search in the reviews of a book, best match first (Public)
+
+    - **book_uid**: UUID of the book
+    - **q**: Search terms; supports "quoted phrases", `OR` and `-excluded` words
+    - **min_rating**, **max_rating**: inclusive rating range, e.g. 1 and 2 for critical reviews
+    - **limit**: Maximum number of reviews to return (default: 100)
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    """
+    reviews = await review_service.search_book_reviews(
+        book_uid=book_uid,
+        query=q,
+        limit=limit,
+        cursor=cursor,
+        min_rating=min_rating,
+        max_rating=max_rating,
+    )
     return reviews
 
 
@@ -95,27 +152,51 @@ async def get_book_rating_stats(
     return stats
 
 
+@reviews_router.post(
+    "/stats/batch",
+    response_model=BookRatingStatsBatchModel,
+    status_code=status.HTTP_200_OK,
+)
+async def get_books_rating_stats(
+    batch: BookRatingStatsBatchRequestModel,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Get rating statistics for many books at once (Public)
+
+    - **book_uids**: UUIDs of the books, e.g. the page of a book listing
+
+    Returns statistics in request order; UUIDs that are not books are listed in `missing`
+    """
+    stats = await review_service.get_books_rating_stats(batch.book_uids)
+    return stats
+
+
 @reviews_router.get(
     "/user/me",
-    response_model=List[ReviewModel],
+    response_model=ReviewPageModel,
     dependencies=[user_role_checker],
     status_code=status.HTTP_200_OK,
 )
 async def get_my_reviews(
-    limit: int = 100,
-    offset: int = 0,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    limit: int = Query(Config.REVIEWS_PAGE_SIZE, ge=1, le=Config.REVIEWS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    current_user: Principal = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ):
     """
-    Get all reviews by the current user
+    Get the reviews by the current user, newest first
 
     - **limit**: Maximum number of reviews to return (default: 100)
-    - **offset**: Number of reviews to skip (default: 0)
+    - **cursor**: `next_cursor` from the previous page; omit it for the first page
+    - **include_total**: also return the number of your reviews (`total`, `X-Total-Count`)
     """
     reviews = await review_service.get_user_reviews(
-        user_email=current_user.email, limit=limit, offset=offset
+        user_uid=current_user.uid, limit=limit, cursor=cursor, include_total=include_total
     )
+    _set_total_header(response, reviews)
     return reviews
 
 
@@ -128,7 +209,7 @@ async def get_my_reviews(
 async def add_review_to_book(
     book_uid: str,
     review_data: ReviewCreateModel,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ):
     """
@@ -140,7 +221,7 @@ async def add_review_to_book(
     Users can only review a book once
     """
     new_review = await review_service.add_review_to_book(
-        user_email=current_user.email, book_uid=book_uid, review_data=review_data
+        user_uid=current_user.uid, book_uid=book_uid, review_data=review_data
     )
     return new_review
 
@@ -154,7 +235,7 @@ async def add_review_to_book(
 async def update_review(
     review_uid: str,
     review_data: ReviewUpdateModel,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ):
     """
@@ -166,7 +247,7 @@ async def update_review(
     Users can only update their own reviews
     """
     updated_review = await review_service.update_review(
-        review_uid=review_uid, user_email=current_user.email, review_data=review_data
+        review_uid=review_uid, user_uid=current_user.uid, review_data=review_data
     )
     return updated_review
 
@@ -178,7 +259,7 @@ async def update_review(
 )
 async def delete_review(
     review_uid: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ):
     """
@@ -188,5 +269,5 @@ async def delete_review(
 
     Users can only delete their own reviews
     """
-    await review_service.delete_review(review_uid=review_uid, user_email=current_user.email)
+    await review_service.delete_review(review_uid=review_uid, user_uid=current_user.uid)
     return None
@@ -9,13 +9,16 @@ from src.application.errors import UserAlreadyExists, InvalidCredentials
 from src.domain.repositories.user_repository_interface import IUserRepository
 from src.domain.services.blocklist_token_interface import IBlocklistTokenService
 from src.domain.services.password_interface import IPasswordService
+from src.domain.services.rate_limiter_interface import IRateLimiterService
 from src.domain.services.token_interface import ITokenService
+from src.infrastructure.dependencies.client import get_client_ip
 from src.infrastructure.dependencies.database import get_session
 from src.infrastructure.dependencies.repositories import get_user_repository
 from src.infrastructure.dependencies.services import (
     get_token_service,
     get_blocklist_token_service,
     get_password_service,
+    get_rate_limiter_service,
 )
 from src.infrastructure.mail import mail, create_message
 from src.infrastructure.service.auth.token_bearer import AccessTokenBearer
@@ -32,11 +35,14 @@ app = APIRouter()
 @app.post("/signup", response_model=UserSignupResponse, status_code=status.HTTP_201_CREATED)
 async def create_user_account(
     user_data: UserCreateModel,
+    client_ip: str = Depends(get_client_ip),
     user_repository: IUserRepository = Depends(get_user_repository),
     token_service: ITokenService = Depends(get_token_service),
     password_service: IPasswordService = Depends(get_password_service),
+    rate_limiter: IRateLimiterService = Depends(get_rate_limiter_service),
     session: AsyncSession = Depends(get_session),
 ):
+    await rate_limiter.check_rate_limit("signup", ip=client_ip, email=user_data.email)
     user_exists = await user_repository.user_exists(user_data.email, session=session)
 
     if user_exists:
@@ -77,18 +83,21 @@ async def create_user_account(
 @app.post("/login")
 async def login_users(
     user_data: UserLoginModel,
+    client_ip: str = Depends(get_client_ip),
     user_repository: IUserRepository = Depends(get_user_repository),
     token_service: ITokenService = Depends(get_token_service),
     password_service: IPasswordService = Depends(get_password_service),
+    rate_limiter: IRateLimiterService = Depends(get_rate_limiter_service),
     session: AsyncSession = Depends(get_session),
 ):
     """Login a user. Verify the user's credentials. If valid - generate token and return the user."""
+    await rate_limiter.check_rate_limit("login", ip=client_ip, email=user_data.email)
     user = await user_repository.get_user_by_email(user_data.email, session=session)
     if not user:
         raise InvalidCredentials()
 
     if user is not None:
-        if password_service.verify_password(user_data.password, user.password_hash):
+        if await password_service.verify_password(user_data.password, user.password_hash):
             access_token = token_service.create_access_token(
                 user_data={"email": user.email, "user_uid": str(user.uid)}
             )
@@ -1,9 +1,10 @@
 import uuid
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from config.settings import Config
 from src.presentation.web.schemas.book_tags import TagModel
 from src.presentation.web.schemas.reviews import ReviewModel
 
@@ -19,6 +20,116 @@ class Book(BaseModel):
     language: str
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+    version: int
+
+    model_config = {"from_attributes": True}
+
+
+class FacetCountModel(BaseModel):
+    value: str
+    count: int
+
+
+class BookFacetsModel(BaseModel):
+    """Books per value of a facet; each facet ignores its own filter"""
+
+    language: List[FacetCountModel]
+    publisher: List[FacetCountModel]
+
+
+class BookPageModel(BaseModel):
+    """One page of books plus the cursor to request the next one"""
+
+    items: List[Book]
+    next_cursor: Optional[str] = None
+    facets: Optional[BookFacetsModel] = None
+
+
+class BookBatchGetModel(BaseModel):
+    uids: List[uuid.UUID] = Field(..., min_length=1, max_length=Config.BOOKS_BATCH_GET_MAX)
+
+
+class BookBatchGetResultModel(BaseModel):
+    """Books found in request order plus the requested uids that do not exist"""
+
+    items: List[Book]
+    missing: List[uuid.UUID]
+
+
+class BookFilterModel(BaseModel):
+    """Filters and ordering of the books list, read from the query string"""
+
+    language: Optional[str] = None
+    publisher: Optional[str] = None
+    author: Optional[str] = None
+    published_from: Optional[date] = None
+    published_to: Optional[date] = None
+    min_pages: Optional[int] = Field(None, ge=0)
+    max_pages: Optional[int] = Field(None, ge=0)
+    sort: Literal["created_at", "title", "published_date"] = "created_at"
+    order: Literal["asc", "desc"] = "desc"
+
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        if self.published_from and self.published_to and self.published_from > self.published_to:
+            raise ValueError("published_from must not be after published_to")
+        if self.min_pages is not None and self.max_pages is not None:
+            if self.min_pages > self.max_pages:
+                raise ValueError("min_pages must not be greater than max_pages")
+        return self
+
+
+class BookListQueryModel(BookFilterModel):
+    """Query string of the books list: filters plus paging"""
+
+    limit: int = Field(Config.BOOKS_PAGE_SIZE, ge=1, le=Config.BOOKS_MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+    facets: bool = False
+
+
+class BookLeaderboardQueryModel(BaseModel):
+    """Query string of the leaderboard: one scope (overall, a language or a tag) plus paging"""
+
+    language: Optional[str] = None
+    tag: Optional[uuid.UUID] = None
+    limit: int = Field(Config.BOOKS_PAGE_SIZE, ge=1, le=Config.BOOKS_MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_scope(self):
+        if self.language is not None and self.tag is not None:
+            raise ValueError("rank by language or by tag, not both")
+        return self
+
+
+class BookRankingModel(BaseModel):
+    """Leaderboard entry: the score is the Bayesian average of the book's ratings"""
+
+    rank: int
+    score: float
+    average_rating: float
+    review_count: int
+    book: Book
+
+
+class BookLeaderboardModel(BaseModel):
+    """One page of a leaderboard, as of the snapshot taken at computed_at"""
+
+    items: List[BookRankingModel]
+    next_cursor: Optional[str] = None
+    computed_at: Optional[datetime] = None
+
+
+# the books table stores page_count as an integer column (int32)
+PAGE_COUNT_MAX = 2**31 - 1
+TEXT_FIELDS = ("title", "author", "publisher", "language")
+
+
+def _reject_nul(value: Optional[str]) -> Optional[str]:
+    """Postgres text cannot hold NUL characters"""
+    if value is not None and "\x00" in value:
+        raise ValueError("must not contain NUL characters")
+    return value
 
 
 class BookCreateModel(BaseModel):
@@ -26,17 +137,63 @@ class BookCreateModel(BaseModel):
     author: str
     publisher: str
     published_date: str
-    page_count: int
+    page_count: int = Field(ge=-PAGE_COUNT_MAX - 1, le=PAGE_COUNT_MAX)
     language: str
 
+    _validate_text = field_validator(*TEXT_FIELDS)(_reject_nul)
+
+    @field_validator("published_date")
+    @classmethod
+    def validate_published_date(cls, value: str) -> str:
+        """Reject dates the repository cannot store (expected format YYYY-MM-DD)"""
+        date.fromisoformat(value)
+        return value
+
 
 class BookUpdateModel(BaseModel):
-    title: str
-    author: str
-    publisher: str
-    published_date: str
-    page_count: int
-    language: str
+    """Partial update: only the fields sent are changed"""
+
+    title: Optional[str] = None
+    author: Optional[str] = None
+    publisher: Optional[str] = None
+    published_date: Optional[str] = None
+    page_count: Optional[int] = Field(default=None, ge=-PAGE_COUNT_MAX - 1, le=PAGE_COUNT_MAX)
+    language: Optional[str] = None
+
+    _validate_text = field_validator(*TEXT_FIELDS)(_reject_nul)
+
+    @field_validator("published_date")
+    @classmethod
+    def validate_published_date(cls, value: Optional[str]) -> Optional[str]:
+        """Reject dates the repository cannot store (expected format YYYY-MM-DD)"""
+        if value is not None:
+            date.fromisoformat(value)
+        return value
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        if not self.model_fields_set:
+            raise ValueError("at least one field must be provided")
+        nulls = sorted(name for name in self.model_fields_set if getattr(self, name) is None)
+        if nulls:
+            raise ValueError(f"fields cannot be null: {', '.join(nulls)}")
+        return self
+
+
+class BookImportErrorModel(BaseModel):
+    """Rejected row of a bulk import"""
+
+    line: int
+    errors: List[str]
+
+
+class BookImportResultModel(BaseModel):
+    """Outcome of a bulk import"""
+
+    imported: int
+    failed: int
+    errors: List[BookImportErrorModel]
+    errors_truncated: bool = False
 
 
 class BookDetailModel(Book):
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+
+class CacheStatsModel(BaseModel):
+    """Schema for cache hit/miss counters"""
+
+    hits: int
+    misses: int
+    hit_ratio: float = Field(..., ge=0, le=1)
+    ttl: int = Field(..., description="Entry lifetime in seconds")
+
+
+class PrincipalCacheStatsModel(CacheStatsModel):
+    """Schema for the counters of one worker's principal cache"""
+
+    size: int
+    max_size: int
+    evictions: int
+
+
+class PasswordHashingStatsModel(BaseModel):
+    """Schema for the load of one worker's password hashing threads"""
+
+    workers: int
+    max_queue: int
+    in_flight: int = Field(..., description="Hashes running or waiting for a thread")
+    queued: int
+    completed: int
+    rejected: int = Field(..., description="Calls answered with 503 because the queue was full")
+    queue_wait_avg: float = Field(..., description="Seconds a hash waited for a thread")
+    queue_wait_max: float
@@ -1,9 +1,11 @@
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from config.settings import Config
+
 
 class ReviewCreateModel(BaseModel):
     """Schema for creating a new review"""
@@ -67,12 +69,24 @@ class ReviewModel(BaseModel):
     }
 
 
+class ReviewPageModel(BaseModel):
+    """One page of reviews plus the cursor to request the next one"""
+
+    items: List[ReviewModel]
+    next_cursor: Optional[str] = None
+    # only computed on request (include_total), the unfiltered listing reports the planner's
+    # estimate once the table was analyzed, total_estimated tells which one was returned
+    total: Optional[int] = None
+    total_estimated: bool = False
+
+
 class BookRatingStatsModel(BaseModel):
     """Schema for book rating statistics"""
 
     book_uid: uuid.UUID
     total_reviews: int
     average_rating: float
+    rating_histogram: Dict[int, int] = Field(..., description="Number of reviews per rating")
 
     model_config = {
         "json_schema_extra": {
@@ -80,6 +94,20 @@ class BookRatingStatsModel(BaseModel):
                 "book_uid": "123e4567-e89b-12d3-a456-426614174002",
                 "total_reviews": 42,
                 "average_rating": 4.35,
+                "rating_histogram": {"1": 1, "2": 1, "3": 3, "4": 16, "5": 21},
             }
         }
     }
+
+
+class BookRatingStatsBatchRequestModel(BaseModel):
+    """Schema for requesting rating statistics of many books"""
+
+    book_uids: List[uuid.UUID] = Field(..., min_length=1, max_length=Config.BOOKS_BATCH_GET_MAX)
+
+
+class BookRatingStatsBatchModel(BaseModel):
+    """Rating statistics in request order plus the requested uids that are not books"""
+
+    items: List[BookRatingStatsModel]
+    missing: List[uuid.UUID]
@@ -7,6 +7,7 @@ import pytest
 from src.domain.models.users import User
 from src.domain.repositories.user_repository_interface import IUserRepository
 from src.domain.services.password_interface import IPasswordService
+from src.domain.services.rate_limiter_interface import IRateLimiterService
 from src.domain.services.token_interface import ITokenService
 
 
@@ -56,6 +57,13 @@ def mock_password_service():
     return password_service
 
 
+@pytest.fixture
+def mock_rate_limiter():
+    rate_limiter = MagicMock(spec=IRateLimiterService)
+    rate_limiter.claim_once.return_value = True
+    return rate_limiter
+
+
 @pytest.fixture
 def mock_mail(monkeypatch):
     async def fake_send_message(message):
@@ -0,0 +1,179 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.infrastructure.service.auth.blocklist_token_management import BlocklistTokenService
+
+
+class FakePubSub:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.error: Optional[Exception] = None
+
+    async def subscribe(self, channel: str) -> None:
+        self.redis.subscribers.append(self)
+        await self.messages.put({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0):
+        if self.error is not None:
+            raise self.error
+        try:
+            message = await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if ignore_subscribe_messages and message["type"] != "message":
+            return None
+        return message
+
+    async def aclose(self) -> None:
+        self.redis.subscribers.remove(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self) -> list:
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(await getattr(self.redis, name)(*args, **kwargs))
+        return results
+
+
+class FakeRedis:
+    """The few commands of the blocklist, scores are compared as floats"""
+
+    def __init__(self):
+        self.keys: Dict[str, str] = {}
+        self.expiries: Dict[str, float] = {}
+        self.subscribers: List[FakePubSub] = []
+        self.gets = 0
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def get(self, name: str) -> Optional[str]:
+        self.gets += 1
+        return self.keys.get(name)
+
+    async def set(self, name: str, value: str, ex: int) -> bool:
+        self.keys[name] = value
+        return True
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        self.expiries.update(mapping)
+        return len(mapping)
+
+    async def zremrangebyscore(self, key: str, low: str, high: float) -> int:
+        expired = [member for member, score in self.expiries.items() if score <= high]
+        for member in expired:
+            del self.expiries[member]
+        return len(expired)
+
+    async def zrangebyscore(self, key: str, low: float, high: str, withscores: bool = False):
+        return [(member, score) for member, score in self.expiries.items() if score >= low]
+
+    async def publish(self, channel: str, message: str) -> int:
+        for subscriber in self.subscribers:
+            await subscriber.messages.put({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers)
+
+
+async def wait_until(condition, timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+async def start_synced(redis: FakeRedis) -> BlocklistTokenService:
+    service = BlocklistTokenService(redis_client=redis, expiry=3600)
+    service.start_listener()
+    await wait_until(lambda: service._synced)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_unsynced_checks_ask_redis(redis):
+    service = BlocklistTokenService(redis_client=redis, expiry=3600)
+    redis.keys["revoked-jti"] = ""
+
+    assert await service.is_token_blocked("revoked-jti")
+    assert not await service.is_token_blocked("valid-jti")
+    assert redis.gets == 2
+
+
+@pytest.mark.asyncio
+async def test_synced_checks_answer_locally(redis):
+    redis.keys["revoked-jti"] = ""
+    redis.expiries["revoked-jti"] = time.time() + 3600
+    service = await start_synced(redis)
+
+    assert await service.is_token_blocked("revoked-jti")
+    assert not await service.is_token_blocked("valid-jti")
+    assert redis.gets == 0
+    await service.stop_listener()
+
+
+@pytest.mark.asyncio
+async def test_revocation_by_another_worker_arrives_after_the_snapshot(redis):
+    synced_service = await start_synced(redis)
+    other_worker = BlocklistTokenService(redis_client=redis, expiry=3600)
+
+    await other_worker.add_to_blocklist("revoked-elsewhere")
+
+    await wait_until(lambda: "revoked-elsewhere" in synced_service._revoked)
+    assert await synced_service.is_token_blocked("revoked-elsewhere")
+    assert redis.gets == 0
+    await synced_service.stop_listener()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_keeps_revocations_received_while_it_was_read(redis):
+    service = BlocklistTokenService(redis_client=redis, expiry=3600)
+    redis.expiries["in-snapshot"] = time.time() + 3600
+    # arrived as a message, not yet visible in the sorted set the snapshot is read from
+    service._revoked["from-message"] = time.time() + 3600
+    service._revoked["expired"] = time.time() - 1
+
+    await service._load_snapshot()
+
+    assert set(service._revoked) == {"in-snapshot", "from-message"}
+
+
+@pytest.mark.asyncio
+async def test_lost_subscription_falls_back_to_redis(redis):
+    synced_service = await start_synced(redis)
+    synced_service.RETRY_DELAY = 60  # stays out of sync for the rest of the test
+    for subscriber in list(redis.subscribers):
+        subscriber.error = ConnectionError("connection lost")
+        await subscriber.messages.put({"type": "ping", "data": None})
+
+    await wait_until(lambda: not synced_service._synced)
+    redis.keys["revoked-jti"] = ""
+
+    assert await synced_service.is_token_blocked("revoked-jti")
+    assert redis.gets == 1
+    await synced_service.stop_listener()
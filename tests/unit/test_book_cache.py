@@ -0,0 +1,31 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.application.errors import BookCacheUnavailable
+from src.infrastructure.service.cache.book_cache import BookCacheService
+
+
+@pytest.fixture
+def unreachable_redis():
+    redis = MagicMock()
+    redis.hgetall = AsyncMock(side_effect=ConnectionError())
+    redis.delete = AsyncMock(side_effect=ConnectionError())
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_stats_without_redis_raise_unavailable(unreachable_redis):
+    cache = BookCacheService(redis_client=unreachable_redis)
+
+    with pytest.raises(BookCacheUnavailable):
+        await cache.get_stats()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_without_redis_is_logged_only(unreachable_redis):
+    cache = BookCacheService(redis_client=unreachable_redis)
+
+    await cache.invalidate_books(uuid.uuid4())
@@ -0,0 +1,134 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.errors import BookImportBatchRejected, InvalidBookImport
+from src.application.services.book_import import (
+    MAX_LINE_LENGTH,
+    BookImportService,
+    _csv_records,
+    _iter_lines,
+    _ndjson_records,
+)
+from src.domain.repositories.book_repository_interface import IBookRepository
+
+BOOK = {
+    "title": "Dune",
+    "author": "Frank Herbert",
+    "publisher": "Chilton",
+    "published_date": "1965-08-01",
+    "page_count": 412,
+    "language": "en",
+}
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_lines_split_across_chunks_without_bom_and_crlf():
+    lines = await collect(_iter_lines(stream("\ufeffa,b\r\n".encode(), b"c,", b"d\r\ne")))
+
+    assert lines == ["a,b", "c,d", "e"]
+
+
+@pytest.mark.asyncio
+async def test_line_longer_than_the_cap_is_rejected():
+    with pytest.raises(InvalidBookImport):
+        await collect(_iter_lines(stream(b"x" * (MAX_LINE_LENGTH + 1))))
+
+
+@pytest.mark.asyncio
+async def test_invalid_utf8_is_rejected():
+    with pytest.raises(InvalidBookImport):
+        await collect(_iter_lines(stream(b"\xff\xfe\n")))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_reports_bad_json_with_its_line_number():
+    lines = stream(f'{json.dumps(BOOK)}\n\n{{"title": \n'.encode())
+
+    records = await collect(_ndjson_records(_iter_lines(lines)))
+
+    assert records[0] == (1, BOOK)
+    assert records[1][0] == 3
+    assert isinstance(records[1][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_csv_quoted_field_spans_lines():
+    payload = b'title,author\n"Multi\nline",someone\nplain,other\nshort\n'
+
+    records = await collect(_csv_records(_iter_lines(stream(payload))))
+
+    assert records[0] == (2, {"title": "Multi\nline", "author": "someone"})
+    assert records[1] == (4, {"title": "plain", "author": "other"})
+    assert records[2][0] == 5
+    assert isinstance(records[2][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_csv_lone_quote_in_unquoted_field_stays_on_its_line():
+    payload = b'title,author\nThe 5" Floppy,someone\nplain,other\n"open,never closed\n'
+
+    records = await collect(_csv_records(_iter_lines(stream(payload))))
+
+    assert records[0] == (2, {"title": 'The 5" Floppy', "author": "someone"})
+    assert records[1] == (3, {"title": "plain", "author": "other"})
+    assert records[2][0] == 4
+    assert isinstance(records[2][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_csv_lone_quote_is_imported():
+    repository = MagicMock(spec=IBookRepository)
+    repository.bulk_create_books = AsyncMock(side_effect=lambda batch, _: len(batch))
+    rows = [{**BOOK, "title": 'The 5" Floppy'}, BOOK]
+    lines = [",".join(BOOK), *(",".join(str(value) for value in row.values()) for row in rows)]
+    payload = "\n".join(lines).encode()
+
+    result = await BookImportService(repository, batch_size=1).import_books(
+        stream(payload), "csv", "00000000-0000-0000-0000-000000000001"
+    )
+
+    assert (result.imported, result.failed) == (2, 0)
+    assert repository.bulk_create_books.await_args_list[0].args[0][0].title == 'The 5" Floppy'
+
+
+@pytest.mark.asyncio
+async def test_rows_the_database_would_refuse_are_reported_per_row():
+    repository = MagicMock(spec=IBookRepository)
+    repository.bulk_create_books = AsyncMock(side_effect=lambda batch, _: len(batch))
+    rows = [BOOK, {**BOOK, "page_count": 2**31}, {**BOOK, "title": "nul\u0000"}]
+    payload = "\n".join(json.dumps(row) for row in rows).encode()
+
+    result = await BookImportService(repository).import_books(
+        stream(payload), "ndjson", "00000000-0000-0000-0000-000000000001"
+    )
+
+    assert (result.imported, result.failed) == (1, 2)
+    assert [error.line for error in result.errors] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_is_reported_and_the_import_goes_on():
+    repository = MagicMock(spec=IBookRepository)
+    repository.bulk_create_books = AsyncMock(
+        side_effect=[BookImportBatchRejected("value out of range"), 1]
+    )
+    payload = "\n".join(json.dumps(BOOK) for _ in range(3)).encode()
+
+    result = await BookImportService(repository, batch_size=2).import_books(
+        stream(payload), "ndjson", "00000000-0000-0000-0000-000000000001"
+    )
+
+    assert (result.imported, result.failed) == (1, 2)
+    assert result.errors[0].line == 1
+    assert "value out of range" in result.errors[0].errors[0]
@@ -0,0 +1,45 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from src.application.errors import register_all_errors
+from src.domain.models.principal import Principal
+from src.domain.repositories.book_repository_interface import IBookRepository
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.infrastructure.dependencies.authentication import get_current_user
+from src.infrastructure.dependencies.repositories import get_book_repository
+from src.infrastructure.dependencies.services import get_book_cache_service
+from src.presentation.web.routes.books import app as books_router
+
+
+@pytest.fixture
+def missing_book_app():
+    repository = MagicMock(spec=IBookRepository)
+    repository.update_book = AsyncMock(return_value=None)
+    cache = MagicMock(spec=IBookCacheService)
+
+    test_app = FastAPI()
+    register_all_errors(test_app)
+    test_app.include_router(books_router)
+    test_app.dependency_overrides[get_current_user] = lambda: Principal(
+        uid=uuid.uuid4(), email="user@example.com", role="user", is_verified=True
+    )
+    test_app.dependency_overrides[get_book_repository] = lambda: repository
+    test_app.dependency_overrides[get_book_cache_service] = lambda: cache
+    return test_app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers, status_code", [({}, 404), ({"If-Match": "*"}, 412)])
+async def test_patch_missing_book(missing_book_app, headers, status_code):
+    async with AsyncClient(
+        transport=ASGITransport(app=missing_book_app),
+        base_url="http://127.0.0.1",
+        headers={"host": "127.0.0.1"},
+    ) as client:
+        response = await client.patch(f"/{uuid.uuid4()}", json={"title": "New"}, headers=headers)
+
+    assert response.status_code == status_code
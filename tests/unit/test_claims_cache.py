@@ -0,0 +1,58 @@
+import time
+from unittest.mock import patch
+
+import jwt
+
+from src.infrastructure.service.auth.claims_cache import VerifiedClaimsCache
+from src.infrastructure.service.auth.token_management import TokenService
+
+
+def make_service() -> TokenService:
+    return TokenService(
+        secret="claims-cache-test-secret-32-bytes",
+        algorithm="HS256",
+        claims_cache=VerifiedClaimsCache(),
+    )
+
+
+def test_token_is_verified_once():
+    service = make_service()
+    token = service.create_access_token({"email": "user@example.com"})
+
+    with patch("jwt.decode", wraps=jwt.decode) as decode:
+        first = service.decode_token(token)
+        second = service.decode_token(token)
+
+    assert first["user"] == {"email": "user@example.com"}
+    assert second is first
+    assert decode.call_count == 1
+
+
+def test_tampered_token_is_not_served_from_cache():
+    service = make_service()
+    token = service.create_access_token({"email": "user@example.com"})
+    service.decode_token(token)
+
+    header, payload, signature = token.split(".")
+    forged = "AA" if signature[-2:] != "AA" else "BB"
+    tampered = ".".join((header, payload, signature[:-2] + forged))
+
+    assert service.decode_token(tampered) == {}
+
+
+def test_entry_expires_with_the_token():
+    cache = VerifiedClaimsCache(max_size=10)
+    cache.set("token", {"exp": time.time() + 60, "jti": "a"})
+
+    assert cache.get("token")["jti"] == "a"
+    with patch("time.time", return_value=time.time() + 61):
+        assert cache.get("token") is None
+
+
+def test_cache_is_bounded():
+    cache = VerifiedClaimsCache(max_size=2)
+    for n in range(3):
+        cache.set(f"token{n}", {"exp": time.time() + 60})
+
+    assert cache.get("token0") is None
+    assert cache.get("token2") is not None
@@ -0,0 +1,42 @@
+import pytest
+
+from src.presentation.web.etags import etag_matches, if_match_versions, make_etag
+
+
+def test_etag_depends_on_every_part():
+    assert make_etag("a", 1) == make_etag("a", 1)
+    assert make_etag("a", 1) != make_etag("a", 2)
+
+
+def test_versioned_etag_leads_with_version():
+    assert make_etag("a", version=7).startswith('"7.')
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"other"', False),
+        ('"current"', True),
+        ('W/"current"', True),
+        ('"other", "current"', True),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"current"') is expected
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ('"3.0123abcd"', {3}),
+        ('"3"', {3}),
+        ('"3", "5.ff"', {3, 5}),
+        ('W/"3"', set()),
+        ('"abc"', set()),
+        ("*", None),
+    ],
+)
+def test_if_match_versions(header, expected):
+    assert if_match_versions(header) == expected
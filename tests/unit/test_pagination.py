@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.application.errors import InvalidCursor
+from src.infrastructure.repositories.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 10, 29, 12, 0, 0, 123456)
+    uid = uuid.uuid4()
+
+    cursor = encode_cursor((created_at, uid))
+
+    assert decode_cursor(cursor, datetime.fromisoformat, uuid.UUID) == (created_at, uid)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", encode_cursor(("only-one-value",)), ""])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.application.errors import PasswordHashingUnavailable
+from src.infrastructure.service.auth.password_management import PasswordService
+
+
+class BlockingContext:
+    """Stands in for the CryptContext: each hash blocks its thread until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password):
+        self.release.wait(timeout=5)
+        return f"hashed:{password}"
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_off_the_event_loop():
+    service = PasswordService(workers=1, max_queue=0)
+
+    password_hash = await service.hash_password("secret")
+
+    assert await service.verify_password("secret", password_hash)
+    assert not await service.verify_password("other", password_hash)
+    stats = service.get_stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_workers_and_queue_are_full():
+    service = PasswordService(workers=1, max_queue=1)
+    context = service._context = BlockingContext()
+
+    running = asyncio.create_task(service.hash_password("a"))
+    queued = asyncio.create_task(service.hash_password("b"))
+    await asyncio.sleep(0)
+    # the event loop is not blocked by the hash in progress
+    assert service.get_stats()["in_flight"] == 2
+
+    with pytest.raises(PasswordHashingUnavailable):
+        await service.hash_password("c")
+
+    context.release.set()
+    assert await asyncio.gather(running, queued) == ["hashed:a", "hashed:b"]
+    stats = service.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["queue_wait_max"] > 0
+    service.shutdown()
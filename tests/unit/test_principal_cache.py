@@ -0,0 +1,51 @@
+import uuid
+from unittest.mock import patch
+
+from src.domain.models.principal import Principal
+from src.infrastructure.service.cache.principal_cache import PrincipalCacheService
+
+
+def make_user() -> Principal:
+    return Principal(uid=uuid.uuid4(), email="u@example.com", role="user", is_verified=True)
+
+
+def test_hit_after_set_and_miss_after_invalidate():
+    cache = PrincipalCacheService(ttl=30, max_size=10)
+    user = make_user()
+
+    assert cache.get_principal(user.uid) is None
+    cache.set_principal(user)
+    assert cache.get_principal(user.uid) is user
+
+    cache.invalidate_principal(user.uid)
+    assert cache.get_principal(user.uid) is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_entries_expire_after_ttl():
+    cache = PrincipalCacheService(ttl=30, max_size=10)
+    user = make_user()
+
+    with patch("time.monotonic", return_value=1000.0):
+        cache.set_principal(user)
+    with patch("time.monotonic", return_value=1029.0):
+        assert cache.get_principal(user.uid) is user
+    with patch("time.monotonic", return_value=1030.0):
+        assert cache.get_principal(user.uid) is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCacheService(ttl=30, max_size=2)
+    first, second, third = make_user(), make_user(), make_user()
+
+    cache.set_principal(first)
+    cache.set_principal(second)
+    cache.get_principal(first.uid)
+    cache.set_principal(third)
+
+    assert cache.get_principal(second.uid) is None
+    assert cache.get_principal(first.uid) is first
+    assert cache.get_principal(third.uid) is third
+    assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,123 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+from redis.exceptions import ConnectionError
+
+from config.settings import Config
+from main import auth_router, users_router
+from src.application.errors import RateLimitExceeded, register_all_errors
+from src.infrastructure.dependencies.client import get_client_ip
+from src.infrastructure.dependencies.repositories import get_user_repository
+from src.infrastructure.dependencies.services import get_rate_limiter_service
+from src.infrastructure.service.auth.rate_limiter import RateLimiterService, parse_rate
+
+LIMITS = {"login": {"ip": "20/60", "email": "5/60"}}
+
+
+def limiter_with(script, redis=None) -> RateLimiterService:
+    limiter = RateLimiterService(redis_client=redis or MagicMock(), limits=LIMITS)
+    limiter._script = script
+    return limiter
+
+
+def test_parse_rate():
+    assert parse_rate("5/60") == (5, 60.0)
+
+
+@pytest.mark.asyncio
+async def test_checks_all_buckets_of_a_route_in_one_script():
+    script = AsyncMock(return_value="0")
+    limiter = limiter_with(script)
+
+    await limiter.check_rate_limit("login", ip="10.0.0.1", email="User@Example.com", user="x")
+
+    script.assert_awaited_once_with(
+        keys=["rate_limit:login:ip:10.0.0.1", "rate_limit:login:email:user@example.com"],
+        args=[20, 60.0, 5, 60.0],
+    )
+
+
+@pytest.mark.asyncio
+async def test_exhausted_bucket_raises_with_retry_after():
+    limiter = limiter_with(AsyncMock(return_value="2.1"))
+
+    with pytest.raises(RateLimitExceeded) as error:
+        await limiter.check_rate_limit("login", ip="10.0.0.1")
+
+    assert error.value.retry_after == 3
+
+
+@pytest.mark.asyncio
+async def test_fails_open_without_redis():
+    redis = MagicMock()
+    redis.set = AsyncMock(side_effect=ConnectionError())
+    limiter = limiter_with(AsyncMock(side_effect=ConnectionError()), redis)
+
+    await limiter.check_rate_limit("login", ip="10.0.0.1")
+    assert await limiter.claim_once("password_reset", "user@example.com", 300)
+
+
+@pytest.mark.asyncio
+async def test_login_over_budget_is_rejected_before_any_work(mock_user_repo, mock_rate_limiter):
+    test_app = FastAPI()
+    register_all_errors(test_app)
+    test_app.include_router(users_router)
+    mock_rate_limiter.check_rate_limit.side_effect = RateLimitExceeded(retry_after=12)
+
+    test_app.dependency_overrides[get_user_repository] = lambda: mock_user_repo
+    test_app.dependency_overrides[get_rate_limiter_service] = lambda: mock_rate_limiter
+
+    async with AsyncClient(
+        transport=ASGITransport(app=test_app),
+        base_url="http://127.0.0.1",
+        headers={"host": "127.0.0.1"},
+    ) as client:
+        response = await client.post(
+            "/login", json={"email": "user@example.com", "password": "secret"}
+        )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "12"
+    assert response.json()["error_code"] == "rate_limit_exceeded"
+    mock_user_repo.get_user_by_email.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "hops, forwarded_for, client_ip",
+    [
+        (0, "203.0.113.9", "10.0.0.2"),
+        (1, "198.51.100.1, 203.0.113.9", "203.0.113.9"),
+        (2, "198.51.100.1, 203.0.113.9, 10.0.0.1", "203.0.113.9"),
+        (2, "203.0.113.9", "203.0.113.9"),
+        (1, None, "10.0.0.2"),
+    ],
+)
+def test_client_ip_through_trusted_proxies(monkeypatch, hops, forwarded_for, client_ip):
+    monkeypatch.setattr(Config, "TRUSTED_PROXY_HOPS", hops)
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    request = Request({"type": "http", "headers": headers, "client": ("10.0.0.2", 4321)})
+
+    assert get_client_ip(request) == client_ip
+
+
+@pytest.mark.asyncio
+async def test_failed_reset_email_releases_the_claim(monkeypatch, mock_rate_limiter):
+    async def failing_send(message):
+        raise ConnectionRefusedError("SMTP down")
+
+    monkeypatch.setattr("src.infrastructure.mail.mail.send_message", failing_send)
+    test_app = FastAPI()
+    test_app.include_router(auth_router)
+    test_app.dependency_overrides[get_rate_limiter_service] = lambda: mock_rate_limiter
+
+    async with AsyncClient(
+        transport=ASGITransport(app=test_app, raise_app_exceptions=False),
+        base_url="http://127.0.0.1",
+        headers={"host": "127.0.0.1"},
+    ) as client:
+        response = await client.post("/password-reset-request", json={"email": "user@example.com"})
+
+    assert response.status_code == 500
+    mock_rate_limiter.release_claim.assert_awaited_once_with("password_reset", "user@example.com")
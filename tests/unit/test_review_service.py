@@ -0,0 +1,141 @@
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm.evaluator import _EvaluatorCompiler
+from sqlalchemy.sql import Update
+
+from src.application.errors import UnauthorizedReviewAccess
+from src.application.services.reviews import ReviewService
+from src.domain.models.books import Book
+from src.domain.models.reviews import Review
+from src.domain.repositories.book_repository_interface import IBookRepository
+from src.domain.services.book_cache_interface import IBookCacheService
+from src.infrastructure.repositories.reviews_repository import ReviewRepository
+from src.presentation.web.schemas.reviews import ReviewUpdateModel
+
+
+class FakeSession:
+    """Serves one review and applies the rating aggregate UPDATEs to one book in memory"""
+
+    def __init__(self, book: Book, review: Review):
+        self.book = book
+        self.review = review
+        self.commits = 0
+
+    async def exec(self, statement):
+        result = MagicMock()
+        if isinstance(statement, Update):
+            evaluate = _EvaluatorCompiler(Book).process
+            if evaluate(statement.whereclause)(self.book):
+                values = {
+                    column.key: evaluate(value)(self.book)
+                    for column, value in statement._values.items()
+                }
+                for key, value in values.items():
+                    setattr(self.book, key, value)
+            return result
+        result.first.return_value = self.review
+        return result
+
+    def add(self, instance):
+        pass
+
+    async def delete(self, instance):
+        self.review = None
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, instance):
+        pass
+
+
+@pytest.fixture
+def owner_uid():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def session(owner_uid):
+    book = Book(uid=uuid.uuid4(), review_count=2, rating_sum=8, rating_3_count=1, rating_5_count=1)
+    review = Review(
+        uid=uuid.uuid4(),
+        rating=3,
+        review_text="Slow start",
+        user_uid=owner_uid,
+        book_uid=book.uid,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    return FakeSession(book, review)
+
+
+@pytest.fixture
+def review_service(session):
+    return ReviewService(
+        ReviewRepository(session),
+        MagicMock(spec=IBookRepository),
+        MagicMock(spec=IBookCacheService),
+    )
+
+
+def aggregates(book: Book) -> tuple:
+    return book.review_count, book.rating_sum, book.rating_3_count, book.rating_5_count
+
+
+@pytest.mark.asyncio
+async def test_update_review_moves_the_rating_in_the_aggregates(review_service, session, owner_uid):
+    review_uid = str(session.review.uid)
+
+    updated = await review_service.update_review(
+        review_uid=review_uid, user_uid=owner_uid, review_data=ReviewUpdateModel(rating=5)
+    )
+
+    assert updated.rating == 5
+    assert aggregates(session.book) == (2, 10, 0, 2)
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_review_removes_the_rating_from_the_aggregates(
+    review_service, session, owner_uid
+):
+    review_uid = str(session.review.uid)
+
+    assert await review_service.delete_review(review_uid=review_uid, user_uid=owner_uid)
+
+    assert aggregates(session.book) == (1, 5, 0, 1)
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_only_the_author_changes_a_review(review_service, session):
+    review_uid = str(session.review.uid)
+
+    with pytest.raises(UnauthorizedReviewAccess):
+        await review_service.update_review(
+            review_uid=review_uid, user_uid=uuid.uuid4(), review_data=ReviewUpdateModel(rating=5)
+        )
+    with pytest.raises(UnauthorizedReviewAccess):
+        await review_service.delete_review(review_uid=review_uid, user_uid=uuid.uuid4())
+
+    assert aggregates(session.book) == (2, 8, 1, 1)
+    assert session.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_review_update_and_delete_invalidate_the_cached_book(
+    review_service, session, owner_uid
+):
+    review_uid, book_uid = str(session.review.uid), session.book.uid
+
+    await review_service.update_review(
+        review_uid=review_uid, user_uid=owner_uid, review_data=ReviewUpdateModel(rating=4)
+    )
+    review_service.book_cache.invalidate_books.assert_awaited_once_with(book_uid)
+
+    review_service.book_cache.invalidate_books.reset_mock()
+    await review_service.delete_review(review_uid=review_uid, user_uid=owner_uid)
+    review_service.book_cache.invalidate_books.assert_awaited_once_with(book_uid)
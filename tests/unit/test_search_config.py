@@ -0,0 +1,21 @@
+import pytest
+
+from src.domain.models.book_rankings import ranking_scope
+from src.domain.models.books import language_aliases, search_config_for
+
+
+@pytest.mark.parametrize("language", ["en", "EN", "english", "English"])
+def test_spellings_of_a_known_language_share_config_and_aliases(language):
+    assert search_config_for(language) == "english"
+    assert sorted(language_aliases(language)) == ["en", "english"]
+
+
+def test_unknown_language_only_matches_itself():
+    assert search_config_for("XX") == "simple"
+    assert language_aliases("XX") == ["xx"]
+
+
+@pytest.mark.parametrize("language, scope", [("EN", "language:english"), ("Xx", "language:xx")])
+def test_ranking_scope_of_any_spelling_is_the_one_the_refresh_writes(language, scope):
+    assert ranking_scope(language=language) == scope
+    assert ranking_scope(language=language.lower()) == scope
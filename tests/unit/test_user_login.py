@@ -5,17 +5,21 @@ from httpx import AsyncClient, ASGITransport
 from main import users_router
 from src.infrastructure.dependencies.repositories import get_user_repository
 from src.infrastructure.dependencies.services import get_password_service
+from src.infrastructure.dependencies.services import get_rate_limiter_service
 from src.infrastructure.dependencies.services import get_token_service
 
 
 @pytest.mark.asyncio
-async def test_login_success(mock_user_repo, mock_token_service, mock_password_service):
+async def test_login_success(
+    mock_user_repo, mock_token_service, mock_password_service, mock_rate_limiter
+):
     test_app = FastAPI()
     test_app.include_router(users_router)
 
     test_app.dependency_overrides[get_user_repository] = lambda: mock_user_repo
     test_app.dependency_overrides[get_token_service] = lambda: mock_token_service
     test_app.dependency_overrides[get_password_service] = lambda: mock_password_service
+    test_app.dependency_overrides[get_rate_limiter_service] = lambda: mock_rate_limiter
 
     async with AsyncClient(
         transport=ASGITransport(app=test_app),